@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import rest_framework.permissions as rfperms
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
 from rest_framework.request import Request
+from rest_framework.throttling import ScopedRateThrottle
+from rest_framework_api_key.models import APIKey
 
 if TYPE_CHECKING:  # pragma: no cover
     # Python doesn't have great handling of circular imports for type checking
@@ -20,6 +28,88 @@ if TYPE_CHECKING:  # pragma: no cover
     from rest_framework.views import View
 
 
+class VerifiedApiKeyCache:
+    """Cache of API keys which have recently been verified.
+
+    Verifying an API key runs the (deliberately slow) password hasher, which
+    our bots would otherwise pay for on every single request. Instead, a keyed
+    digest of every successfully verified key is remembered together with the
+    ID and hash of the stored key it matched.
+
+    A cached entry only counts when the stored key still has the same ID and
+    hash and has not been revoked, so rotating or revoking a key invalidates
+    it immediately, also when the entries are shared between processes
+    through the Django cache.
+    """
+
+    CACHE_PREFIX = "verified_api_key:"
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """Initialize the cache, holding at most the given number of keys locally."""
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Tuple[int, str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(key: str) -> str:
+        """Compute the digest under which the presented key is cached.
+
+        The digest is keyed with the secret key of the site, so the cached
+        entries can't be used to brute force the API keys themselves.
+        """
+        return hmac.new(settings.SECRET_KEY.encode(), key.encode(), hashlib.sha256).hexdigest()
+
+    def _get(self, digest: str) -> Optional[Tuple[int, str]]:
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None and entry[2] > time.monotonic():
+                self._entries.move_to_end(digest)
+                return entry[0], entry[1]
+            self._entries.pop(digest, None)
+        if settings.API_KEY_CACHE_SHARED:
+            entry = cache.get(self.CACHE_PREFIX + digest)
+            return tuple(entry) if entry is not None else None
+        return None
+
+    def _set(self, digest: str, api_key: APIKey) -> None:
+        timeout = settings.API_KEY_CACHE_TIMEOUT
+        with self._lock:
+            self._entries[digest] = (api_key.pk, api_key.hashed_key, time.monotonic() + timeout)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        if settings.API_KEY_CACHE_SHARED:
+            cache.set(self.CACHE_PREFIX + digest, (api_key.pk, api_key.hashed_key), timeout)
+
+    def is_valid(self, api_key: APIKey, key: str) -> bool:
+        """Check whether the presented key is valid for the given stored key.
+
+        :param api_key: the stored API key of the user making the request
+        :param key: the key presented in the request
+        :return: whether the key is valid, only hashing it when not cached
+        """
+        if api_key.revoked:
+            return False
+        if settings.API_KEY_CACHE_TIMEOUT <= 0:
+            return api_key.is_valid(key)
+
+        digest = self.digest(key)
+        if self._get(digest) == (api_key.pk, api_key.hashed_key):
+            return True
+        if api_key.is_valid(key):
+            self._set(digest, api_key)
+            return True
+        return False
+
+    def clear(self) -> None:
+        """Remove all entries from the local cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+verified_api_keys = VerifiedApiKeyCache()
+
+
 class AdminApiKeyCustomCheck(rfperms.BasePermission):
     """Permission check which determines whether the user is a valid admin."""
 
@@ -42,17 +132,68 @@ class AdminApiKeyCustomCheck(rfperms.BasePermission):
                 request_key = request.META.get(
                     "Authorization", request.headers.get("Authorization", "").split()
                 )
+                # When authenticating with a bearer token, the Authorization header
+                # is taken, so the key is sent in the custom header instead.
+                if request.META.get(settings.API_KEY_CUSTOM_HEADER):
+                    request_key = ["Api-Key", request.META[settings.API_KEY_CUSTOM_HEADER]]
                 if len(request_key) >= 2:
                     return all(
                         [
                             request_key[0] == "Api-Key",
-                            request.user.api_key.is_valid(request_key[1]),
+                            verified_api_keys.is_valid(request.user.api_key, request_key[1]),
                             request.user.is_grafeas_staff or request.user.is_staff,
                         ]
                     )
         return False
 
 
+class ApiKeyCustomHeaderCheck(rfperms.BasePermission):
+    """Permission check which requires a valid API key in the custom header.
+
+    Unlike AdminApiKeyCustomCheck, this doesn't need to know the user, so it
+    can guard views which are used before the user has authenticated.
+    """
+
+    message = "Sorry, this resource can only be accessed with a valid API key."
+
+    def has_permission(self, request: Request, view: View) -> bool:
+        """Check whether the request carries a valid API key.
+
+        :param request: the request which is evaluated
+        :param view: the view to which the request is sent
+        :return: whether the API key in the custom header is valid
+        """
+        if settings.OVERRIDE_API_AUTH:
+            return True
+
+        key = request.META.get(settings.API_KEY_CUSTOM_HEADER, "")
+        prefix, _, _ = key.partition(".")
+        if not prefix:
+            return False
+        api_key = APIKey.objects.filter(prefix=prefix).first()
+        return api_key is not None and verified_api_keys.is_valid(api_key, key)
+
+
+class FailedLoginThrottle(ScopedRateThrottle):
+    """Throttle which only counts the requests that the view reports as failed.
+
+    Users who log in successfully are never held up, while guessing passwords
+    is limited to the rate of the `throttle_scope` of the view.
+    """
+
+    def throttle_success(self) -> bool:
+        """Let the request through without counting it, see `record_failure`."""
+        return True
+
+    def record_failure(self) -> None:
+        """Count the request towards the rate limit."""
+        if getattr(self, "key", None) is None:
+            # The request wasn't checked, e.g. because no rate is configured
+            return
+        self.history.insert(0, self.now)
+        self.cache.set(self.key, self.history, self.duration)
+
+
 class BlossomApiPermission(rfperms.BasePermission):
     """Combined check of either the AdminApiKeyCustomCheck or the default Admin Check."""
 
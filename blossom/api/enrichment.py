@@ -0,0 +1,103 @@
+"""Fill in the details of submissions that we didn't get when they were created.
+
+Submissions are not always created with their title and NSFW flag, for example
+the ones from before we stored them. These details are fetched from Reddit in
+the background, so nothing that is shown to volunteers has to wait for Reddit.
+The posts are looked up in batches through Reddit's info endpoint, which
+accepts up to 100 posts per request.
+"""
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+
+from blossom.api.models import Submission
+from blossom.reddit import REDDIT
+from blossom.utils.workers import send_to_worker
+
+log = logging.getLogger(__name__)
+
+# The maximum number of posts Reddit returns from a single info request.
+INFO_BATCH_SIZE = 100
+
+# The submissions which are waiting to be enriched by the background worker.
+_pending: Set[int] = set()
+_pending_lock = threading.Lock()
+
+
+def missing_details() -> QuerySet:
+    """Get the submissions which don't have a title and can be looked up on Reddit."""
+    return Submission.objects.filter(Q(title=None) | Q(title=""), url__isnull=False)
+
+
+def get_fullname(submission: Submission) -> Optional[str]:
+    """Get the fullname of the Reddit post of the submission, if it has one."""
+    if not submission.url:
+        return None
+    host = urlparse(submission.url).netloc
+    if host not in ("reddit.com", "redd.it") and not host.endswith(".reddit.com"):
+        return None
+
+    from praw.exceptions import InvalidURL
+    from praw.models import Submission as RedditSubmission
+
+    try:
+        return f"t3_{RedditSubmission.id_from_url(submission.url)}"
+    except InvalidURL:
+        return None
+
+
+def fetch_missing_details(submissions: Iterable[Submission]) -> int:
+    """Fetch the titles and NSFW flags of the submissions from Reddit.
+
+    Submissions of posts which have been deleted or which are not on Reddit
+    at all are left untouched.
+
+    :param submissions: the submissions to fetch the details for
+    :returns: the number of submissions that have been updated
+    """
+    by_fullname: Dict[str, List[Submission]] = {}
+    for submission in submissions:
+        if fullname := get_fullname(submission):
+            by_fullname.setdefault(fullname, []).append(submission)
+
+    fullnames = list(by_fullname)
+    updated = 0
+    for start in range(0, len(fullnames), INFO_BATCH_SIZE):
+        for post in REDDIT.info(fullnames=fullnames[start : start + INFO_BATCH_SIZE]):
+            for submission in by_fullname.get(post.fullname, []):
+                submission.title = post.title
+                submission.nsfw = post.over_18
+                submission.save(skip_extras=True, update_fields=["title", "nsfw"])
+                updated += 1
+    return updated
+
+
+def enrich_in_background(submission_ids: Iterable[int]) -> None:
+    """Fetch the missing details of the given submissions in the background.
+
+    The submissions are collected until the background worker gets to them,
+    so submissions which are queued in quick succession share their requests
+    to Reddit.
+    """
+    submission_ids = set(submission_ids)
+    if not settings.ENABLE_REDDIT or not submission_ids:
+        return
+    with _pending_lock:
+        # The worker has already been asked to process the pending submissions
+        scheduled = bool(_pending)
+        _pending.update(submission_ids)
+    if not scheduled:
+        _enrich_pending()
+
+
+@send_to_worker
+def _enrich_pending() -> None:
+    with _pending_lock:
+        submission_ids = list(_pending)
+        _pending.clear()
+    updated = fetch_missing_details(missing_details().filter(id__in=submission_ids))
+    log.info(f"Fetched the details of {updated} of {len(submission_ids)} submissions.")
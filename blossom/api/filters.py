@@ -6,7 +6,7 @@ from rest_framework.views import View
 
 class CaseInsensitiveUsernameFilter(BaseFilterBackend):
     def filter_queryset(self, request: Request, queryset: QuerySet, view: View) -> QuerySet:
-        """Filter by username using the __iexact query method."""
+        """Filter by the lowercase username, so the functional index can be used."""
         if username := request.query_params.get("username"):
-            queryset = queryset.filter(username__iexact=username)
+            queryset = queryset.filter(username__lower=username.lower())
         return queryset
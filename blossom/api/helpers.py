@@ -1,13 +1,19 @@
+import hashlib
 import threading
 from functools import wraps
-from typing import Any, Callable, Dict, Set, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Union
 
 import pytz
+from django.http import Http404, HttpResponse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from rest_framework import serializers
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from blossom.authentication.models import BlossomUser
+
 
 def _retrieve_keys(data: Dict, keys: Set, name: str) -> Dict[str, str]:
     """Retrieve all values from the data with the given keys, creating key-value pairs.
@@ -62,6 +68,69 @@ def validate_request(query_params: Set = None, data_params: Set = None) -> Calla
     return decorator
 
 
+def get_user_or_404(username: str) -> BlossomUser:
+    """Get the user with the given username, case insensitively.
+
+    The lookup goes through the functional index on the lowercase username.
+
+    :param username: the username of the user to retrieve
+    :return: the user with the given username
+    :raise Http404: when there is no user with the given username
+    """
+    try:
+        return BlossomUser.objects.get(username=username)
+    except BlossomUser.DoesNotExist:
+        raise Http404("No BlossomUser matches the given query.")
+
+
+def make_etag(*parts: object) -> str:
+    """Build a quoted ETag out of the given parts.
+
+    The parts should be cheap to retrieve values that change whenever the
+    represented resource changes, like update times, counts or maximum IDs.
+    """
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode())
+    return quote_etag(digest.hexdigest())
+
+
+def conditional_etag(etag_func: Callable[..., Optional[str]]) -> Callable:
+    """Answer conditional GET requests of the inner method with a 304 if possible.
+
+    This decorator is to be used ONLY around a method which has access to
+    a Request object as its first positional argument, like `validate_request`.
+
+    The `etag_func` is called with the same arguments as the decorated method
+    and should return the ETag of the resource (see `make_etag`), or None if
+    no ETag can be determined. When the ETag matches the `If-None-Match` header
+    of the request, the method is skipped entirely and an empty 304 response is
+    returned instead. Otherwise, the ETag is added to the successful response.
+
+    :param etag_func: the function which computes the ETag of the resource.
+    :return: the decorator which wraps this function.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(
+            self: object, request: Request, *args: object, **kwargs: object
+        ) -> Union[Response, HttpResponse]:
+            etag = etag_func(self, request, *args, **kwargs)
+            if etag is None:
+                return function(self, request, *args, **kwargs)
+
+            if not_modified := get_conditional_response(request, etag=etag):
+                return not_modified
+
+            response = function(self, request, *args, **kwargs)
+            if response.status_code == 200 and not response.has_header("ETag"):
+                response["ETag"] = etag
+            return response
+
+        return wrapper
+
+    return decorator
+
+
 def get_time_since_open(
     days: bool = False,
 ) -> Tuple[Union[int, float], Union[int, float]]:
@@ -0,0 +1,178 @@
+"""Keep the images which are proxied for OpenSeaDragon on disk.
+
+Every volunteer who opens a submission makes OpenSeaDragon load its image
+through our proxy, so the same image is requested from the upstream host again
+and again. The images are written to disk while they are streamed to the first
+volunteer, after which they are served from there. When the cache grows larger
+than its limit, the images which haven't been used for the longest time are
+removed, as are the partial downloads which were left behind by processes that
+died while writing them.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+
+log = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# Partial downloads which haven't been written to for this many seconds are
+# assumed to have been abandoned.
+STALE_TEMP_AGE = 60 * 60
+
+
+class CachedImage(NamedTuple):
+    path: Path
+    size: int
+    content_type: str
+    etag: str
+
+
+class ImageCache:
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        """Create the cache, which keeps at most the given number of bytes in the directory."""
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _get_paths(self, key: str) -> Tuple[Path, Path]:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / digest, self.directory / f"{digest}.json"
+
+    def get(self, key: str) -> Optional[CachedImage]:
+        """Get the image with the given key, marking it as recently used."""
+        path, meta_path = self._get_paths(key)
+        try:
+            meta = json.loads(meta_path.read_text())
+            # The modification time tells which images have been used recently
+            os.utime(path)
+            size = path.stat().st_size
+        except (OSError, ValueError):
+            return None
+        return CachedImage(path, size, meta["content_type"], meta["etag"])
+
+    def store(self, key: str, chunks: Iterable[bytes], content_type: str) -> Iterator[bytes]:
+        """Write the image to the cache while passing its chunks on.
+
+        The image is only added to the cache once all chunks have been
+        written, so an interrupted download never ends up in the cache.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path, meta_path = self._get_paths(key)
+        digest = hashlib.md5()
+        fd, temp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                for chunk in chunks:
+                    file.write(chunk)
+                    digest.update(chunk)
+                    yield chunk
+            os.replace(temp_name, path)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+
+        meta = {"content_type": content_type, "etag": f'"{digest.hexdigest()}"'}
+        fd, temp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as file:
+            json.dump(meta, file)
+        os.replace(temp_name, meta_path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used images until the cache is within its limit."""
+        images = []
+        stale = time.time() - STALE_TEMP_AGE
+        for entry in os.scandir(self.directory):
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+                if "." not in entry.name:
+                    images.append((stat.st_mtime, stat.st_size, entry.name))
+                elif entry.name.endswith(".tmp") and stat.st_mtime < stale:
+                    # Left behind by a process which died during the download
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                # Moved into place or removed by another process in the meantime
+                pass
+        total = sum(size for _, size, _ in images)
+        for _, size, name in sorted(images):
+            if total <= self.max_bytes:
+                break
+            for path in (self.directory / name, self.directory / f"{name}.json"):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    # Another process got to it first
+                    pass
+            total -= size
+        log.debug(f"The image cache holds {total} bytes.")
+
+
+def get_image_cache() -> ImageCache:
+    """Get the image cache as configured in the settings."""
+    return ImageCache(Path(settings.IMAGE_CACHE_DIR), settings.IMAGE_CACHE_MAX_BYTES)
+
+
+def read_range(path: Path, start: int, length: int) -> Iterator[bytes]:
+    """Read the given part of the file in chunks."""
+    with open(path, "rb") as file:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def serve_image(request: HttpRequest, image: CachedImage) -> HttpResponse:
+    """Serve the cached image, or the part of it that is asked for with `Range`."""
+    headers = {
+        "ETag": image.etag,
+        "Cache-Control": f"public, max-age={settings.IMAGE_CACHE_MAX_AGE}",
+        "Accept-Ranges": "bytes",
+    }
+    conditional = get_conditional_response(request, etag=image.etag)
+    if conditional is not None:
+        for header, value in headers.items():
+            conditional[header] = value
+        return conditional
+
+    start, end = 0, image.size - 1
+    status = 200
+    if match := RANGE_PATTERN.match(request.headers.get("Range", "")):
+        first, last = match.groups()
+        if first:
+            start, end = int(first), min(int(last), end) if last else end
+        elif last:
+            # A suffix range, i.e. the last bytes of the image
+            start = max(image.size - int(last), 0)
+        if not (first or last) or start > end:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{image.size}"
+            return response
+        status = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{image.size}"
+
+    response = StreamingHttpResponse(
+        read_range(image.path, start, end - start + 1),
+        status=status,
+        content_type=image.content_type,
+    )
+    response["Content-Length"] = str(end - start + 1)
+    for header, value in headers.items():
+        response[header] = value
+    return response
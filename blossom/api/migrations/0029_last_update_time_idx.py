@@ -0,0 +1,21 @@
+# Generated by Django 3.2 on 2026-10-19 10:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0028_submission_feed"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(fields=["last_update_time"], name="submission_update_time_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="transcription",
+            index=models.Index(fields=["last_update_time"], name="transcription_update_time_idx"),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 3.2 on 2026-10-19 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0029_last_update_time_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="transcription",
+            name="ocr_lease_expiry",
+            field=models.DateTimeField(blank=True, default=None, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="transcription",
+            index=models.Index(
+                condition=models.Q(original_id__isnull=True),
+                fields=["author", "id"],
+                name="transcription_pending_ocr_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 3.2 on 2026-10-19 10:53
+
+from django.apps.registry import Apps
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+
+
+def set_queue_state(apps: Apps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """Derive the queue state of the existing submissions, like `get_queue_state`."""
+    Submission = apps.get_model("api", "Submission")
+    # The states are assigned from the lowest to the highest precedence.
+    Submission.objects.filter(claimed_by__isnull=False).update(queue_state="claimed")
+    Submission.objects.filter(removed_from_queue=True).update(queue_state="removed")
+    Submission.objects.filter(completed_by__isnull=False).update(queue_state="completed")
+    Submission.objects.filter(archived=True).update(queue_state="archived")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0030_transcription_ocr_lease"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="submission",
+            name="queue_state",
+            field=models.CharField(
+                choices=[
+                    ("unclaimed", "Unclaimed"),
+                    ("claimed", "Claimed"),
+                    ("completed", "Completed"),
+                    ("removed", "Removed"),
+                    ("archived", "Archived"),
+                ],
+                default="unclaimed",
+                max_length=20,
+            ),
+        ),
+        migrations.RunPython(set_queue_state, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(
+                condition=models.Q(queue_state="unclaimed"),
+                fields=["source", "create_time"],
+                name="submission_unclaimed_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(
+                condition=models.Q(queue_state="claimed"),
+                fields=["source", "claim_time"],
+                name="submission_claimed_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(
+                condition=models.Q(queue_state="completed"),
+                fields=["source", "complete_time"],
+                name="submission_completed_idx",
+            ),
+        ),
+    ]
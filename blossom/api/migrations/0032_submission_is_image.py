@@ -0,0 +1,66 @@
+# Generated by Django 3.2 on 2026-10-19 11:05
+
+import random
+from urllib.parse import urlparse
+
+from django.apps.registry import Apps
+from django.conf import settings
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+
+import blossom.api.models
+
+
+def set_is_image_and_sample_key(apps: Apps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """Derive `is_image` from the content url and give every submission its own key."""
+    Submission = apps.get_model("api", "Submission")
+    image_ids = [
+        submission_id
+        for submission_id, content_url in Submission.objects.exclude(content_url=None)
+        .values_list("id", "content_url")
+        .iterator()
+        if urlparse(content_url).netloc in settings.IMAGE_DOMAINS
+    ]
+    for start in range(0, len(image_ids), 1000):
+        Submission.objects.filter(id__in=image_ids[start : start + 1000]).update(is_image=True)
+    # The default is only evaluated once for the existing rows. The keys are
+    # drawn in Python because the database random functions don't agree on
+    # their range; SQLite returns a 64-bit integer instead of [0, 1).
+    submission_ids = list(Submission.objects.values_list("id", flat=True))
+    for start in range(0, len(submission_ids), 1000):
+        Submission.objects.bulk_update(
+            [
+                Submission(id=submission_id, sample_key=random.random())
+                for submission_id in submission_ids[start : start + 1000]
+            ],
+            ["sample_key"],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0031_submission_queue_state"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="submission",
+            name="is_image",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="submission",
+            name="sample_key",
+            field=models.FloatField(default=blossom.api.models.create_sample_key),
+        ),
+        migrations.RunPython(set_is_image_and_sample_key, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(
+                condition=models.Q(("is_image", True), ("queue_state", "unclaimed")),
+                fields=["sample_key"],
+                name="submission_sample_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 3.2 on 2026-10-19 12:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0032_submission_is_image"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="submission",
+            name="change_number",
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="transcription",
+            name="change_number",
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(fields=["change_number", "id"], name="submission_change_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="transcription",
+            index=models.Index(fields=["change_number", "id"], name="transcription_change_idx"),
+        ),
+    ]
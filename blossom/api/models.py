@@ -1,18 +1,20 @@
 """Specification of classes used within the API."""
 import logging
+import random
 import uuid
-from typing import Any, Optional
+from typing import Any, Optional, Type
 from urllib.parse import urlparse
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import models
-from django.db.models import QuerySet
+from django.db.models import Case, Q, QuerySet, Value, When
 from django.utils import timezone
 
 from blossom.api.slack import client
 from blossom.ocr.errors import OCRError
 from blossom.ocr.helpers import escape_reddit_links, process_image, replace_shortlinks
+from blossom.utils import notifications
 
 
 def create_id() -> uuid.UUID:  # pragma: no cover
@@ -29,6 +31,43 @@ def create_id() -> uuid.UUID:  # pragma: no cover
     return uuid.uuid4()
 
 
+def create_sample_key() -> float:
+    """Create the random key by which submissions are sampled.
+
+    :return: a random number in the range [0, 1)
+    """
+    return random.random()
+
+
+class ChangeNumber(models.Expression):
+    """The number of a change to a row, assigned by the database when it's written.
+
+    The changes feed orders the rows by this number, so it has to increase in
+    the order in which the changes become visible, which the clock of the
+    saving process doesn't guarantee. On Postgres, it's the ID of the writing
+    transaction: the feed only returns the changes of transactions older than
+    any that are still in progress, so a change can't appear behind a consumer
+    that has already passed it. Anywhere else (SQLite), only one transaction
+    can write at a time, so the changes are simply numbered in order.
+    """
+
+    output_field = models.BigIntegerField()
+
+    def __init__(self, model: Type[models.Model]) -> None:
+        """Create the change number for a row of the given model."""
+        super().__init__()
+        self.table = model._meta.db_table
+
+    def as_sql(self, compiler: Any, connection: Any) -> tuple:
+        """Follow the last change to the table."""
+        table = connection.ops.quote_name(self.table)
+        return f"(SELECT COALESCE(MAX(change_number), 0) + 1 FROM {table})", []
+
+    def as_postgresql(self, compiler: Any, connection: Any) -> tuple:
+        """Use the ID of the writing transaction."""
+        return "txid_current()", []
+
+
 class Source(models.Model):
     """The source that the particular Submission or Transcription came from.
 
@@ -70,6 +109,18 @@ class Submission(models.Model):
     common example of this phenomenon.
     """
 
+    class QueueState(models.TextChoices):
+        # The default. The submission can be claimed by a volunteer.
+        UNCLAIMED = "unclaimed"
+        # The submission is claimed by a volunteer, but not completed yet.
+        CLAIMED = "claimed"
+        # The submission is completed, but not archived yet.
+        COMPLETED = "completed"
+        # The submission is removed from the queue before it was completed.
+        REMOVED = "removed"
+        # The submission is archived and hence no longer part of the queue.
+        ARCHIVED = "archived"
+
     class Meta:
         indexes = [
             # For finding posts
@@ -82,6 +133,33 @@ class Submission(models.Model):
             models.Index(fields=["complete_time"], name="submission_complete_time_idx"),
             # For identifying old posts
             models.Index(fields=["create_time"], name="submission_create_time_idx"),
+            # For detecting changes (ETags)
+            models.Index(fields=["last_update_time"], name="submission_update_time_idx"),
+            # For the changes feed
+            models.Index(fields=["change_number", "id"], name="submission_change_idx"),
+            # For listing the live parts of the queue (unclaimed, in progress and
+            # unarchived posts) without going through the archived history
+            models.Index(
+                fields=["source", "create_time"],
+                name="submission_unclaimed_idx",
+                condition=Q(queue_state="unclaimed"),
+            ),
+            models.Index(
+                fields=["source", "claim_time"],
+                name="submission_claimed_idx",
+                condition=Q(queue_state="claimed"),
+            ),
+            models.Index(
+                fields=["source", "complete_time"],
+                name="submission_completed_idx",
+                condition=Q(queue_state="completed"),
+            ),
+            # For sampling random unclaimed images to choose from on the website
+            models.Index(
+                fields=["sample_key"],
+                name="submission_sample_idx",
+                condition=Q(queue_state="unclaimed", is_image=True),
+            ),
         ]
 
     objects: QuerySet
@@ -97,6 +175,8 @@ class Submission(models.Model):
 
     # The time the Submission was last updated.
     last_update_time = models.DateTimeField(default=timezone.now)
+    # The number of the last change to the Submission, see `ChangeNumber`.
+    change_number = models.BigIntegerField(default=0)
 
     # The ID of the Submission in the old Redis database.
     # This field is only used for handling the redis changeover and
@@ -146,6 +226,14 @@ class Submission(models.Model):
     # If this is an image, it is sent to ocr.space for automatic transcription.
     content_url = models.URLField(null=True, blank=True, max_length=2000)
 
+    # Whether the content is hosted on an image host we recognize, derived from
+    # the content url whenever the submission is saved.
+    is_image = models.BooleanField(default=False)
+
+    # A random number which is assigned once, so a random sample of submissions
+    # can be taken by the database through the index on it.
+    sample_key = models.FloatField(default=create_sample_key)
+
     # If this is from Reddit, then it mirrors the status on Reddit's side that we get
     # from PRAW. Otherwise it can be set manually to mark something that shouldn't be
     # shown without a cover.
@@ -158,6 +246,14 @@ class Submission(models.Model):
     # specifically.
     removed_from_queue = models.BooleanField(default=False)
 
+    # The state of the submission in the queue, derived from the claim, completion,
+    # removal and archival of the submission whenever it is saved. Transitions that
+    # don't go through `save` (like the claim and done endpoints) must update the
+    # state themselves.
+    queue_state = models.CharField(
+        max_length=20, choices=QueueState.choices, default=QueueState.UNCLAIMED
+    )
+
     # Whether the submission has been approved by the moderators.
     # If this is set to True, no new reports should be generated for this submission.
     approved = models.BooleanField(default=False)
@@ -189,14 +285,17 @@ class Submission(models.Model):
 
         :return: whether the Submission has an OCR transcription
         """
-        return (
-            False
-            if self.cannot_ocr
-            else bool(Transcription.objects.filter(submission=self, author__username="transcribot"))
-        )
-
-    @property
-    def is_image(self) -> bool:
+        if self.cannot_ocr:
+            return False
+        if "transcription_set" in getattr(self, "_prefetched_objects_cache", {}):
+            # Don't query every submission separately when serializing many of them
+            return any(
+                transcription.author.username == "transcribot"
+                for transcription in self.transcription_set.all()
+            )
+        return bool(Transcription.objects.filter(submission=self, author__username="transcribot"))
+
+    def content_url_is_image(self) -> bool:
         """Check whether the content url is from an image host we recognize."""
         return urlparse(self.content_url).netloc in settings.IMAGE_DOMAINS
 
@@ -257,17 +356,76 @@ class Submission(models.Model):
 
         If `skip_extras` is set, then it should bypass everything that is not
         simply "save the object to the db".
+
+        New submissions wake the requests that are waiting for new work.
         """
         if not self.feed:
             self.feed = self.get_subreddit_name()
 
+        self.last_update_time = timezone.now()
+        self.change_number = ChangeNumber(Submission)
+        self.queue_state = self.get_queue_state()
+        self.is_image = self.content_url_is_image()
+        if (update_fields := kwargs.get("update_fields")) is not None:
+            kwargs["update_fields"] = {
+                *update_fields,
+                "last_update_time",
+                "change_number",
+                "queue_state",
+                "is_image",
+            }
+
+        created = self._state.adding
         super(Submission, self).save(*args, **kwargs)
+        # Only the database knows the number, so it's loaded when it's needed
+        del self.change_number
+        if created:
+            notifications.publish("submission")
 
         if not skip_extras:
             if self.is_image and not self.has_ocr_transcription and not self.cannot_ocr:
                 # TODO: This is a great candidate for a basic queue system
                 self.generate_ocr_transcription()
 
+    def get_queue_state(self) -> "Submission.QueueState":
+        """Determine the state of the submission in the queue from its fields."""
+        if self.archived:
+            return self.QueueState.ARCHIVED
+        if self.completed_by_id is not None:
+            return self.QueueState.COMPLETED
+        if self.removed_from_queue:
+            return self.QueueState.REMOVED
+        if self.claimed_by_id is not None:
+            return self.QueueState.CLAIMED
+        return self.QueueState.UNCLAIMED
+
+    @staticmethod
+    def get_queue_state_expression(claimed: bool = False, completed: bool = False) -> Case:
+        """Determine the state of the submission in the queue from its row, in SQL.
+
+        This is what `get_queue_state` does, for the conditional updates: they
+        can't overwrite a state that was changed in the meantime, like when the
+        submission was archived concurrently. As the expression is computed from
+        the row before the update, the claim or completion that the update
+        makes has to be passed in.
+        """
+        whens = [When(archived=True, then=Value(Submission.QueueState.ARCHIVED))]
+        if completed:
+            default = Submission.QueueState.COMPLETED
+        else:
+            whens += [
+                When(completed_by__isnull=False, then=Value(Submission.QueueState.COMPLETED)),
+                When(removed_from_queue=True, then=Value(Submission.QueueState.REMOVED)),
+            ]
+            if claimed:
+                default = Submission.QueueState.CLAIMED
+            else:
+                whens.append(
+                    When(claimed_by__isnull=False, then=Value(Submission.QueueState.CLAIMED))
+                )
+                default = Submission.QueueState.UNCLAIMED
+        return Case(*whens, default=Value(default), output_field=models.CharField())
+
     def get_subreddit_name(self) -> str:
         """Return the subreddit name.
 
@@ -287,6 +445,16 @@ class Transcription(models.Model):
             models.Index(fields=["submission"], name="transcription_submission_idx"),
             models.Index(fields=["original_id"], name="transcription_original_id_idx"),
             models.Index(fields=["url"], name="transcription_url_idx"),
+            # For detecting changes (ETags)
+            models.Index(fields=["last_update_time"], name="transcription_update_time_idx"),
+            # For the changes feed
+            models.Index(fields=["change_number", "id"], name="transcription_change_idx"),
+            # For leasing the OCR transcriptions which still have to be posted
+            models.Index(
+                fields=["author", "id"],
+                name="transcription_pending_ocr_idx",
+                condition=Q(original_id__isnull=True),
+            ),
         ]
 
     objects: QuerySet
@@ -301,6 +469,8 @@ class Transcription(models.Model):
     create_time = models.DateTimeField(default=timezone.now)
     # The time the Transcription was last updated.
     last_update_time = models.DateTimeField(default=timezone.now)
+    # The number of the last change to the Transcription, see `ChangeNumber`.
+    change_number = models.BigIntegerField(default=0)
 
     # The ID of the Transcription on the "source" platform.
     # Note that this field is not used as a primary key; an underlying
@@ -334,9 +504,31 @@ class Transcription(models.Model):
     # through workarounds.
     removed_from_reddit = models.BooleanField(default=False)
 
+    # Until when a transcribot worker has leased this transcription to post it.
+    # While the lease has not expired, the transcription is not handed out to
+    # other workers. Only used for transcriptions that are not posted yet.
+    ocr_lease_expiry = models.DateTimeField(default=None, null=True, blank=True)
+
     def __str__(self) -> str:  # pragma: no cover
         return f"{self.submission} by {self.author.username}"
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Save the transcription object, keeping track of the update time.
+
+        New transcriptions wake the requests waiting for the transcribot queue.
+        """
+        self.last_update_time = timezone.now()
+        self.change_number = ChangeNumber(Transcription)
+        if (update_fields := kwargs.get("update_fields")) is not None:
+            kwargs["update_fields"] = {*update_fields, "last_update_time", "change_number"}
+
+        created = self._state.adding
+        super().save(*args, **kwargs)
+        # Only the database knows the number, so it's loaded when it's needed
+        del self.change_number
+        if created:
+            notifications.publish("transcription")
+
 
 class TranscriptionCheck(models.Model):
     class Meta:
@@ -464,16 +656,32 @@ class AccountMigration(models.Model):
         transcriptions = Transcription.objects.filter(
             submission__in=existing_submissions, author=self.old_user
         )
-        transcriptions.update(author=self.new_user)
-        existing_submissions.update(claimed_by=self.new_user, completed_by=self.new_user)
+        now = timezone.now()
+        transcriptions.update(
+            author=self.new_user, last_update_time=now, change_number=ChangeNumber(Transcription)
+        )
+        existing_submissions.update(
+            claimed_by=self.new_user,
+            completed_by=self.new_user,
+            last_update_time=now,
+            change_number=ChangeNumber(Submission),
+        )
 
     def revert(self) -> None:
         """Undo the account migration."""
         transcriptions = Transcription.objects.filter(
             submission__in=self.affected_submissions.all(), author=self.new_user
         )
-        transcriptions.update(author=self.old_user)
-        self.affected_submissions.update(claimed_by=self.old_user, completed_by=self.old_user)
+        now = timezone.now()
+        transcriptions.update(
+            author=self.old_user, last_update_time=now, change_number=ChangeNumber(Transcription)
+        )
+        self.affected_submissions.update(
+            claimed_by=self.old_user,
+            completed_by=self.old_user,
+            last_update_time=now,
+            change_number=ChangeNumber(Submission),
+        )
 
 
 def extract_subreddit_from_url(url: str) -> Optional[str]:
@@ -0,0 +1,87 @@
+"""Renderers and parsers used for the JSON bodies of the API.
+
+These are drop-in replacements for the default JSON renderer and parser of DRF
+that use orjson when it is installed. orjson is an optional dependency (install
+the `speedups` extra); without it, both classes fall back to the stdlib `json`
+based implementation of DRF, so the output stays the same either way.
+"""
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# DRF always escapes these two characters so that the output is a strict
+# subset of JavaScript; orjson doesn't, so we do it ourselves.
+# See: https://gist.github.com/damncabbage/623b879af56f850a6ddc
+LINE_SEPARATOR = ("\u2028".encode(), b"\\u2028")
+PARAGRAPH_SEPARATOR = ("\u2029".encode(), b"\\u2029")
+
+
+def _default(obj: Any) -> Any:  # noqa: ANN401
+    """Serialize the objects that orjson doesn't know about.
+
+    orjson handles datetimes, dates, UUIDs and dataclasses natively; anything
+    else (decimals, lazy translation strings, querysets, ...) is delegated to
+    the encoder DRF uses for its own JSON renderer.
+    """
+    return JSONEncoder().default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """Render the API responses with orjson, if it is available."""
+
+    def render(
+        self,
+        data: Any,  # noqa: ANN401
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[Dict] = None,
+    ) -> bytes:
+        """Render the data into a JSON bytestring."""
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context):
+            # orjson only supports an indentation of two spaces, which is
+            # close enough for the browsable API and `?indent=` requests.
+            option |= orjson.OPT_INDENT_2
+
+        ret = orjson.dumps(data, default=_default, option=option)
+        return ret.replace(*LINE_SEPARATOR).replace(*PARAGRAPH_SEPARATOR)
+
+
+class ORJSONParser(JSONParser):
+    """Parse the JSON bodies of requests with orjson, if it is available."""
+
+    renderer_class = ORJSONRenderer
+
+    def parse(
+        self,
+        stream: Any,  # noqa: ANN401
+        media_type: Optional[str] = None,
+        parser_context: Optional[Dict] = None,
+    ) -> Any:  # noqa: ANN401
+        """Parse the incoming bytestream as JSON."""
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        if orjson is None or encoding.lower().replace("-", "") != "utf8":
+            # orjson only reads UTF-8, leave everything else to the stdlib
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -63,12 +63,14 @@ class SubmissionSerializer(serializers.HyperlinkedModelSerializer):
             "url",
             "tor_url",
             "content_url",
+            "is_image",
             "has_ocr_transcription",
             "transcription_set",
             "archived",
             "cannot_ocr",
             "redis_id",
             "removed_from_queue",
+            "queue_state",
             "feed",
         )
         # TODO: Omitting the below line while adding `transcription_set` makes
@@ -77,7 +79,7 @@ class SubmissionSerializer(serializers.HyperlinkedModelSerializer):
         # render time drops to ~0.1 seconds.
         #
         # WTF‽
-        read_only_fields = ["transcription_set"]
+        read_only_fields = ["transcription_set", "queue_state", "is_image"]
 
 
 class TranscriptionSerializer(serializers.HyperlinkedModelSerializer):
@@ -1,20 +1,37 @@
 """Utilities for Slack related functionality."""
 import os
-from unittest import mock
+from typing import TYPE_CHECKING
 
 from django.conf import settings
-from slack import WebClient
+from django.utils.functional import SimpleLazyObject
 
 from blossom.errors import ConfigurationError
 
-if settings.ENABLE_SLACK is True:
-    try:
-        client = WebClient(token=os.environ["SLACK_API_KEY"])  # pragma: no cover
-    except KeyError:
-        raise ConfigurationError(
-            "ENABLE_SLACK is set to True, but no API key was found. Set the"
-            " SLACK_API_KEY environment variable or change ENABLE_SLACK to False."
-        )
-else:
-    # this is to explicitly disable posting to Slack when doing local dev
-    client = mock.Mock()
+if TYPE_CHECKING:
+    from slack import WebClient
+
+
+def create_client() -> "WebClient":
+    """Create the Slack client of the site.
+
+    The Slack SDK pulls in aiohttp, so it is only imported when the client is
+    first used instead of by every module that can post to Slack.
+    """
+    if settings.ENABLE_SLACK is not True:
+        from unittest import mock
+
+        # this is to explicitly disable posting to Slack when doing local dev
+        return mock.Mock()
+
+    from slack import WebClient
+
+    return WebClient(token=os.environ["SLACK_API_KEY"])  # pragma: no cover
+
+
+if settings.ENABLE_SLACK is True and "SLACK_API_KEY" not in os.environ:
+    raise ConfigurationError(
+        "ENABLE_SLACK is set to True, but no API key was found. Set the"
+        " SLACK_API_KEY environment variable or change ENABLE_SLACK to False."
+    )
+
+client: "WebClient" = SimpleLazyObject(create_client)
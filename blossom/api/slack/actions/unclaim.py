@@ -2,9 +2,6 @@ import logging
 import os
 from typing import Dict
 
-import praw.reddit
-import prawcore.exceptions
-
 from blossom.api.models import Submission
 from blossom.api.slack import client
 from blossom.api.slack.messages.unclaim import (
@@ -15,6 +12,7 @@ from blossom.api.slack.messages.unclaim import (
     get_confirm_blocks,
     get_confirm_text,
 )
+from blossom.app.reddit_actions import Flair, get_flair_template_id
 from blossom.authentication.models import BlossomUser
 from blossom.reddit import REDDIT
 from blossom.strings import translation
@@ -23,6 +21,7 @@ i18n = translation()
 
 logger = logging.getLogger("blossom.api.actions.unclaim")
 
+# Overrides the flair template which is looked up by its text when set.
 UNCLAIM_REDDIT_FLAIR_ID = os.getenv("UNCLAIM_REDDIT_FLAIR_ID")
 
 
@@ -119,12 +118,17 @@ def _process_unclaim_cancel(
 
 def _unclaim_reddit_flair(submission: Submission) -> None:
     """Update the Reddit flair of the submission to indicate that it's unclaimed."""
-    if UNCLAIM_REDDIT_FLAIR_ID is None:
-        logger.error("The env variable UNCLAIM_REDDIT_FLAIR_ID is not defined!")
-        return
+    import prawcore
+    from praw.models import Submission as RedditSubmission
 
     try:
-        reddit_id = praw.reddit.Submission.id_from_url(submission.tor_url)
-        REDDIT.submission(reddit_id).flair.select(flair_template_id=UNCLAIM_REDDIT_FLAIR_ID)
+        reddit_submission = REDDIT.submission(RedditSubmission.id_from_url(submission.tor_url))
+        flair_template_id = UNCLAIM_REDDIT_FLAIR_ID or get_flair_template_id(
+            reddit_submission, submission.tor_url, Flair.unclaimed
+        )
+        if flair_template_id is None:
+            logger.error(f"Cannot find the {Flair.unclaimed} flair on Reddit!")
+            return
+        reddit_submission.flair.select(flair_template_id=flair_template_id)
     except prawcore.ResponseException:
         logger.exception("Failed to change flair to unclaimed on Reddit")
@@ -150,7 +150,15 @@ def all_info_text() -> str:
     query_one_month = query_all.filter(create_time__gte=one_month_ago)
     query_one_year = query_all.filter(create_time__gte=one_year_ago)
 
-    query_all_queue = query_all.filter(create_time__gte=queue_timeout, archived=False)
+    # The submissions which are still in the queue
+    query_all_queue = Submission.objects.filter(
+        queue_state__in=[
+            Submission.QueueState.UNCLAIMED,
+            Submission.QueueState.CLAIMED,
+            Submission.QueueState.COMPLETED,
+        ],
+        create_time__gte=queue_timeout,
+    )
 
     total_all = query_all.count()
     total_one_day = query_one_day.count()
@@ -1,17 +1,19 @@
 import zoneinfo
 from datetime import datetime
+from typing import TYPE_CHECKING
 from uuid import uuid4
 
 from django.db.models import QuerySet
-from slack.web.classes.blocks import *
-from slack.web.classes.elements import *
-from slack.web.classes.views import View
 
 from blossom.api.models import Submission
 from blossom.api.slack import client
 from blossom.authentication.models import BlossomUser
 from blossom.strings import translation
 
+if TYPE_CHECKING:
+    from slack.web.classes.blocks import Block
+    from slack.web.classes.views import View
+
 i18n = translation()
 
 
@@ -20,8 +22,14 @@ def fmt_date(date_obj: datetime.date) -> str:
     return date_obj.strftime("%Y-%m-%d")
 
 
-def _build_message() -> View:
+def _build_message() -> "View":
     """Create the modal view that will display in Slack."""
+    # The Slack SDK is only imported when it's needed, see `blossom.api.slack`
+    from slack.web.classes.blocks import InputBlock, SectionBlock
+    from slack.web.classes.elements import DatePickerElement, PlainTextInputElement
+    from slack.web.classes.objects import PlainTextObject, TextObject
+    from slack.web.classes.views import View
+
     return View(
         type="modal",
         title="Get Submissions",
@@ -73,7 +81,11 @@ def _build_response_blocks(
     user: BlossomUser,
     start_date: datetime.date,
     end_date: datetime.date,
-) -> list[Block]:
+) -> list["Block"]:
+    from slack.web.classes.blocks import DividerBlock, SectionBlock
+    from slack.web.classes.elements import LinkButtonElement
+    from slack.web.classes.objects import MarkdownTextObject
+
     if submissions.count() > 48:
         # can have a max of 50 blocks in a message, so we need to revert to regular text if we need
         # more than that
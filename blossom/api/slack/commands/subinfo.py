@@ -63,7 +63,15 @@ def sub_info_text(subreddit: str) -> str:
 
     query_all = Submission.objects.filter(removed_from_queue=False)
     query_sub = query_all.filter(feed__iexact=prefixed_sub)
-    query_all_queue = query_all.filter(create_time__gte=queue_timeout, archived=False)
+    # The submissions which are still in the queue
+    query_all_queue = Submission.objects.filter(
+        queue_state__in=[
+            Submission.QueueState.UNCLAIMED,
+            Submission.QueueState.CLAIMED,
+            Submission.QueueState.COMPLETED,
+        ],
+        create_time__gte=queue_timeout,
+    )
     query_sub_queue = query_all_queue.filter(feed__iexact=prefixed_sub)
 
     total_all = query_all.count()
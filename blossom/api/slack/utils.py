@@ -1,15 +1,17 @@
 import logging
 import re
 from re import Match
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from django.conf import settings
-from slack import WebClient
 
 from blossom.api.models import Submission
 from blossom.authentication.models import BlossomUser
 from blossom.strings import translation
 
+if TYPE_CHECKING:
+    from slack import WebClient
+
 logger = logging.getLogger("blossom.api.slack.utils")
 
 i18n = translation()
@@ -157,7 +159,7 @@ def get_message(data: Dict) -> Optional[str]:
         return None
 
 
-def get_reddit_username(slack_client: WebClient, user: Dict) -> Optional[str]:
+def get_reddit_username(slack_client: "WebClient", user: Dict) -> Optional[str]:
     """Get the Reddit username for the given Slack user."""
     response = slack_client.users_profile_get(user=user.get("id"))
     if response.get("ok"):
@@ -0,0 +1,122 @@
+"""Cache the rules of subreddits which are shown on the transcribing page.
+
+The rules are fetched from Reddit for every submission that a volunteer opens,
+while they hardly ever change. They are kept in the default Django cache
+instead, which the workers share in production, as it's kept in the database
+there (elsewhere, every process may have its own):
+
+- Rules which are younger than SUBREDDIT_RULES_CACHE_TIMEOUT are served as is.
+- Older rules are still served right away for SUBREDDIT_RULES_STALE_TIMEOUT
+  seconds, while they are fetched again in the background.
+- When Reddit can't be reached, no rules are served and Reddit isn't asked
+  again for SUBREDDIT_RULES_NEGATIVE_TIMEOUT seconds. Rules which have already
+  been cached are kept until Reddit is back.
+"""
+import logging
+import random
+import re
+import string
+import threading
+import time
+from typing import Any, Dict, Optional, Set
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+
+from blossom.utils.workers import send_to_worker
+
+log = logging.getLogger(__name__)
+
+CACHE_PREFIX = "subreddit_rules:"
+
+SUBREDDIT_PATTERN = re.compile(r"^/r/([A-Za-z0-9_]{2,21})/?$")
+
+# The subreddits whose rules are being fetched in the background.
+_refreshing: Set[str] = set()
+_refreshing_lock = threading.Lock()
+
+
+def generate_request_id() -> str:
+    """Create a random 6-digit string to make Reddit's user-agent guard happy."""
+    return "".join([random.choice(string.ascii_lowercase) for _ in range(6)])
+
+
+def get_subreddit(sub_name: str) -> Optional[str]:
+    """Get the name of the subreddit from `/r/<name>`, or None if it isn't one."""
+    if match := SUBREDDIT_PATTERN.match(sub_name):
+        return match.group(1).lower()
+    return None
+
+
+def fetch_rules(subreddit: str) -> Dict[str, Any]:
+    """Fetch the rules of the subreddit from Reddit."""
+    headers = {"User-Agent": f"Python:Blossom:ID:{generate_request_id()} - contact u/itsthejoker"}
+    response = requests.get(
+        f"https://www.reddit.com/r/{subreddit}/about/rules.json",
+        headers=headers,
+        timeout=settings.SUBREDDIT_RULES_UPSTREAM_TIMEOUT,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def _store(subreddit: str, rules: Optional[Dict[str, Any]], fresh_for: int, keep_for: int) -> None:
+    cache.set(CACHE_PREFIX + subreddit, (time.time() + fresh_for, rules), keep_for)
+
+
+def _store_rules(subreddit: str, rules: Dict[str, Any]) -> None:
+    _store(
+        subreddit,
+        rules,
+        settings.SUBREDDIT_RULES_CACHE_TIMEOUT,
+        settings.SUBREDDIT_RULES_CACHE_TIMEOUT + settings.SUBREDDIT_RULES_STALE_TIMEOUT,
+    )
+
+
+def get_rules(subreddit: str) -> Dict[str, Any]:
+    """Get the rules of the subreddit, or an empty dict if they can't be fetched."""
+    entry = cache.get(CACHE_PREFIX + subreddit)
+    if entry is None:
+        try:
+            rules = fetch_rules(subreddit)
+        except (requests.RequestException, ValueError) as error:
+            log.warning(f"Could not fetch the rules of r/{subreddit}: {error!r}")
+            negative_timeout = settings.SUBREDDIT_RULES_NEGATIVE_TIMEOUT
+            _store(subreddit, None, negative_timeout, negative_timeout)
+            return {}
+        _store_rules(subreddit, rules)
+        return rules
+
+    fresh_until, rules = entry
+    if time.time() >= fresh_until:
+        refresh_rules_in_background(subreddit)
+    return rules or {}
+
+
+def refresh_rules_in_background(subreddit: str) -> None:
+    """Fetch the rules of the subreddit again, unless that's already happening."""
+    with _refreshing_lock:
+        if subreddit in _refreshing:
+            return
+        _refreshing.add(subreddit)
+    _refresh_rules(subreddit)
+
+
+@send_to_worker
+def _refresh_rules(subreddit: str) -> None:
+    try:
+        _store_rules(subreddit, fetch_rules(subreddit))
+    except (requests.RequestException, ValueError) as error:
+        log.warning(f"Could not refresh the rules of r/{subreddit}: {error!r}")
+        # Keep serving the old rules, but don't ask Reddit again straight away
+        if entry := cache.get(CACHE_PREFIX + subreddit):
+            _store(
+                subreddit,
+                entry[1],
+                settings.SUBREDDIT_RULES_NEGATIVE_TIMEOUT,
+                settings.SUBREDDIT_RULES_NEGATIVE_TIMEOUT + settings.SUBREDDIT_RULES_STALE_TIMEOUT,
+            )
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(subreddit)
@@ -1,9 +1,16 @@
 import json
+import threading
+import time
+from typing import Dict
+from unittest.mock import patch
 
+import pytest
+from django.db import connection
 from django.test import Client
 from django.urls import reverse
 from rest_framework import status
 
+from blossom.api.models import Submission
 from blossom.authentication.models import BlossomUser
 from blossom.utils.test_helpers import create_submission, create_user, setup_user_client
 
@@ -25,7 +32,52 @@ class TestSubmissionClaim:
         submission.refresh_from_db()
         assert result.status_code == status.HTTP_201_CREATED
         assert result.json()["id"] == submission.id
+        assert result.json()["queue_state"] == Submission.QueueState.CLAIMED
         assert submission.claimed_by == user
+        assert submission.queue_state == Submission.QueueState.CLAIMED
+
+    def test_claim_archived_concurrently(self, client: Client) -> None:
+        """Test that a claim doesn't overwrite the state of a concurrently archived submission."""
+        client, headers, user = setup_user_client(client)
+        submission = create_submission()
+        Submission.objects.filter(id=submission.id).update(
+            archived=True, queue_state=Submission.QueueState.ARCHIVED
+        )
+
+        # The submission was loaded before it was archived
+        with patch("blossom.api.views.submission.get_object_or_404", return_value=submission):
+            result = client.patch(
+                reverse("submission-claim", args=[submission.id]),
+                {"username": user.username},
+                content_type="application/json",
+                **headers,
+            )
+
+        submission.refresh_from_db()
+        assert result.status_code == status.HTTP_201_CREATED
+        assert result.json()["queue_state"] == Submission.QueueState.ARCHIVED
+        assert submission.claimed_by == user
+        assert submission.queue_state == Submission.QueueState.ARCHIVED
+
+    def test_claim_claimed_concurrently(self, client: Client) -> None:
+        """Test that a claim which loses the race reports the volunteer who won it."""
+        client, headers, user = setup_user_client(client)
+        other_user = create_user(username="other_user")
+        submission = create_submission()
+        Submission.objects.filter(id=submission.id).update(claimed_by=other_user)
+
+        # The submission was loaded before it was claimed
+        with patch("blossom.api.views.submission.get_object_or_404", return_value=submission):
+            result = client.patch(
+                reverse("submission-claim", args=[submission.id]),
+                {"username": user.username},
+                content_type="application/json",
+                **headers,
+            )
+
+        assert result.status_code == status.HTTP_409_CONFLICT
+        assert result.json()["username"] == other_user.username
+        assert submission.claimed_by == other_user
 
     def test_claim_with_other_archived_claim(self, client: Client) -> None:
         """
@@ -213,3 +265,50 @@ class TestSubmissionClaim:
         submission.refresh_from_db()
         assert result.status_code == status.HTTP_423_LOCKED
         assert submission.claimed_by is None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_claims() -> None:
+    """Verify that only one of many concurrent claims of a submission succeeds."""
+    _, headers, admin = setup_user_client(Client(), username="admin_user")
+    submission = create_submission()
+    volunteers = [
+        create_user(username=f"volunteer_{i}", email=f"volunteer_{i}", is_staff=False)
+        for i in range(8)
+    ]
+    barrier = threading.Barrier(len(volunteers))
+    results: Dict[str, int] = {}
+
+    def claim(volunteer: BlossomUser) -> None:
+        # The test client would raise the errors of the requests of the other
+        # threads as well, as it receives them through a global signal.
+        client = Client(raise_request_exception=False)
+        client.force_login(admin)
+        barrier.wait()
+        try:
+            # SQLite refuses concurrent writes instead of waiting for them,
+            # in which case the claim is retried like a client would.
+            for _ in range(100):
+                result = client.patch(
+                    reverse("submission-claim", args=[submission.id]),
+                    {"username": volunteer.username},
+                    content_type="application/json",
+                    **headers,
+                )
+                if result.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR:
+                    time.sleep(0.01)
+                    continue
+                results[volunteer.username] = result.status_code
+                break
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=claim, args=[volunteer]) for volunteer in volunteers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    submission.refresh_from_db()
+    assert sorted(results.values()) == [201] + [409] * (len(volunteers) - 1)
+    assert results[submission.claimed_by.username] == 201
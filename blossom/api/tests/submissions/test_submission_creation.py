@@ -212,3 +212,28 @@ class TestSubmissionCreation:
         assert result.status_code == status.HTTP_201_CREATED
         assert Transcription.objects.count() == 0
         assert result.json().get("cannot_ocr") is True
+
+    def test_is_image_on_create(self, client: Client, settings: SettingsWrapper) -> None:
+        """Verify that whether the content is an image is stored with the submission."""
+        settings.IMAGE_DOMAINS = ["example.com"]
+        client, headers, _ = setup_user_client(client)
+        source = get_default_test_source()
+        data = {
+            "original_id": "spaaaaace",
+            "source": source.pk,
+            "content_url": "http://example.com/a.jpg",
+        }
+
+        result = client.post(
+            reverse("submission-list"), data, content_type="application/json", **headers
+        )
+
+        assert result.status_code == status.HTTP_201_CREATED
+        assert result.json()["is_image"] is True
+        submission = Submission.objects.get(id=result.json()["id"])
+        assert submission.is_image
+
+        submission.content_url = "http://example.org/a.jpg"
+        submission.save(update_fields=["content_url"])
+        submission.refresh_from_db()
+        assert not submission.is_image
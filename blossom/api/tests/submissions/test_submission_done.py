@@ -6,6 +6,7 @@ from django.test import Client
 from django.urls import reverse
 from rest_framework import status
 
+from blossom.api.models import Submission
 from blossom.utils.test_helpers import (
     create_submission,
     create_transcription,
@@ -36,8 +37,34 @@ class TestSubmissionDone:
         assert result.status_code == status.HTTP_201_CREATED
         assert submission.claimed_by == user
         assert submission.completed_by == user
+        assert submission.queue_state == Submission.QueueState.COMPLETED
         assert result.json()["original_id"] == submission.original_id
 
+    def test_done_archived_concurrently(self, client: Client) -> None:
+        """Test that completing doesn't overwrite the state of a concurrently archived post."""
+        client, headers, user = setup_user_client(client)
+        submission = create_submission(claimed_by=user)
+        create_transcription(submission, user)
+        Submission.objects.filter(id=submission.id).update(
+            archived=True, queue_state=Submission.QueueState.ARCHIVED
+        )
+
+        # The submission was loaded before it was archived
+        with patch(
+            "blossom.api.views.submission.get_object_or_404", return_value=submission
+        ), patch("blossom.api.views.submission.send_check_message"):
+            result = client.patch(
+                reverse("submission-done", args=[submission.id]),
+                json.dumps({"username": user.username}),
+                content_type="application/json",
+                **headers,
+            )
+
+        submission.refresh_from_db()
+        assert result.status_code == status.HTTP_201_CREATED
+        assert submission.completed_by == user
+        assert submission.queue_state == Submission.QueueState.ARCHIVED
+
     def test_done_without_transcription(self, client: Client) -> None:
         """Test that the `done` endpoint errors out appropriately if data is missing."""
         client, headers, user = setup_user_client(client)
@@ -1,10 +1,11 @@
+import pytest
 from django.test import Client
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 
-from blossom.api.models import Source
-from blossom.utils.test_helpers import create_submission, setup_user_client
+from blossom.api.models import Source, Submission
+from blossom.utils.test_helpers import create_submission, create_user, setup_user_client
 
 
 class TestSubmissionExpired:
@@ -30,6 +31,43 @@ class TestSubmissionExpired:
         assert len(result.json()) == 1
         assert result.json()[0]["id"] == first.id
 
+    @pytest.mark.parametrize(
+        "state,expected",
+        [
+            ({"claimed": True}, Submission.QueueState.CLAIMED),
+            ({"completed": True}, Submission.QueueState.COMPLETED),
+            ({"claimed": True, "removed_from_queue": True}, Submission.QueueState.REMOVED),
+            ({"completed": True, "removed_from_queue": True}, Submission.QueueState.COMPLETED),
+            ({"completed": True, "archived": True}, Submission.QueueState.ARCHIVED),
+            ({"archived": True}, Submission.QueueState.ARCHIVED),
+        ],
+    )
+    def test_expired_other_queue_states(
+        self, client: Client, state: dict, expected: Submission.QueueState
+    ) -> None:
+        """Test whether submissions which have left the queue are not returned."""
+        client, headers, _ = setup_user_client(client)
+        reddit, _ = Source.objects.get_or_create(name="reddit")
+        volunteer = create_user(id=200, username="volunteer")
+
+        submission = create_submission(
+            create_time=timezone.now() - timezone.timedelta(days=3),
+            source=reddit,
+            claimed_by=volunteer if state.pop("claimed", False) else None,
+            completed_by=volunteer if state.pop("completed", False) else None,
+            **state,
+        )
+        assert submission.queue_state == expected
+
+        result = client.get(
+            reverse("submission-expired") + "?source=reddit",
+            content_type="application/json",
+            **headers,
+        )
+
+        assert result.status_code == status.HTTP_200_OK
+        assert result.json() == []
+
     def test_expired_no_submissions(self, client: Client) -> None:
         """Test whether an empty list is returned when no submissions are expired."""
         client, headers, _ = setup_user_client(client)
@@ -9,7 +9,11 @@ from django.utils.timezone import make_aware
 from rest_framework import status
 
 from blossom.api.models import Source
-from blossom.utils.test_helpers import create_submission, setup_user_client
+from blossom.utils.test_helpers import (
+    create_submission,
+    create_transcription,
+    setup_user_client,
+)
 
 
 class TestSubmissionGet:
@@ -58,6 +62,47 @@ class TestSubmissionGet:
         assert len(result.json()["results"]) == 1
         assert result.json()["results"][0]["id"] == first.id
 
+    def test_retrieve_etag(self, client: Client) -> None:
+        """Verify that an unchanged submission is answered with a 304 response."""
+        client, headers, user = setup_user_client(client)
+        submission = create_submission()
+        url = reverse("submission-detail", args=[submission.id])
+
+        result = client.get(url, **headers)
+        assert result.status_code == status.HTTP_200_OK
+        etag = result["ETag"]
+
+        result = client.get(url, HTTP_IF_NONE_MATCH=etag, **headers)
+        assert result.status_code == status.HTTP_304_NOT_MODIFIED
+        assert result.content == b""
+
+        create_transcription(submission, user)
+        result = client.get(url, HTTP_IF_NONE_MATCH=etag, **headers)
+        assert result.status_code == status.HTTP_200_OK
+        assert result["ETag"] != etag
+        etag = result["ETag"]
+
+        submission.claimed_by = user
+        submission.save(update_fields=["claimed_by"])
+        result = client.get(url, HTTP_IF_NONE_MATCH=etag, **headers)
+        assert result.status_code == status.HTTP_200_OK
+        assert result["ETag"] != etag
+
+    def test_retrieve_etag_nonexistent(self, client: Client) -> None:
+        """Verify that a nonexistent submission still results in a 404 response."""
+        client, headers, _ = setup_user_client(client)
+        result = client.get(reverse("submission-detail", args=[404]), **headers)
+        assert result.status_code == status.HTTP_404_NOT_FOUND
+        assert not result.has_header("ETag")
+
+    def test_save_updates_last_update_time(self) -> None:
+        """Verify that saving a submission bumps its last update time."""
+        submission = create_submission()
+        previous = submission.last_update_time
+        submission.save(update_fields=["title"])
+        submission.refresh_from_db()
+        assert submission.last_update_time > previous
+
     def test_list_with_filters(self, client: Client) -> None:
         """Verify that listing all submissions works correctly."""
         client, headers, _ = setup_user_client(client)
@@ -92,6 +92,30 @@ class TestSubmissionsInProgress:
         assert len(result.json()) == 1
         assert result.json()[0]["id"] == submission.id
 
+    def test_in_progress_etag(self, client: Client) -> None:
+        """Verify that an unchanged list of posts is answered with a 304 response."""
+        client, headers, user = setup_user_client(client)
+        reddit, _ = Source.objects.get_or_create(name="reddit")
+        url = reverse("submission-in-progress") + "?source=reddit"
+        submission = create_submission(
+            claimed_by=user,
+            claim_time=timezone.now() - timezone.timedelta(hours=5),
+            source=reddit,
+        )
+
+        result = client.get(url, **headers)
+        assert result.status_code == status.HTTP_200_OK
+        etag = result["ETag"]
+
+        result = client.get(url, HTTP_IF_NONE_MATCH=etag, **headers)
+        assert result.status_code == status.HTTP_304_NOT_MODIFIED
+
+        submission.claimed_by = None
+        submission.save()
+        result = client.get(url, HTTP_IF_NONE_MATCH=etag, **headers)
+        assert result.status_code == status.HTTP_200_OK
+        assert len(result.json()) == 0
+
     def test_missing_source(self, client: Client) -> None:
         """Verify that requesting unarchived posts without a source errors out."""
         client, headers, user = setup_user_client(client)
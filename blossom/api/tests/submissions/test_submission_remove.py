@@ -5,6 +5,7 @@ from django.test import Client
 from django.urls import reverse
 from rest_framework import status
 
+from blossom.api.models import Submission
 from blossom.utils.test_helpers import create_submission, setup_user_client
 
 
@@ -94,6 +95,7 @@ class TestSubmissionRemove:
 
         assert result.status_code == status.HTTP_200_OK
         assert submission.removed_from_queue
+        assert submission.queue_state == Submission.QueueState.REMOVED
 
     def test_remove_reverting_approval(self, client: Client) -> None:
         """Verify that removing the submission reverts an approval."""
@@ -1,16 +1,26 @@
+import threading
+import time
 from unittest.mock import MagicMock
 
+import pytest
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import Client
 from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
 
-from blossom.api.views.submission import _get_limit_value
+from blossom.api.models import Transcription
+from blossom.api.views.submission import _get_limit_value, _get_wait_value
 from blossom.utils.test_helpers import (
     create_submission,
     create_transcription,
     setup_user_client,
 )
 
+# The environment of a server which handles requests concurrently
+CONCURRENT = {"wsgi.multithread": True}
+
 
 class TestSubmissionTranscribotQueue:
     def test_get_transcribot_queue(self, client: Client) -> None:
@@ -164,6 +174,172 @@ class TestSubmissionTranscribotQueue:
 
         assert len(result["data"]) == 2
 
+    def test_lease_transcribot_queue(self, client: Client) -> None:
+        """Verify that leased transcriptions are not handed out twice."""
+        client, headers, _ = setup_user_client(client)
+        transcribot = get_user_model().objects.get(username="transcribot")
+        transcriptions = [
+            create_transcription(
+                create_submission(source="reddit", original_id=str(i)),
+                transcribot,
+                original_id=None,
+            )
+            for i in range(3)
+        ]
+
+        result = client.post(
+            reverse("submission-lease-transcribot-queue"),
+            {"source": "reddit", "limit": 2},
+            **headers,
+        )
+
+        assert result.status_code == status.HTTP_200_OK
+        assert [item["transcription__id"] for item in result.json()["data"]] == [
+            transcriptions[0].id,
+            transcriptions[1].id,
+        ]
+        assert result.json()["lease_expiry"]
+
+        result = client.post(
+            reverse("submission-lease-transcribot-queue"),
+            {"source": "reddit", "limit": 2},
+            **headers,
+        )
+
+        assert [item["transcription__id"] for item in result.json()["data"]] == [
+            transcriptions[2].id
+        ]
+
+        result = client.post(
+            reverse("submission-lease-transcribot-queue"), {"source": "reddit"}, **headers
+        )
+
+        assert len(result.json()["data"]) == 0
+
+    def test_lease_transcribot_queue_expired(self, client: Client) -> None:
+        """Verify that transcriptions are handed out again once the lease expires."""
+        client, headers, _ = setup_user_client(client)
+        transcribot = get_user_model().objects.get(username="transcribot")
+        posted = create_transcription(
+            create_submission(source="reddit", original_id="posted"),
+            transcribot,
+            original_id=None,
+        )
+        expired = create_transcription(
+            create_submission(source="reddit", original_id="expired"),
+            transcribot,
+            original_id=None,
+        )
+        Transcription.objects.update(
+            ocr_lease_expiry=timezone.now() - timezone.timedelta(seconds=1)
+        )
+        posted.original_id = "abc"
+        posted.save()
+
+        result = client.post(
+            reverse("submission-lease-transcribot-queue"),
+            {"source": "reddit", "lease_seconds": 60},
+            **headers,
+        )
+
+        assert [item["transcription__id"] for item in result.json()["data"]] == [expired.id]
+        expired.refresh_from_db()
+        assert expired.ocr_lease_expiry > timezone.now() + timezone.timedelta(seconds=50)
+
+    @pytest.mark.parametrize(
+        "data",
+        [{"limit": "none"}, {"limit": -1}, {"lease_seconds": 0}, {"lease_seconds": -60}],
+    )
+    def test_lease_transcribot_queue_invalid_limit(self, client: Client, data: dict) -> None:
+        """Verify that the limit and lease_seconds have to be in range."""
+        client, headers, _ = setup_user_client(client)
+
+        result = client.post(
+            reverse("submission-lease-transcribot-queue"),
+            {"source": "reddit", **data},
+            **headers,
+        )
+
+        assert result.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_get_transcribot_queue_wait(self, client: Client) -> None:
+        """Verify that the request waits for new work when the queue is empty."""
+        client, headers, _ = setup_user_client(client)
+        transcribot = get_user_model().objects.get(username="transcribot")
+
+        start = time.monotonic()
+        result = client.get(
+            reverse("submission-get-transcribot-queue") + "?source=reddit&wait=0.2",
+            **headers,
+            **CONCURRENT,
+        )
+
+        assert result.status_code == status.HTTP_200_OK
+        assert result.json()["data"] == []
+        assert time.monotonic() - start >= 0.2
+
+        create_transcription(create_submission(source="reddit"), transcribot, original_id=None)
+        start = time.monotonic()
+        result = client.get(
+            reverse("submission-get-transcribot-queue") + "?source=reddit&wait=10",
+            **headers,
+            **CONCURRENT,
+        )
+
+        assert len(result.json()["data"]) == 1
+        assert time.monotonic() - start < 5
+
+    def test_get_transcribot_queue_wait_sync_worker(self, client: Client) -> None:
+        """Verify that requests don't block workers which handle one request at a time."""
+        client, headers, _ = setup_user_client(client)
+
+        start = time.monotonic()
+        result = client.get(
+            reverse("submission-get-transcribot-queue") + "?source=reddit&wait=10", **headers
+        )
+
+        assert result.json()["data"] == []
+        assert time.monotonic() - start < 5
+
+
+@pytest.mark.django_db(transaction=True)
+def test_lease_transcribot_queue_woken(client: Client) -> None:
+    """Verify that a waiting request is woken by a transcription created elsewhere."""
+    client, headers, _ = setup_user_client(client)
+    transcribot = get_user_model().objects.get(username="transcribot")
+    submission = create_submission(source="reddit")
+
+    def create() -> None:
+        # Runs in another thread, with its own database connection
+        create_transcription(submission, transcribot, original_id=None)
+        connection.close()
+
+    timer = threading.Timer(0.3, create)
+    timer.start()
+    start = time.monotonic()
+    result = client.post(
+        reverse("submission-lease-transcribot-queue"),
+        {"source": "reddit", "wait": 10},
+        **headers,
+        **CONCURRENT,
+    )
+    timer.join()
+
+    assert len(result.json()["data"]) == 1
+    assert 0.3 <= time.monotonic() - start < 5
+
+
+def test_get_wait() -> None:
+    """Verify that the wait value is limited to the allowed range."""
+    request = MagicMock(META={"wsgi.multithread": True})
+    assert _get_wait_value(request, None) == 0
+    assert _get_wait_value(request, "2.5") == 2.5
+    assert _get_wait_value(request, "-1") == 0
+    assert _get_wait_value(request, "1000") == 30
+    assert _get_wait_value(request, "abc") == 0
+    assert _get_wait_value(request, "nan") == 0
+    assert _get_wait_value(MagicMock(META={"wsgi.multithread": False}), "2.5") == 0
+
 
 def test_get_limit() -> None:
     """Verify that get_limit_value returns the requested value or 10."""
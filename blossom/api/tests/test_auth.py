@@ -1,10 +1,20 @@
 """Set of tests which are used to validate the behavior of the authentication of users."""
+from typing import Optional
+
+import pytest
 from django.test import Client, RequestFactory
 from django.urls import reverse
 from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
 from rest_framework import status
+from rest_framework_api_key.models import APIKey
 
-from blossom.api.authentication import BlossomApiPermission
+from blossom.api.authentication import (
+    BlossomApiPermission,
+    FailedLoginThrottle,
+    verified_api_keys,
+)
+from blossom.authentication.backends import create_api_token
 from blossom.authentication.models import BlossomUser
 from blossom.utils.test_helpers import create_user, setup_user_client
 
@@ -115,3 +125,204 @@ class TestPermissionsCheck:
         request = rf.get("/")
         request.user = user
         assert BlossomApiPermission().has_permission(request, None)
+
+
+class TestVerifiedApiKeyCache:
+    """Tests to validate the behavior of the cache of verified API keys."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> None:
+        """Make sure that every test starts without any verified keys."""
+        verified_api_keys.clear()
+
+    def test_key_hashed_once(self, client: Client, mocker: MockerFixture) -> None:
+        """Verify that a valid key is only hashed on the first request."""
+        client, headers, _ = setup_user_client(client, is_staff=False)
+        spy = mocker.spy(APIKey, "is_valid")
+
+        for _ in range(3):
+            result = client.get(reverse("volunteer-list"), **headers)
+            assert result.status_code == status.HTTP_200_OK
+
+        assert spy.call_count == 1
+
+    def test_invalid_key_not_cached(self, client: Client, mocker: MockerFixture) -> None:
+        """Verify that an invalid key is rejected every time."""
+        client, _, _ = setup_user_client(client, is_staff=False)
+        spy = mocker.spy(APIKey, "is_valid")
+
+        for _ in range(2):
+            result = client.get(reverse("volunteer-list"), HTTP_AUTHORIZATION="Api-Key abc.def")
+            assert result.status_code == status.HTTP_403_FORBIDDEN
+
+        assert spy.call_count == 2
+
+    def test_rotated_key(self, client: Client) -> None:
+        """Verify that the old key is rejected immediately after rotating it."""
+        client, headers, user = setup_user_client(client, is_staff=False)
+        assert client.get(reverse("volunteer-list"), **headers).status_code == 200
+
+        api_key, key = APIKey.objects.create_key(name="rotated_api_key")
+        user.api_key = api_key
+        user.save()
+
+        assert client.get(reverse("volunteer-list"), **headers).status_code == 403
+        result = client.get(reverse("volunteer-list"), HTTP_AUTHORIZATION=f"Api-Key {key}")
+        assert result.status_code == status.HTTP_200_OK
+
+    def test_revoked_key(self, client: Client) -> None:
+        """Verify that a cached key is rejected immediately after revoking it."""
+        client, headers, user = setup_user_client(client, is_staff=False)
+        assert client.get(reverse("volunteer-list"), **headers).status_code == 200
+
+        user.api_key.revoked = True
+        user.api_key.save()
+
+        result = client.get(reverse("volunteer-list"), **headers)
+        assert result.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_shared_cache(
+        self, client: Client, mocker: MockerFixture, settings: SettingsWrapper
+    ) -> None:
+        """Verify that verified keys can be shared through the Django cache."""
+        settings.API_KEY_CACHE_SHARED = True
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        client, headers, _ = setup_user_client(client, is_staff=False)
+        spy = mocker.spy(APIKey, "is_valid")
+
+        assert client.get(reverse("volunteer-list"), **headers).status_code == 200
+        # Mimic another process, which only has access to the shared cache.
+        verified_api_keys.clear()
+        assert client.get(reverse("volunteer-list"), **headers).status_code == 200
+
+        assert spy.call_count == 1
+
+    def test_cache_disabled(
+        self, client: Client, mocker: MockerFixture, settings: SettingsWrapper
+    ) -> None:
+        """Verify that the key is hashed on every request without a timeout."""
+        settings.API_KEY_CACHE_TIMEOUT = 0
+        client, headers, _ = setup_user_client(client, is_staff=False)
+        spy = mocker.spy(APIKey, "is_valid")
+
+        for _ in range(2):
+            assert client.get(reverse("volunteer-list"), **headers).status_code == 200
+
+        assert spy.call_count == 2
+
+
+class TestApiToken:
+    """Tests to validate the behavior of the API tokens."""
+
+    def setup_token_client(self, client: Client) -> tuple:
+        """Set up a client which is not logged in, with a hashed password."""
+        client, headers, user = setup_user_client(client, login=False, is_staff=False)
+        user.set_password("base_password")
+        user.save()
+        return client, {"HTTP_X_API_KEY": headers["HTTP_AUTHORIZATION"].split()[1]}, user
+
+    def test_token(self, client: Client, mocker: MockerFixture) -> None:
+        """Verify that a token can be used without verifying the password again."""
+        client, headers, user = self.setup_token_client(client)
+        result = client.post(
+            reverse("token"), {"email": user.email, "password": "base_password"}, **headers
+        )
+
+        assert result.status_code == status.HTTP_200_OK
+        assert result.json()["expires_in"] == 3600
+
+        check_password = mocker.spy(BlossomUser, "check_password")
+        result = client.get(
+            reverse("volunteer-list"),
+            HTTP_AUTHORIZATION=f"Bearer {result.json()['token']}",
+            **headers,
+        )
+
+        assert result.status_code == status.HTTP_200_OK
+        assert check_password.call_count == 0
+
+    def test_token_wrong_password(self, client: Client) -> None:
+        """Verify that no token is provided when the password is incorrect."""
+        client, headers, user = self.setup_token_client(client)
+        result = client.post(
+            reverse("token"), {"email": user.email, "password": "wrong"}, **headers
+        )
+        assert result.status_code == status.HTTP_401_UNAUTHORIZED
+        assert "token" not in result.json()
+
+    def test_token_missing_password(self, client: Client) -> None:
+        """Verify that the email and password are required."""
+        client, headers, user = self.setup_token_client(client)
+        result = client.post(reverse("token"), {"email": user.email}, **headers)
+        assert result.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.parametrize("key", [None, "", "abc", "abc.def"])
+    def test_token_requires_api_key(
+        self, client: Client, mocker: MockerFixture, key: Optional[str]
+    ) -> None:
+        """Verify that the password is not checked without a valid API key."""
+        client, _, user = self.setup_token_client(client)
+        headers = {} if key is None else {"HTTP_X_API_KEY": key}
+        check_password = mocker.spy(BlossomUser, "check_password")
+        result = client.post(
+            reverse("token"), {"email": user.email, "password": "base_password"}, **headers
+        )
+        assert result.status_code == status.HTTP_403_FORBIDDEN
+        assert check_password.call_count == 0
+
+    def test_token_throttle(
+        self, client: Client, settings: SettingsWrapper, mocker: MockerFixture
+    ) -> None:
+        """Verify that only failed logins count towards the rate limit."""
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "test_token_throttle",
+            }
+        }
+        mocker.patch.object(FailedLoginThrottle, "THROTTLE_RATES", {"token": "2/minute"})
+        client, headers, user = self.setup_token_client(client)
+        correct = {"email": user.email, "password": "base_password"}
+        wrong = {"email": user.email, "password": "wrong"}
+
+        results = [client.post(reverse("token"), data, **headers) for data in (correct, correct)]
+        results += [client.post(reverse("token"), data, **headers) for data in (wrong, wrong)]
+        results.append(client.post(reverse("token"), correct, **headers))
+
+        assert [result.status_code for result in results] == [200, 200, 401, 401, 429]
+
+    def test_token_without_api_key(self, client: Client) -> None:
+        """Verify that the API key is still required next to the token."""
+        client, _, user = self.setup_token_client(client)
+        result = client.get(
+            reverse("volunteer-list"), HTTP_AUTHORIZATION=f"Bearer {create_api_token(user)}"
+        )
+        assert result.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_invalid_token(self, client: Client) -> None:
+        """Verify that an invalid token is rejected with a 401 response."""
+        client, headers, _ = self.setup_token_client(client)
+        result = client.get(reverse("volunteer-list"), HTTP_AUTHORIZATION="Bearer abc", **headers)
+        assert result.status_code == status.HTTP_401_UNAUTHORIZED
+        assert result["WWW-Authenticate"] == 'Bearer realm="api"'
+
+    def test_expired_token(self, client: Client, settings: SettingsWrapper) -> None:
+        """Verify that an expired token is rejected with a 401 response."""
+        client, headers, user = self.setup_token_client(client)
+        token = create_api_token(user)
+        settings.API_TOKEN_MAX_AGE = -1
+        result = client.get(
+            reverse("volunteer-list"), HTTP_AUTHORIZATION=f"Bearer {token}", **headers
+        )
+        assert result.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_token_password_change(self, client: Client) -> None:
+        """Verify that changing the password invalidates the existing tokens."""
+        client, headers, user = self.setup_token_client(client)
+        token = create_api_token(user)
+        user.set_password("new_password")
+        user.save()
+        result = client.get(
+            reverse("volunteer-list"), HTTP_AUTHORIZATION=f"Bearer {token}", **headers
+        )
+        assert result.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,118 @@
+"""Tests to validate the behavior of the changes feed."""
+import datetime
+from typing import Any
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+from rest_framework import status
+
+from blossom.api.models import Submission
+from blossom.api.views.changes import decode_cursor, encode_cursor
+from blossom.utils.test_helpers import (
+    create_submission,
+    create_transcription,
+    setup_user_client,
+)
+
+
+def test_changes(client: Client) -> None:
+    """Verify that the feed returns the changes in batches, continuing from the cursor."""
+    client, headers, user = setup_user_client(client)
+    submissions = [create_submission(original_id=str(i)) for i in range(3)]
+    transcription = create_transcription(submissions[0], user)
+
+    result = client.get(reverse("changes") + "?limit=2", **headers)
+
+    assert result.status_code == status.HTTP_200_OK
+    assert [item["id"] for item in result.json()["submissions"]] == [
+        submissions[0].id,
+        submissions[1].id,
+    ]
+    assert [item["id"] for item in result.json()["transcriptions"]] == [transcription.id]
+    assert result.json()["has_more"]
+
+    cursor = result.json()["cursor"]
+    result = client.get(reverse("changes") + f"?limit=2&since={cursor}", **headers)
+
+    assert [item["id"] for item in result.json()["submissions"]] == [submissions[2].id]
+    assert result.json()["transcriptions"] == []
+    assert not result.json()["has_more"]
+
+    cursor = result.json()["cursor"]
+    result = client.get(reverse("changes") + f"?since={cursor}", **headers)
+
+    assert result.json()["submissions"] == []
+    assert result.json()["transcriptions"] == []
+
+    submissions[0].claimed_by = user
+    submissions[0].save()
+    result = client.get(reverse("changes") + f"?since={cursor}", **headers)
+
+    assert [item["id"] for item in result.json()["submissions"]] == [submissions[0].id]
+
+
+def test_changes_same_change_number(client: Client) -> None:
+    """Verify that no changes are skipped when they have the same change number."""
+    client, headers, _ = setup_user_client(client)
+    submissions = [create_submission(original_id=str(i)) for i in range(3)]
+    Submission.objects.update(change_number=1)
+
+    result = client.get(reverse("changes") + "?limit=1", **headers)
+    ids = [item["id"] for item in result.json()["submissions"]]
+    while result.json()["has_more"]:
+        result = client.get(
+            reverse("changes") + f"?limit=1&since={result.json()['cursor']}", **headers
+        )
+        ids += [item["id"] for item in result.json()["submissions"]]
+
+    assert ids == [submission.id for submission in submissions]
+
+
+def test_changes_clock_skew(client: Client) -> None:
+    """Verify that changes are returned in the order in which they were written."""
+    client, headers, _ = setup_user_client(client)
+    first = create_submission(original_id="1")
+    result = client.get(reverse("changes"), **headers)
+    cursor = result.json()["cursor"]
+
+    # The clock of the process which saves the second submission is behind
+    second = create_submission(original_id="2")
+    Submission.objects.filter(id=second.id).update(
+        last_update_time=first.last_update_time - datetime.timedelta(minutes=1)
+    )
+    result = client.get(reverse("changes") + f"?since={cursor}", **headers)
+
+    assert [item["id"] for item in result.json()["submissions"]] == [second.id]
+
+
+def test_changes_queries(client: Client, django_assert_max_num_queries: Any) -> None:
+    """Verify that the number of queries doesn't grow with the number of changes."""
+    client, headers, user = setup_user_client(client)
+    for i in range(10):
+        submission = create_submission(original_id=str(i))
+        create_transcription(submission, user)
+
+    with django_assert_max_num_queries(10):
+        result = client.get(reverse("changes"), **headers)
+
+    assert len(result.json()["submissions"]) == 10
+    assert len(result.json()["transcriptions"]) == 10
+
+
+@pytest.mark.parametrize("query", ["since=abc", "since=WzFd", "limit=0", "limit=abc"])
+def test_changes_invalid(client: Client, query: str) -> None:
+    """Verify that an invalid cursor or limit results in a 400 response."""
+    client, headers, _ = setup_user_client(client)
+    result = client.get(reverse("changes") + f"?{query}", **headers)
+    assert result.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_cursor_round_trip() -> None:
+    """Verify that the positions are retrieved from the encoded cursor."""
+    positions = {
+        "submissions": (1234, 5),
+        "transcriptions": None,
+    }
+    assert decode_cursor(encode_cursor(positions)) == positions
+    assert decode_cursor(None) == {"submissions": None, "transcriptions": None}
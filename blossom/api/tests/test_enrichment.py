@@ -0,0 +1,152 @@
+from typing import Iterator, List
+from unittest.mock import MagicMock, patch
+
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse
+from pytest_django.fixtures import SettingsWrapper
+from rest_framework import status
+
+from blossom.api import enrichment
+from blossom.api.enrichment import enrich_in_background, fetch_missing_details
+from blossom.api.models import Submission
+from blossom.utils.test_helpers import (
+    create_submission,
+    get_default_test_source,
+    setup_user_client,
+)
+
+
+class Post:
+    """A minimal stand-in for a post returned by Reddit."""
+
+    def __init__(self, post_id: str, title: str, over_18: bool = False) -> None:
+        """Create the post with the given ID and details."""
+        self.fullname = f"t3_{post_id}"
+        self.title = title
+        self.over_18 = over_18
+
+
+def fake_info(posts: List[Post]) -> MagicMock:
+    """Create a replacement of `Reddit.info` which knows the given posts."""
+
+    def info(fullnames: List[str]) -> Iterator[Post]:
+        return (post for post in posts if post.fullname in fullnames)
+
+    return MagicMock(side_effect=info)
+
+
+def reddit_url(post_id: str) -> str:
+    """Get the URL of the Reddit post with the given ID."""
+    return f"https://reddit.com/r/me_irl/comments/{post_id}/some_title/"
+
+
+def test_fetch_missing_details() -> None:
+    """Verify that the details of the submissions are fetched from Reddit."""
+    sfw = create_submission(original_id="a", url=reddit_url("aaa"))
+    nsfw = create_submission(original_id="b", url=reddit_url("bbb"))
+    deleted = create_submission(original_id="c", url=reddit_url("ccc"))
+    elsewhere = create_submission(original_id="d", url="https://example.com/d")
+    info = fake_info([Post("aaa", "Title A"), Post("bbb", "Title B", over_18=True)])
+
+    with patch.object(enrichment, "REDDIT", MagicMock(info=info)):
+        assert fetch_missing_details([sfw, nsfw, deleted, elsewhere]) == 2
+
+    info.assert_called_once_with(fullnames=["t3_aaa", "t3_bbb", "t3_ccc"])
+    for submission in (sfw, nsfw, deleted, elsewhere):
+        submission.refresh_from_db()
+    assert (sfw.title, sfw.nsfw) == ("Title A", False)
+    assert (nsfw.title, nsfw.nsfw) == ("Title B", True)
+    assert deleted.title is None
+    assert elsewhere.title is None
+
+
+def test_fetch_missing_details_batches() -> None:
+    """Verify that Reddit is asked about at most 100 posts at a time."""
+    submissions = [
+        create_submission(original_id=str(i), url=reddit_url(f"p{i}")) for i in range(150)
+    ]
+    info = fake_info([Post(f"p{i}", f"Title {i}") for i in range(150)])
+
+    with patch.object(enrichment, "REDDIT", MagicMock(info=info)):
+        assert fetch_missing_details(submissions) == 150
+
+    assert [len(call.kwargs["fullnames"]) for call in info.call_args_list] == [100, 50]
+    assert Submission.objects.filter(title__startswith="Title").count() == 150
+
+
+def test_enrich_in_background(settings: SettingsWrapper) -> None:
+    """Verify that submissions queued together are enriched together."""
+    settings.ENABLE_REDDIT = True
+    first = create_submission(original_id="a", url=reddit_url("aaa"))
+    second = create_submission(original_id="b", url=reddit_url("bbb"))
+    titled = create_submission(original_id="c", url=reddit_url("ccc"), title="Title C")
+
+    with patch.object(enrichment, "_enrich_pending") as enrich_pending:
+        enrich_in_background([first.id])
+        enrich_in_background([second.id, titled.id])
+        enrich_in_background([])
+    # The worker is only asked once to process the pending submissions
+    enrich_pending.assert_called_once()
+
+    info = fake_info([Post("aaa", "Title A"), Post("bbb", "Title B"), Post("ccc", "New")])
+    with patch.object(enrichment, "REDDIT", MagicMock(info=info)):
+        enrichment._enrich_pending(worker_test_mode=True)
+
+    info.assert_called_once()
+    assert sorted(info.call_args.kwargs["fullnames"]) == ["t3_aaa", "t3_bbb"]
+    assert not enrichment._pending
+    titled.refresh_from_db()
+    assert titled.title == "Title C"
+
+
+def test_enrich_in_background_without_reddit() -> None:
+    """Verify that nothing is queued when Reddit is disabled."""
+    submission = create_submission(url=reddit_url("aaa"))
+
+    with patch.object(enrichment, "_enrich_pending") as enrich_pending:
+        enrich_in_background([submission.id])
+
+    enrich_pending.assert_not_called()
+    assert not enrichment._pending
+
+
+def test_create_without_title(client: Client) -> None:
+    """Verify that submissions created without a title are enriched."""
+    client, headers, _ = setup_user_client(client)
+    data = {
+        "original_id": "spaaaaace",
+        "source": get_default_test_source().pk,
+        "content_url": "http://imgur.com/a.jpg",
+        "url": reddit_url("aaa"),
+    }
+
+    with patch("blossom.api.views.submission.enrich_in_background") as enrich:
+        result = client.post(
+            reverse("submission-list"), data, content_type="application/json", **headers
+        )
+        client.post(
+            reverse("submission-list"),
+            {**data, "original_id": "titled", "title": "Title"},
+            content_type="application/json",
+            **headers,
+        )
+
+    assert result.status_code == status.HTTP_201_CREATED
+    enrich.assert_called_once_with([result.json()["id"]])
+
+
+def test_enrich_submissions_command(settings: SettingsWrapper) -> None:
+    """Verify that the command enriches all submissions without a title."""
+    settings.ENABLE_REDDIT = True
+    for i in range(5):
+        create_submission(original_id=str(i), url=reddit_url(f"p{i}"))
+    info = fake_info([Post(f"p{i}", f"Title {i}") for i in range(5)])
+
+    with patch.object(enrichment, "REDDIT", MagicMock(info=info)), patch.object(
+        enrichment, "INFO_BATCH_SIZE", 2
+    ), patch("blossom.management.commands.enrich_submissions.INFO_BATCH_SIZE", 2):
+        call_command("enrich_submissions")
+
+    assert info.call_count == 3
+    assert not Submission.objects.filter(title=None).exists()
@@ -0,0 +1,139 @@
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from django.test import Client
+from django.urls import reverse
+from pytest_django.fixtures import SettingsWrapper
+
+from blossom.api.image_cache import ImageCache
+
+IMAGE = b"0123456789"
+
+
+def upstream_response(
+    content: bytes, status: int = 200, content_type: str = "image/png"
+) -> MagicMock:
+    """Create a replacement of the response of the upstream image host."""
+    response = MagicMock(status_code=status, headers={"Content-Type": content_type})
+    response.iter_content.return_value = iter([content[:4], content[4:]])
+    return response
+
+
+@pytest.fixture
+def image_cache(settings: SettingsWrapper, tmp_path: Path) -> Path:
+    """Keep the cached images in a temporary directory."""
+    settings.IMAGE_CACHE_DIR = str(tmp_path)
+    return tmp_path
+
+
+def test_image_proxy_cache(client: Client, image_cache: Path) -> None:
+    """Verify that images are only downloaded the first time they are requested."""
+    url = reverse("iredditproxy", args=["abcde.png"])
+    with patch("blossom.api.views.proxy.requests.get") as get:
+        get.return_value = upstream_response(IMAGE)
+        first = client.get(url)
+        assert b"".join(first.streaming_content) == IMAGE
+        second = client.get(url)
+
+    get.assert_called_once()
+    assert get.call_args.args[0] == "https://i.redd.it/abcde.png"
+    assert second.status_code == 200
+    assert b"".join(second.streaming_content) == IMAGE
+    assert second["Content-Type"] == "image/png"
+    assert second["Content-Length"] == "10"
+    assert "max-age" in second["Cache-Control"]
+
+    unchanged = client.get(url, HTTP_IF_NONE_MATCH=second["ETag"])
+    assert unchanged.status_code == 304
+
+
+@pytest.mark.parametrize(
+    "header,status,content,content_range",
+    [
+        ("bytes=2-5", 206, b"2345", "bytes 2-5/10"),
+        ("bytes=7-", 206, b"789", "bytes 7-9/10"),
+        ("bytes=-3", 206, b"789", "bytes 7-9/10"),
+        ("bytes=8-20", 206, b"89", "bytes 8-9/10"),
+        ("bytes=10-", 416, b"", "bytes */10"),
+    ],
+)
+def test_image_proxy_range(
+    client: Client,
+    image_cache: Path,
+    header: str,
+    status: int,
+    content: bytes,
+    content_range: str,
+) -> None:
+    """Verify that parts of an image can be requested, also before it's cached."""
+    url = reverse("imgurproxy", args=["abcde.png"])
+    with patch("blossom.api.views.proxy.requests.get") as get:
+        get.return_value = upstream_response(IMAGE)
+        response = client.get(url, HTTP_RANGE=header)
+
+    assert get.call_args.args[0] == "https://imgur.com/abcde.png"
+    assert response.status_code == status
+    assert response["Content-Range"] == content_range
+    body = b"".join(response.streaming_content) if response.streaming else response.content
+    assert body == content
+
+
+def test_image_proxy_error(client: Client, image_cache: Path) -> None:
+    """Verify that responses which are not images are passed on without caching them."""
+    url = reverse("iredditproxy", args=["missing.png"])
+    with patch("blossom.api.views.proxy.requests.get") as get:
+        get.return_value = upstream_response(b"Not found", 404, "text/html")
+        response = client.get(url)
+
+    assert response.status_code == 404
+    assert b"".join(response.streaming_content) == b"Not found"
+    assert not list(image_cache.iterdir())
+
+
+@pytest.mark.parametrize(
+    "error,status",
+    [(requests.ConnectTimeout, 504), (requests.ReadTimeout, 504), (requests.ConnectionError, 502)],
+)
+def test_image_proxy_upstream_failure(
+    client: Client, image_cache: Path, error: type, status: int
+) -> None:
+    """Verify that an unreachable upstream host gives a gateway error."""
+    url = reverse("iredditproxy", args=["abcde.png"])
+    with patch("blossom.api.views.proxy.requests.get", side_effect=error):
+        response = client.get(url)
+
+    assert response.status_code == status
+    assert not list(image_cache.iterdir())
+
+
+def test_image_cache_eviction(tmp_path: Path) -> None:
+    """Verify that the least recently used images are removed when the cache is full."""
+    cache = ImageCache(tmp_path, max_bytes=25)
+    for key, used in (("a", 1000), ("b", 2000)):
+        list(cache.store(key, [IMAGE], "image/png"))
+        os.utime(cache._get_paths(key)[0], (used, used))
+    # Using the first image makes the second one the least recently used
+    assert cache.get("a")
+    list(cache.store("c", [IMAGE], "image/png"))
+
+    assert cache.get("a")
+    assert cache.get("b") is None
+    assert cache.get("c")
+    assert len(list(tmp_path.iterdir())) == 4
+
+
+def test_image_cache_stale_downloads(tmp_path: Path) -> None:
+    """Verify that abandoned partial downloads are removed, but recent ones are kept."""
+    cache = ImageCache(tmp_path, max_bytes=1000)
+    stale, recent = tmp_path / "stale.tmp", tmp_path / "recent.tmp"
+    stale.write_bytes(IMAGE)
+    recent.write_bytes(IMAGE)
+    os.utime(stale, (1000, 1000))
+    list(cache.store("a", [IMAGE], "image/png"))
+
+    assert not stale.exists()
+    assert recent.exists()
+    assert cache.get("a")
@@ -43,6 +43,21 @@ def test_summary(client: Client) -> None:
     assert result.status_code == status.HTTP_200_OK
 
 
+def test_summary_etag(client: Client) -> None:
+    """Test whether an unchanged summary is answered with a 304 response."""
+    client, headers, user = setup_user_client(client)
+    result = client.get(reverse("summary"), **headers)
+    etag = result["ETag"]
+
+    result = client.get(reverse("summary"), HTTP_IF_NONE_MATCH=etag, **headers)
+    assert result.status_code == status.HTTP_304_NOT_MODIFIED
+
+    create_submission(completed_by=user, complete_time=datetime.datetime.now(tz=pytz.UTC))
+    result = client.get(reverse("summary"), HTTP_IF_NONE_MATCH=etag, **headers)
+    assert result.status_code == status.HTTP_200_OK
+    assert result.json()["transcription_count"] == 1
+
+
 def test_active_volunteer_count(client: Client) -> None:
     """Test whether the summary provides a correct active volunteer count."""
     client, headers, user_1 = setup_user_client(client, id=123, username="user_1")
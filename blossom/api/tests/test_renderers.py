@@ -0,0 +1,65 @@
+"""Tests to validate the behavior of the orjson renderer and parser."""
+import datetime
+import io
+import uuid
+from decimal import Decimal
+
+import pytest
+from pytest_mock import MockerFixture
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from blossom.api import renderers
+from blossom.api.renderers import ORJSONParser, ORJSONRenderer
+
+PAYLOAD = {
+    "id": 1,
+    "username": "Narf",
+    "date_joined": datetime.datetime(2021, 6, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+    "original_id": uuid.UUID("c8d3b6a2-3f4b-4a4e-9d2b-6c0d4e7f1a2b"),
+    "text": "A line\u2028separator, a paragraph\u2029separator and \u2713",
+    "gamma": Decimal("3.5"),
+    "nested": [{"rank": 1}, {"rank": 2}],
+}
+
+
+def test_render_matches_drf() -> None:
+    """Verify that the orjson output is identical to the one of DRF."""
+    assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+
+def test_render_none() -> None:
+    """Verify that an empty response renders to an empty body."""
+    assert ORJSONRenderer().render(None) == b""
+
+
+def test_render_indent() -> None:
+    """Verify that an indentation can still be requested."""
+    result = ORJSONRenderer().render({"a": 1}, "application/json; indent=4")
+    assert result == b'{\n  "a": 1\n}'
+
+
+def test_render_fallback(mocker: MockerFixture) -> None:
+    """Verify that the renderer falls back to DRF when orjson is not installed."""
+    mocker.patch.object(renderers, "orjson", None)
+    assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_parse(mocker: MockerFixture, use_orjson: bool) -> None:
+    """Verify that the parser reads JSON bodies with and without orjson."""
+    if not use_orjson:
+        mocker.patch.object(renderers, "orjson", None)
+    body = b'{"username": "Narf", "count": 3, "tags": ["a", "\xe2\x9c\x93"]}'
+    result = ORJSONParser().parse(io.BytesIO(body))
+    assert result == JSONParser().parse(io.BytesIO(body))
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_parse_invalid(mocker: MockerFixture, use_orjson: bool) -> None:
+    """Verify that invalid JSON results in a parse error."""
+    if not use_orjson:
+        mocker.patch.object(renderers, "orjson", None)
+    with pytest.raises(ParseError):
+        ORJSONParser().parse(io.BytesIO(b'{"username": '))
@@ -0,0 +1,106 @@
+import time
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from django.core.cache import cache
+from django.test import Client
+from django.urls import reverse
+from pytest_django.fixtures import SettingsWrapper
+
+from blossom.api import subreddit_rules
+from blossom.api.subreddit_rules import CACHE_PREFIX, get_subreddit
+
+RULES = {"rules": [{"violation_reason": "Be nice", "description": "Please."}]}
+
+
+@pytest.fixture(autouse=True)
+def rules_cache(settings: SettingsWrapper) -> Iterator[None]:
+    """Use a real cache, as the testing settings don't cache anything."""
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def reddit_response(rules: dict) -> MagicMock:
+    """Create a replacement of the response of Reddit."""
+    return MagicMock(json=MagicMock(return_value=rules))
+
+
+def test_subreddit_rules_cache(client: Client) -> None:
+    """Verify that the rules are only fetched from Reddit the first time."""
+    url = reverse("subredditjsonproxy") + "?s=/r/TranscribersOfReddit"
+    with patch("blossom.api.subreddit_rules.requests.get") as get:
+        get.return_value = reddit_response(RULES)
+        first = client.get(url)
+        second = client.get(url.lower())
+
+    get.assert_called_once()
+    assert get.call_args.args[0] == (
+        "https://www.reddit.com/r/transcribersofreddit/about/rules.json"
+    )
+    assert get.call_args.kwargs["timeout"] == 3
+    assert first.json() == RULES
+    assert second.json() == RULES
+
+
+def test_subreddit_rules_stale(client: Client) -> None:
+    """Verify that old rules are served while they are fetched again in the background."""
+    cache.set(CACHE_PREFIX + "test", (time.time() - 1, RULES), 60)
+    new_rules = {"rules": []}
+    with patch("blossom.api.subreddit_rules.requests.get") as get, patch.object(
+        subreddit_rules, "_refresh_rules"
+    ) as refresh:
+        response = client.get(reverse("subredditjsonproxy") + "?s=/r/test")
+        client.get(reverse("subredditjsonproxy") + "?s=/r/test")
+
+    get.assert_not_called()
+    assert response.json() == RULES
+    # The second request doesn't start another refresh while the first is running
+    refresh.assert_called_once_with("test")
+    subreddit_rules._refreshing.clear()
+
+    with patch("blossom.api.subreddit_rules.requests.get") as get:
+        get.return_value = reddit_response(new_rules)
+        subreddit_rules._refresh_rules("test", worker_test_mode=True)
+    assert subreddit_rules.get_rules("test") == new_rules
+
+
+def test_subreddit_rules_error(client: Client) -> None:
+    """Verify that Reddit isn't asked again for a while when it fails."""
+    url = reverse("subredditjsonproxy") + "?s=/r/test"
+    with patch("blossom.api.subreddit_rules.requests.get") as get:
+        get.side_effect = requests.Timeout()
+        first = client.get(url)
+        second = client.get(url)
+
+    get.assert_called_once()
+    assert first.status_code == 200
+    assert first.json() == {}
+    assert second.json() == {}
+
+    # Rules which have been cached before are kept when refreshing them fails
+    cache.set(CACHE_PREFIX + "test", (time.time() - 1, RULES), 60)
+    with patch("blossom.api.subreddit_rules.requests.get") as get:
+        get.side_effect = requests.ConnectionError()
+        subreddit_rules._refresh_rules("test", worker_test_mode=True)
+    fresh_until, rules = cache.get(CACHE_PREFIX + "test")
+    assert rules == RULES
+    assert fresh_until > time.time()
+
+
+@pytest.mark.parametrize(
+    "sub_name,expected",
+    [
+        ("/r/TranscribersOfReddit", "transcribersofreddit"),
+        ("/r/test/", "test"),
+        ("r/test", None),
+        ("/r/../api", None),
+        ("other source", None),
+    ],
+)
+def test_get_subreddit(sub_name: str, expected: str) -> None:
+    """Verify that only names of subreddits are looked up on Reddit."""
+    assert get_subreddit(sub_name) == expected
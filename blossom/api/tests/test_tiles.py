@@ -0,0 +1,170 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.conf import settings
+from django.test import Client
+from django.urls import reverse
+from pytest_django.fixtures import SettingsWrapper
+
+from blossom.api import tiles
+from blossom.api.image_cache import ImageCache
+from blossom.api.tiles import DZI_NAME, generate_tiles_in_background, get_image_url
+from blossom.app.views import update_context_with_proxy_data
+from blossom.utils.test_helpers import create_submission
+
+
+@pytest.fixture
+def tile_dir(settings: SettingsWrapper, tmp_path: Path) -> Path:
+    """Keep the tile pyramids in a temporary directory."""
+    settings.TILE_DIR = str(tmp_path)
+    return tmp_path
+
+
+def test_generate_pyramid(tmp_path: Path) -> None:
+    """Verify that the image is cut into a tile pyramid."""
+    image_module = pytest.importorskip("PIL.Image")
+    source = tmp_path / "source.png"
+    image_module.new("RGB", (600, 300), "white").save(source)
+
+    tiles.generate_pyramid(str(source), str(tmp_path / "1"))
+
+    dzi = (tmp_path / "1" / DZI_NAME).read_text()
+    assert 'Width="600"' in dzi and 'Height="300"' in dzi
+    levels = tmp_path / "1" / "image_files"
+    # 600 pixels wide takes ten halvings to get down to a single pixel
+    assert sorted(int(level.name) for level in levels.iterdir()) == list(range(11))
+    assert sorted(path.name for path in (levels / "10").iterdir()) == [
+        "0_0.jpg",
+        "0_1.jpg",
+        "1_0.jpg",
+        "1_1.jpg",
+        "2_0.jpg",
+        "2_1.jpg",
+    ]
+    with image_module.open(levels / "10" / "1_0.jpg") as tile:
+        # The tiles overlap their neighbours by a pixel on every side
+        assert tile.size == (256, 255)
+    assert [path.name for path in (levels / "0").iterdir()] == ["0_0.jpg"]
+
+
+def test_tile_view(client: Client, tile_dir: Path) -> None:
+    """Verify that the tiles of a submission are served."""
+    (tile_dir / "5" / "image_files" / "0").mkdir(parents=True)
+    (tile_dir / "5" / DZI_NAME).write_text("<Image/>")
+    (tile_dir / "5" / "image_files" / "0" / "0_0.jpg").write_bytes(b"tile")
+
+    dzi = client.get(reverse("tiles", args=[5, DZI_NAME]))
+    assert dzi.status_code == 200
+    assert dzi["Content-Type"] == "application/xml"
+    assert "max-age" in dzi["Cache-Control"]
+    tile = client.get(reverse("tiles", args=[5, "image_files/0/0_0.jpg"]))
+    assert b"".join(tile.streaming_content) == b"tile"
+    assert client.get(reverse("tiles", args=[6, DZI_NAME])).status_code == 404
+
+
+def test_update_context_with_tiles(tile_dir: Path) -> None:
+    """Verify that the viewer is pointed at the tiles once they have been generated."""
+    submission = create_submission(content_url="https://i.redd.it/abc.png")
+
+    with patch("blossom.app.views.generate_tiles_in_background") as generate:
+        context = update_context_with_proxy_data(submission, {})
+    generate.assert_called_once_with(submission)
+    assert "tiles_url" not in context
+    assert context["ireddit_content_url"] == "abc.png"
+
+    (tile_dir / str(submission.id)).mkdir()
+    (tile_dir / str(submission.id) / DZI_NAME).write_text("<Image/>")
+    with patch("blossom.app.views.generate_tiles_in_background") as generate:
+        context = update_context_with_proxy_data(submission, {})
+    generate.assert_not_called()
+    assert context["tiles_url"] == reverse("tiles", args=[submission.id, DZI_NAME])
+
+
+def test_generate_tiles_in_background(settings: SettingsWrapper, tile_dir: Path) -> None:
+    """Verify that the tiles of a submission are only generated once at a time."""
+    settings.ENABLE_TILES = True
+    image = create_submission(content_url="https://imgur.com/abc")
+    other = create_submission(original_id="other", content_url="https://example.com/page")
+
+    with patch.object(tiles, "Image", MagicMock()), patch.object(
+        tiles, "_generate_tiles"
+    ) as generate:
+        generate_tiles_in_background(image)
+        generate_tiles_in_background(image)
+        generate_tiles_in_background(other)
+
+    generate.assert_called_once_with(image.id, "https://imgur.com/abc")
+    tiles._finish(image.id)
+    assert not tiles._pending
+
+
+def test_get_image_url() -> None:
+    """Verify that the images are downloaded from the same URL as the proxy uses."""
+    assert get_image_url("https://i.redd.it/abc.png") == "https://i.redd.it/abc.png"
+    assert get_image_url("https://imgur.com/abc") == "https://imgur.com/abc.jpg"
+    assert get_image_url("https://i.imgur.com/abc.png") == "https://imgur.com/abc.png"
+    assert get_image_url("https://example.com/a.png") == "https://example.com/a.png"
+
+
+def test_fetch_image_not_an_image(tmp_path: Path) -> None:
+    """Verify that pages which are not images are not put into the image cache."""
+    response = MagicMock(headers={"Content-Type": "text/html"})
+    with patch("blossom.api.tiles.requests.get", return_value=response):
+        with pytest.raises(ValueError):
+            tiles.fetch_image("https://imgur.com/abc.jpg", ImageCache(tmp_path, 1000), 10)
+
+    assert not list(tmp_path.iterdir())
+
+
+def test_evict_tiles(settings: SettingsWrapper, tile_dir: Path) -> None:
+    """Verify that the least recently viewed pyramids are removed when there are too many."""
+    settings.TILE_DIR_MAX_BYTES = 25
+    for submission_id, used in ((1, 1000), (2, 2000), (3, 3000)):
+        (tile_dir / str(submission_id)).mkdir()
+        (tile_dir / str(submission_id) / DZI_NAME).write_bytes(b"0123456789")
+        os.utime(tile_dir / str(submission_id) / DZI_NAME, (used, used))
+    # A pyramid which is still being generated is left alone
+    (tile_dir / ".4-abc").mkdir()
+    (tile_dir / ".4-abc" / DZI_NAME).write_bytes(b"0123456789")
+    # Viewing the first pyramid makes the second one the least recently viewed
+    tiles.mark_used(1)
+
+    tiles.evict_tiles()
+
+    assert sorted(path.name for path in tile_dir.iterdir()) == [".4-abc", "1", "3"]
+
+
+def test_pool_job_without_django() -> None:
+    """Verify that the processes of the pool can load the job without setting up Django."""
+    env = {key: value for key, value in os.environ.items() if key != "DJANGO_SETTINGS_MODULE"}
+    result = subprocess.run(
+        [sys.executable, "-c", "from blossom.api.tiles import build_pyramid"],
+        cwd=settings.BASE_DIR.parent,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_build_pyramid_in_pool(tmp_path: Path) -> None:
+    """Verify that the pool downloads and cuts the image in a process of its own."""
+    image_module = pytest.importorskip("PIL.Image")
+    source = tmp_path / "source.png"
+    image_module.new("RGB", (20, 10), "white").save(source)
+    cache = ImageCache(tmp_path / "images", 10**6)
+    for _ in cache.store("https://i.redd.it/abc.png", [source.read_bytes()], "image/png"):
+        pass
+
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("forkserver")) as pool:
+        pool.submit(
+            tiles.build_pyramid, "https://i.redd.it/abc.png", cache, 10, str(tmp_path / "1")
+        ).result(timeout=60)
+
+    assert 'Width="20"' in (tmp_path / "1" / DZI_NAME).read_text()
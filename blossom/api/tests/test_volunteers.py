@@ -58,6 +58,27 @@ class TestVolunteerSummary:
 
         assert result.json()["gamma"] == 3
 
+    def test_summary_etag(self, client: Client) -> None:
+        """Verify that an unchanged summary is answered with a 304 response."""
+        client, headers, user = setup_user_client(client)
+        url = reverse("volunteer-summary") + f"?username={user.username}"
+        result = client.get(url, **headers)
+
+        assert result.status_code == status.HTTP_200_OK
+        etag = result["ETag"]
+
+        result = client.get(url, HTTP_IF_NONE_MATCH=etag, **headers)
+
+        assert result.status_code == status.HTTP_304_NOT_MODIFIED
+        assert result.content == b""
+
+        create_submission(completed_by=user)
+        result = client.get(url, HTTP_IF_NONE_MATCH=etag, **headers)
+
+        assert result.status_code == status.HTTP_200_OK
+        assert result.json()["gamma"] == 1
+        assert result["ETag"] != etag
+
 
 class TestVolunteerAssortedFunctions:
     """Tests to validate the behavior of miscellaneous functions."""
@@ -0,0 +1,260 @@
+"""Cut the images of submissions into Deep Zoom tile pyramids.
+
+OpenSeaDragon can only start drawing a plain image once it has downloaded all
+of it, which takes a while for large screenshots on mobile connections. With a
+Deep Zoom Image (DZI), it only loads the tiles it needs for the current view,
+starting with a few small ones of the whole image. The pyramids are generated
+in the background when submissions are created, by a pool of processes which
+download and cut the images, so neither the server nor its background worker
+is held up, and kept on local disk. Like the image cache, the
+pyramids which haven't been viewed for the longest time are removed once they
+take up more than TILE_DIR_MAX_BYTES.
+
+Tiling needs Pillow, which is an optional dependency (the `tiles` extra, which
+the Docker image and the shiv archive include); without it, the viewer simply
+gets the whole image.
+"""
+import logging
+import math
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Set
+from urllib.parse import urlparse
+
+import requests
+from django.conf import settings
+
+from blossom.api.image_cache import CHUNK_SIZE, ImageCache, get_image_cache
+
+if TYPE_CHECKING:
+    # The pool processes import this module without setting up Django
+    from blossom.api.models import Submission
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover
+    Image = None
+
+log = logging.getLogger(__name__)
+
+TILE_SIZE = 254
+TILE_OVERLAP = 1
+TILE_FORMAT = "jpg"
+
+# The file describing the pyramid of a submission; the tiles are next to it.
+DZI_NAME = "image.dzi"
+
+DZI_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<Image xmlns="http://schemas.microsoft.com/deepzoom/2008"
+       Format="{format}" Overlap="{overlap}" TileSize="{size}">
+    <Size Width="{width}" Height="{height}"/>
+</Image>
+"""
+
+# The submissions whose pyramid is being generated.
+_pending: Set[int] = set()
+_pending_lock = threading.Lock()
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_tile_dir(submission_id: int) -> Path:
+    """Get the directory with the tile pyramid of the submission."""
+    return Path(settings.TILE_DIR) / str(submission_id)
+
+
+def has_tiles(submission: "Submission") -> bool:
+    """Check whether the tile pyramid of the submission has been generated."""
+    return (get_tile_dir(submission.id) / DZI_NAME).exists()
+
+
+def mark_used(submission_id: int) -> None:
+    """Mark the tile pyramid of the submission as recently viewed."""
+    try:
+        os.utime(get_tile_dir(submission_id) / DZI_NAME)
+    except FileNotFoundError:
+        # Removed to make room for others in the meantime
+        pass
+
+
+def _get_size(directory: str) -> int:
+    size = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            try:
+                size += os.stat(os.path.join(root, name)).st_size
+            except FileNotFoundError:
+                pass
+    return size
+
+
+def evict_tiles() -> None:
+    """Remove the least recently viewed pyramids until the tiles are within their limit."""
+    pyramids = []
+    try:
+        entries = list(os.scandir(settings.TILE_DIR))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        # Pyramids which are still being generated are hidden
+        if entry.name.startswith(".") or not entry.is_dir():
+            continue
+        try:
+            used = os.stat(os.path.join(entry.path, DZI_NAME)).st_mtime
+        except FileNotFoundError:
+            continue
+        pyramids.append((used, _get_size(entry.path), entry.path))
+    total = sum(size for _, size, _ in pyramids)
+    for _, size, path in sorted(pyramids):
+        if total <= settings.TILE_DIR_MAX_BYTES:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+    log.debug(f"The tile pyramids take up {total} bytes.")
+
+
+def get_image_url(content_url: str) -> str:
+    """Get the URL that the image is proxied from, so the download can be shared."""
+    name = content_url.split("/")[-1]
+    host = urlparse(content_url).netloc
+    if host == "i.redd.it":
+        return f"https://i.redd.it/{name}"
+    if host.endswith("imgur.com"):
+        # Links to the Imgur post instead of directly to the image, see the app views
+        return f"https://imgur.com/{name if '.' in name else name + '.jpg'}"
+    return content_url
+
+
+def fetch_image(url: str, cache: ImageCache, timeout: float) -> Path:
+    """Get the path to the image, downloading it into the image cache if needed."""
+    if image := cache.get(url):
+        return image.path
+    response = requests.get(url, stream=True, timeout=timeout)
+    response.raise_for_status()
+    content_type = response.headers.get("Content-Type", "")
+    if not content_type.startswith("image/"):
+        # Don't let the image proxy serve a web page as the image
+        response.close()
+        raise ValueError(f"{url} is not an image but {content_type or 'unknown'}.")
+    for _ in cache.store(url, response.iter_content(CHUNK_SIZE), content_type):
+        pass
+    return cache.get(url).path
+
+
+def generate_pyramid(source: str, target: str) -> None:
+    """Cut the image into a Deep Zoom tile pyramid.
+
+    Every level is half the size of the next one, down to a single pixel;
+    the last level is the image at its full size. The pyramid is written
+    to a temporary directory first, so it only appears once it's complete.
+    This runs in a separate process, so it must not use Django.
+
+    :param source: the path to the image
+    :param target: the directory to write the `image.dzi` file and its tiles to
+    """
+    target_path = Path(target)
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    temp = Path(tempfile.mkdtemp(dir=target_path.parent, prefix=f".{target_path.name}-"))
+    try:
+        with Image.open(source) as original:
+            image = original.convert("RGB")
+        width, height = image.size
+        max_level = math.ceil(math.log2(max(width, height, 1)))
+        for level in range(max_level, -1, -1):
+            scale = 2 ** (max_level - level)
+            size = (math.ceil(width / scale), math.ceil(height / scale))
+            if image.size != size:
+                image = image.resize(size, Image.Resampling.LANCZOS)
+            level_dir = temp / "image_files" / str(level)
+            level_dir.mkdir(parents=True)
+            for column in range(math.ceil(size[0] / TILE_SIZE)):
+                for row in range(math.ceil(size[1] / TILE_SIZE)):
+                    left = max(column * TILE_SIZE - TILE_OVERLAP, 0)
+                    top = max(row * TILE_SIZE - TILE_OVERLAP, 0)
+                    right = min((column + 1) * TILE_SIZE + TILE_OVERLAP, size[0])
+                    bottom = min((row + 1) * TILE_SIZE + TILE_OVERLAP, size[1])
+                    tile = image.crop((left, top, right, bottom))
+                    tile.save(level_dir / f"{column}_{row}.{TILE_FORMAT}", quality=85)
+        (temp / DZI_NAME).write_text(
+            DZI_TEMPLATE.format(
+                format=TILE_FORMAT,
+                overlap=TILE_OVERLAP,
+                size=TILE_SIZE,
+                width=width,
+                height=height,
+            )
+        )
+        try:
+            os.rename(temp, target_path)
+        except OSError:
+            if not (target_path / DZI_NAME).exists():
+                raise
+    finally:
+        # Either something went wrong or another process was faster
+        shutil.rmtree(temp, ignore_errors=True)
+
+
+def build_pyramid(url: str, cache: ImageCache, timeout: float, target: str) -> None:
+    """Download the image and cut it into a tile pyramid, in a process of the pool.
+
+    Like `generate_pyramid`, this must not use Django, so everything it needs
+    from the settings is passed in.
+    """
+    generate_pyramid(str(fetch_image(url, cache, timeout)), target)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # Forking the server, which runs several threads by then, could copy a
+        # lock that one of them holds into the new process, which would hang.
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.TILE_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _pool
+
+
+def generate_tiles_in_background(submission: "Submission") -> None:
+    """Generate the tile pyramid of the image of the submission in the background."""
+    if not settings.ENABLE_TILES or Image is None:
+        return
+    if not submission.is_image or has_tiles(submission):
+        return
+    with _pending_lock:
+        if submission.id in _pending:
+            return
+        _pending.add(submission.id)
+    _generate_tiles(submission.id, submission.content_url)
+
+
+def _generate_tiles(submission_id: int, content_url: str) -> None:
+    try:
+        future = _get_pool().submit(
+            build_pyramid,
+            get_image_url(content_url),
+            get_image_cache(),
+            settings.IMAGE_CACHE_UPSTREAM_TIMEOUT,
+            str(get_tile_dir(submission_id)),
+        )
+    except Exception:
+        _finish(submission_id)
+        raise
+    future.add_done_callback(partial(_finish, submission_id))
+
+
+def _finish(submission_id: int, future: Optional[Future] = None) -> None:
+    with _pending_lock:
+        _pending.discard(submission_id)
+    if future is None:
+        return
+    if error := future.exception():
+        log.error(f"Could not generate the tiles of submission {submission_id}: {error!r}")
+    else:
+        log.info(f"Generated the tiles of submission {submission_id}.")
+        evict_tiles()
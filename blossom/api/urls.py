@@ -9,6 +9,7 @@ from drf_yasg.views import get_schema_view
 from rest_framework import permissions, routers
 
 from blossom.api.views import (
+    changes,
     find,
     misc,
     plausible,
@@ -73,6 +74,7 @@ urlpatterns = [
     url(r"", include(router.urls)),
     url(r"^summary/", misc.SummaryView.as_view(), name="summary"),
     url(r"^find/", find.FindView.as_view(), name="find"),
+    url(r"^changes/", changes.ChangesView.as_view(), name="changes"),
     url(
         r"^swagger(?P<format>\.json|\.yaml)$",
         schema_view.without_ui(cache_timeout=0),
@@ -85,6 +87,7 @@ urlpatterns = [
     ),
     url(r"^redoc/$", schema_view.with_ui("redoc", cache_timeout=0), name="schema-redoc"),
     url(r"^ping/", misc.PingView.as_view(), name="ping"),
+    url(r"^token/", misc.TokenView.as_view(), name="token"),
     path("slack/endpoint/", slack.slack_endpoint, name="slack"),
     path(
         "slack/github/sponsors/",
@@ -97,6 +100,7 @@ urlpatterns = [
         name="iredditproxy",
     ),
     url(r"^imgurproxy/(?P<path>.*)$", proxy.ImgurProxyView.as_view(), name="imgurproxy"),
+    path("tiles/<int:submission_id>/<path:path>", proxy.tile_view, name="tiles"),
     path(
         "subredditjsonproxy/",
         proxy.subreddit_json_proxy_view,
@@ -0,0 +1,154 @@
+"""Views that allow consumers to follow the changes to the data incrementally."""
+import base64
+import json
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+from django.db import connection
+from django.db.models import Model, Prefetch, Q, QuerySet
+from django.db.models.expressions import RawSQL
+from django.views.decorators.csrf import csrf_exempt
+from drf_yasg.openapi import Parameter, Schema
+from drf_yasg.openapi import Response as DocResponse
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import serializers, status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from blossom.api.models import Submission, Transcription
+from blossom.api.serializers import SubmissionSerializer, TranscriptionSerializer
+
+# A cursor position: the change number and ID of the last returned object.
+Position = Tuple[int, int]
+
+
+def _get_submissions() -> QuerySet:
+    # The transcriptions are part of the serialized submissions
+    return Submission.objects.prefetch_related(
+        Prefetch("transcription_set", queryset=Transcription.objects.select_related("author"))
+    )
+
+
+FEEDS: Dict[str, Tuple[Callable[[], QuerySet], Type[serializers.Serializer]]] = {
+    "submissions": (_get_submissions, SubmissionSerializer),
+    "transcriptions": (Transcription.objects.all, TranscriptionSerializer),
+}
+
+
+def encode_cursor(positions: Dict[str, Optional[Position]]) -> str:
+    """Encode the positions in the feeds as an opaque cursor."""
+    data = {feed: list(position) if position else None for feed, position in positions.items()}
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Dict[str, Optional[Position]]:
+    """Decode the positions in the feeds from the cursor.
+
+    An empty cursor starts at the beginning of every feed.
+
+    :raise ValueError: when the cursor is invalid
+    """
+    if not cursor:
+        return {feed: None for feed in FEEDS}
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        positions = {}
+        for feed in FEEDS:
+            if data.get(feed) is None:
+                positions[feed] = None
+                continue
+            change_number, object_id = data[feed]
+            positions[feed] = (int(change_number), int(object_id))
+        return positions
+    except (TypeError, KeyError, AttributeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor.") from e
+
+
+def get_changes(
+    queryset: QuerySet, position: Optional[Position], limit: int
+) -> Tuple[List[Model], Optional[Position]]:
+    """Get the objects of the queryset which have changed after the position.
+
+    The objects are ordered by their change number and ID, so every object
+    that changes after the position is returned in a later batch, even when
+    several objects have the same change number. On Postgres, the change
+    numbers of concurrent transactions aren't in the order in which they
+    commit (see `ChangeNumber`), so changes are held back until every
+    transaction with a lower number has finished.
+
+    :return: the changed objects and the position of the last one
+    """
+    if connection.vendor == "postgresql":
+        # Every transaction before the oldest one in progress has finished
+        queryset = queryset.filter(
+            change_number__lt=RawSQL("txid_snapshot_xmin(txid_current_snapshot())", [])
+        )
+    if position is not None:
+        change_number, object_id = position
+        queryset = queryset.filter(
+            Q(change_number__gt=change_number) | Q(change_number=change_number, id__gt=object_id)
+        )
+    objects = list(queryset.order_by("change_number", "id")[:limit])
+    if objects:
+        position = (objects[-1].change_number, objects[-1].id)
+    return objects, position
+
+
+class ChangesView(APIView):
+    """A view to retrieve the submissions and transcriptions that have changed."""
+
+    @csrf_exempt
+    @swagger_auto_schema(
+        manual_parameters=[
+            Parameter("since", "query", type="string"),
+            Parameter("limit", "query", type="integer"),
+        ],
+        responses={
+            200: DocResponse(
+                "The changed objects and the cursor to continue from",
+                schema=Schema(
+                    type="object",
+                    properties={
+                        "submissions": Schema(type="array", items=Schema(type="object")),
+                        "transcriptions": Schema(type="array", items=Schema(type="object")),
+                        "cursor": Schema(type="string"),
+                        "has_more": Schema(type="boolean"),
+                    },
+                ),
+            ),
+            400: "The cursor or the limit is invalid.",
+        },
+    )
+    def get(self, request: Request, *args: object, **kwargs: object) -> Response:
+        """Get the submissions and transcriptions that changed since the cursor.
+
+        Without a cursor, all objects are returned from the start. Every response
+        contains the cursor to pass as `since` to the next request, which returns
+        the objects that have changed since then. Up to `limit` objects are
+        returned per type (100 by default, at most 1000); when `has_more` is
+        set, more changes are available right away.
+
+        Note that objects are returned again when they change again and that
+        deleted objects are not reported.
+        """
+        try:
+            positions = decode_cursor(request.query_params.get("since"))
+            limit = int(request.query_params.get("limit", 100))
+        except ValueError as e:
+            return Response(str(e), status=status.HTTP_400_BAD_REQUEST)
+        if not 0 < limit <= 1000:
+            return Response(
+                "The limit has to be between 1 and 1000.", status=status.HTTP_400_BAD_REQUEST
+            )
+
+        data = {}
+        has_more = False
+        for feed, (get_queryset, serializer_class) in FEEDS.items():
+            objects, positions[feed] = get_changes(get_queryset(), positions[feed], limit)
+            data[feed] = serializer_class(objects, many=True, context={"request": request}).data
+            has_more = has_more or len(objects) == limit
+
+        return Response(
+            {**data, "cursor": encode_cursor(positions), "has_more": has_more},
+            status=status.HTTP_200_OK,
+        )
@@ -3,6 +3,8 @@ import datetime
 from typing import Dict
 
 import pytz
+from django.conf import settings
+from django.db.models import Count, Max, Min, Q
 from django.views.decorators.csrf import csrf_exempt
 from drf_yasg.openapi import Response as DocResponse
 from drf_yasg.openapi import Schema
@@ -13,9 +15,19 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from blossom.api.authentication import AdminApiKeyCustomCheck
-from blossom.api.helpers import get_time_since_open
+from blossom.api.authentication import (
+    AdminApiKeyCustomCheck,
+    ApiKeyCustomHeaderCheck,
+    FailedLoginThrottle,
+)
+from blossom.api.helpers import (
+    conditional_etag,
+    get_time_since_open,
+    make_etag,
+    validate_request,
+)
 from blossom.api.models import Submission
+from blossom.authentication.backends import EmailBackend, create_api_token
 from blossom.authentication.models import BlossomUser
 
 
@@ -48,6 +60,23 @@ class Summary(object):
         }
 
 
+def _summary_etag(view: APIView, request: Request, *args: object, **kwargs: object) -> str:
+    """Compute the ETag of the summary without running the counts themselves.
+
+    New volunteers and transcriptions bump the maximum IDs and update times,
+    while the earliest completion in the active window changes as soon as it
+    falls out of the window. Deletions are picked up with the next change.
+    """
+    date_minus_two_weeks = datetime.datetime.now(tz=pytz.utc) - datetime.timedelta(weeks=2)
+    users = BlossomUser.objects.aggregate(count=Count("id"), last_update=Max("last_update_time"))
+    submissions = Submission.objects.aggregate(
+        last_id=Max("id"),
+        last_update=Max("last_update_time"),
+        first_active=Min("complete_time", filter=Q(complete_time__gte=date_minus_two_weeks)),
+    )
+    return make_etag(get_time_since_open(days=True), *users.values(), *submissions.values())
+
+
 class SummaryView(APIView):
     """A view to request the summary of statistics."""
 
@@ -66,11 +95,16 @@ class SummaryView(APIView):
                         "days_since_inception": Schema(type="int"),
                     },
                 ),
-            )
+            ),
+            304: "The summary has not changed since the given ETag.",
         }
     )
+    @conditional_etag(_summary_etag)
     def get(self, request: Request, *args: object, **kwargs: object) -> Response:
-        """Get a summary of statistics on volunteers and transcriptions."""
+        """Get a summary of statistics on volunteers and transcriptions.
+
+        Supports conditional requests through the ETag and If-None-Match headers.
+        """
         return Response(data=Summary().generate_summary(), status=status.HTTP_200_OK)
 
 
@@ -91,3 +125,71 @@ class PingView(APIView):
     def get(self, request: Request, *args: object, **kwargs: object) -> Response:
         """Ping the server."""
         return Response({"ping?!": "PONG"}, status=status.HTTP_200_OK)
+
+
+class TokenView(APIView):
+    """View to exchange the email and password of a user for an API token.
+
+    The API key has to be sent in the "X-Api-Key" header, so passwords can't
+    be checked without one, and failed logins are throttled.
+    """
+
+    permission_classes = (ApiKeyCustomHeaderCheck,)
+    authentication_classes = ()
+    throttle_classes = (FailedLoginThrottle,)
+    throttle_scope = "token"
+
+    def get_throttles(self) -> list:
+        """Keep the throttles of the request, so failed logins can be recorded."""
+        self.throttles = super().get_throttles()
+        return self.throttles
+
+    @csrf_exempt
+    @swagger_auto_schema(
+        request_body=Schema(
+            type="object",
+            required=["email", "password"],
+            properties={
+                "email": Schema(type="string"),
+                "password": Schema(type="string"),
+            },
+        ),
+        responses={
+            200: DocResponse(
+                "The token and the number of seconds for which it is valid",
+                schema=Schema(
+                    type="object",
+                    properties={
+                        "token": Schema(type="string"),
+                        "expires_in": Schema(type="integer"),
+                    },
+                ),
+            ),
+            400: "The email or password is missing.",
+            401: "The email or password is incorrect.",
+            403: "The API key is missing or invalid.",
+            429: "There have been too many failed logins.",
+        },
+    )
+    @validate_request(data_params={"email", "password"})
+    def post(
+        self, request: Request, email: str = None, password: str = None, **kwargs: object
+    ) -> Response:
+        """Log in with the email and password to retrieve an API token.
+
+        The token can be sent along with later requests in the header
+        "Authorization: Bearer <token>", so the password does not have to be
+        verified on every request. The API key is then sent in the "X-Api-Key"
+        header. Request a new token when the old one expires.
+        """
+        user = EmailBackend().authenticate(username=email, password=password)
+        if user is None or not user.is_active:
+            for throttle in self.throttles:
+                throttle.record_failure()
+            return Response(
+                {"detail": "Incorrect email or password."}, status=status.HTTP_401_UNAUTHORIZED
+            )
+        return Response(
+            {"token": create_api_token(user), "expires_in": settings.API_TOKEN_MAX_AGE},
+            status=status.HTTP_200_OK,
+        )
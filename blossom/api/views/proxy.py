@@ -1,18 +1,69 @@
-import random
-import string
-
 import requests
-from django.http import HttpRequest, JsonResponse
+from django.conf import settings
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotFound,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.views.decorators.csrf import csrf_exempt
+from django.views.static import serve
 from revproxy.views import ProxyView
 
+from blossom.api.image_cache import CHUNK_SIZE, get_image_cache, serve_image
+from blossom.api.subreddit_rules import get_rules, get_subreddit
+from blossom.api.tiles import DZI_NAME, get_tile_dir, mark_used
+
 
-def generate_request_id() -> str:
-    """Create a random 6-digit string to make Reddit's user-agent guard happy."""
-    return "".join([random.choice(string.ascii_lowercase) for _ in range(6)])
+class CachedImageProxyView(ProxyView):
+    """Proxy for images which keeps them on disk, see `blossom.api.image_cache`.
 
+    Only GET and HEAD requests are cached; anything else is passed on as is.
+    """
 
-class iReddItProxyView(ProxyView):  # noqa: N801
+    def dispatch(self, request: HttpRequest, path: str) -> HttpResponse:
+        """Serve the image from the cache, downloading it first if needed."""
+        if request.method not in ("GET", "HEAD"):
+            return super().dispatch(request, path)
+
+        url = self.get_upstream(path) + path
+        if query := request.META.get("QUERY_STRING"):
+            url += f"?{query}"
+        cache = get_image_cache()
+        if image := cache.get(url):
+            return serve_image(request, image)
+
+        try:
+            upstream = requests.get(url, stream=True, timeout=settings.IMAGE_CACHE_UPSTREAM_TIMEOUT)
+        except requests.Timeout:
+            return HttpResponse(status=504)
+        except requests.RequestException:
+            return HttpResponse(status=502)
+        content_type = upstream.headers.get("Content-Type", "")
+        chunks = upstream.iter_content(CHUNK_SIZE)
+        if upstream.status_code != 200 or not content_type.startswith("image/"):
+            # Error pages and the like are not worth keeping
+            return StreamingHttpResponse(
+                chunks, status=upstream.status_code, content_type=content_type or None
+            )
+
+        stored = cache.store(url, chunks, content_type)
+        if "Range" in request.headers:
+            # Only part of the image was asked for, so the download can't be passed on
+            for _ in stored:
+                pass
+            return serve_image(request, cache.get(url))
+
+        response = StreamingHttpResponse(stored, content_type=content_type)
+        if length := upstream.headers.get("Content-Length"):
+            response["Content-Length"] = length
+        response["Cache-Control"] = f"public, max-age={settings.IMAGE_CACHE_MAX_AGE}"
+        return response
+
+
+class iReddItProxyView(CachedImageProxyView):  # noqa: N801
     """Retrieve images for OpenSeaDragon from Reddit's image host.
 
     Reddit does not set the appropriate CORS headers on their image host so that
@@ -37,27 +88,34 @@ class iReddItProxyView(ProxyView):  # noqa: N801
     upstream = "https://i.redd.it/"
 
 
-class ImgurProxyView(ProxyView):
+class ImgurProxyView(CachedImageProxyView):
     """Proxy for retrieving images from Imgur."""
 
     upstream = "https://imgur.com"
 
 
+def tile_view(request: HttpRequest, submission_id: int, path: str) -> HttpResponse:
+    """Serve the Deep Zoom tile pyramid of a submission, see `blossom.api.tiles`."""
+    try:
+        response = serve(request, path, document_root=get_tile_dir(submission_id))
+    except Http404:
+        # Not the error page of the website, as the viewer would take it for a tile
+        return HttpResponseNotFound()
+    if path == DZI_NAME:
+        response["Content-Type"] = "application/xml"
+        mark_used(submission_id)
+    response["Cache-Control"] = f"public, max-age={settings.IMAGE_CACHE_MAX_AGE}"
+    return response
+
+
 @csrf_exempt
 def subreddit_json_proxy_view(request: HttpRequest) -> JsonResponse:
-    """Proxy for retrieving information from Reddit about subreddits."""
+    """Proxy for the rules of subreddits, see `blossom.api.subreddit_rules`."""
     if sub_name := request.GET.get("s"):
-        if not sub_name.startswith("/r/"):
-            # it's a source, but it's not a source from Reddit. We'll handle these
-            # eventually, but for now just return an empty response.
-            return JsonResponse({})
-
-        request_id = generate_request_id()
-        headers = {"User-Agent": f"Python:Blossom:ID:{request_id} - contact u/itsthejoker"}
-        response = requests.get(
-            f"https://www.reddit.com{sub_name}/about/rules.json", headers=headers
-        )
-        response.raise_for_status()
-        return JsonResponse(response.json())
+        if subreddit := get_subreddit(sub_name):
+            return JsonResponse(get_rules(subreddit))
+        # it's a source, but it's not a source from Reddit. We'll handle these
+        # eventually, but for now just return an empty response.
+        return JsonResponse({})
     # the request came in malformed -- just say everything's fine.
     return JsonResponse({})
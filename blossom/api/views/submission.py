@@ -3,10 +3,11 @@ import datetime
 import logging
 from collections import OrderedDict
 from datetime import timedelta
-from typing import Union
+from typing import List, Optional, Union
 
 from django.conf import settings
-from django.db.models import Count, F, Value
+from django.db import connection, transaction
+from django.db.models import Count, F, Max, Q, QuerySet, Value
 from django.db.models.functions import (
     ExtractHour,
     ExtractIsoWeekDay,
@@ -21,7 +22,6 @@ from django.db.models.functions import (
     TruncWeek,
     TruncYear,
 )
-from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.utils.decorators import method_decorator
@@ -37,8 +37,20 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from blossom.api.authentication import BlossomApiPermission
-from blossom.api.helpers import validate_request
-from blossom.api.models import Source, Submission, Transcription, TranscriptionCheck
+from blossom.api.enrichment import enrich_in_background
+from blossom.api.helpers import (
+    conditional_etag,
+    get_user_or_404,
+    make_etag,
+    validate_request,
+)
+from blossom.api.models import (
+    ChangeNumber,
+    Source,
+    Submission,
+    Transcription,
+    TranscriptionCheck,
+)
 from blossom.api.pagination import StandardResultsSetPagination
 from blossom.api.serializers import SubmissionSerializer
 from blossom.api.slack import client as slack
@@ -48,8 +60,10 @@ from blossom.api.slack.actions.report import (
     update_submission_report,
 )
 from blossom.api.slack.transcription_check.messages import send_check_message
+from blossom.api.tiles import generate_tiles_in_background
 from blossom.api.views.volunteer import VolunteerViewSet
 from blossom.authentication.models import BlossomUser
+from blossom.utils.notifications import wait_for_work
 
 # The maximum number of posts a user can claim
 # depending on their current gamma score
@@ -97,6 +111,108 @@ def _get_limit_value(request: Request, default: int = 10) -> Union[int, None]:
             return default
 
 
+def _get_wait_value(request: Request, value: object) -> float:
+    """Retrieve the number of seconds to wait for new work when there is none.
+
+    The value is limited to the LONG_POLL_MAX_WAIT setting; invalid values
+    mean that the request doesn't wait at all. Neither do requests to servers
+    which handle a single request per worker at a time, such as the default
+    sync workers of gunicorn, as a waiting request would block the worker
+    for everyone else. Threaded or gevent workers report that they handle
+    requests concurrently through `wsgi.multithread`.
+    """
+    if not request.META.get("wsgi.multithread"):
+        return 0
+    try:
+        wait = float(value or 0)
+    except (ValueError, TypeError):
+        return 0
+    return min(wait, settings.LONG_POLL_MAX_WAIT) if wait > 0 else 0
+
+
+def _lease_transcriptions(queryset: QuerySet, limit: int, expiry: datetime.datetime) -> List[int]:
+    """Lease up to the given number of transcriptions until the given time.
+
+    When the database supports it, the candidates are locked with
+    `SELECT ... FOR UPDATE SKIP LOCKED`, so concurrent workers skip each other's
+    rows instead of waiting for them or receiving the same ones. Otherwise
+    (SQLite), every candidate is leased through a conditional update, which
+    only succeeds for the worker that is the first to lease it.
+
+    :param queryset: the transcriptions which are available to be leased
+    :param limit: the maximum number of transcriptions to lease
+    :param expiry: the time until which the transcriptions are leased
+    :return: the IDs of the leased transcriptions
+    """
+    now = timezone.now()
+    available = Q(ocr_lease_expiry__isnull=True) | Q(ocr_lease_expiry__lt=now)
+    queryset = queryset.filter(available).order_by("id")
+    features = connection.features
+
+    with transaction.atomic():
+        if features.has_select_for_update_skip_locked and features.has_select_for_update_of:
+            ids = list(
+                queryset.select_for_update(skip_locked=True, of=("self",)).values_list(
+                    "id", flat=True
+                )[:limit]
+            )
+            Transcription.objects.filter(id__in=ids).update(ocr_lease_expiry=expiry)
+            return ids
+
+        return [
+            transcription_id
+            for transcription_id in queryset.values_list("id", flat=True)[:limit]
+            if Transcription.objects.filter(available, id=transcription_id).update(
+                ocr_lease_expiry=expiry
+            )
+        ]
+
+
+def _get_etag_state(queryset: QuerySet) -> QuerySet:
+    """Get the values which determine the ETag of the given submissions.
+
+    The transcriptions are part of the serialized submissions (through
+    `transcription_set` and `has_ocr_transcription`), so their count and last
+    update are included as well.
+    """
+    return queryset.annotate(
+        transcription_count=Count("transcription"),
+        transcription_update=Max("transcription__last_update_time"),
+    ).values_list("id", "last_update_time", "transcription_count", "transcription_update")
+
+
+def _retrieve_etag(
+    view: viewsets.ViewSet, request: Request, pk: str = None, **kwargs: object
+) -> Optional[str]:
+    """Compute the ETag of a single submission, if it exists."""
+    try:
+        state = list(_get_etag_state(Submission.objects.filter(id=pk)))
+    except (TypeError, ValueError):
+        return None
+    return make_etag(*state) if state else None
+
+
+def _get_in_progress_queryset(source: Union[Source, str], hours: int) -> QuerySet:
+    """Get the submissions that have been in progress for more than the given hours."""
+    delay_time = timezone.now() - timedelta(hours=hours)
+    return Submission.objects.filter(
+        queue_state=Submission.QueueState.CLAIMED,
+        claim_time__lt=delay_time,
+        source=source,
+    ).order_by("id")
+
+
+def _in_progress_etag(
+    view: viewsets.ViewSet, request: Request, source: str = None
+) -> Optional[str]:
+    """Compute the ETag of the in progress submissions."""
+    try:
+        hours = int(request.query_params.get("hours", 4))
+    except ValueError:
+        return None
+    return make_etag(*_get_etag_state(_get_in_progress_queryset(source, hours))[:100])
+
+
 @method_decorator(
     name="list",
     decorator=swagger_auto_schema(
@@ -148,6 +264,7 @@ class SubmissionViewSet(viewsets.ModelViewSet):
         "content_url": ["exact", "isnull"],
         "redis_id": ["exact", "isnull"],
         "removed_from_queue": ["exact"],
+        "queue_state": ["exact"],
         "feed": ["exact", "iexact", "icontains", "isnull"],
     }
     ordering_fields = [
@@ -159,6 +276,16 @@ class SubmissionViewSet(viewsets.ModelViewSet):
         "complete_time",
     ]
 
+    @conditional_etag(_retrieve_etag)
+    def retrieve(self, request: Request, *args: object, **kwargs: object) -> Response:
+        """Get the submission with the specified ID.
+
+        Supports conditional requests; the response contains an ETag and
+        passing it back in the If-None-Match header results in an empty 304
+        response when the submission has not changed since.
+        """
+        return super().retrieve(request, *args, **kwargs)
+
     @csrf_exempt
     @swagger_auto_schema(
         manual_parameters=[
@@ -194,12 +321,9 @@ class SubmissionViewSet(viewsets.ModelViewSet):
                 return Response(status=status.HTTP_400_BAD_REQUEST)
         source_obj = get_object_or_404(Source, pk=source)
         queryset = Submission.objects.filter(
-            completed_by=None,
-            claimed_by=None,
+            queue_state=Submission.QueueState.UNCLAIMED,
             create_time__lt=delay_time,
-            archived=False,
             source=source_obj,
-            removed_from_queue=False,
         )
         return Response(self.get_serializer(queryset[:100], many=True).data)
 
@@ -209,10 +333,12 @@ class SubmissionViewSet(viewsets.ModelViewSet):
         required=["source"],
         responses={
             200: DocResponse("Successful operation", schema=serializer_class),
+            304: "The submissions have not changed since the given ETag.",
             400: "The hour provided is invalid.",
         },
     )
     @validate_request(query_params={"source"})
+    @conditional_etag(_in_progress_etag)
     @action(detail=False, methods=["get"])
     def in_progress(self, request: Request, source: str = None) -> Response:
         """Return all old submissions that are still in progress.
@@ -221,23 +347,17 @@ class SubmissionViewSet(viewsets.ModelViewSet):
         to complete them. This function accepts a query string of `hours` that
         can be used to adjust the amount of time that is considered before returning
         a submission that is still in progress. Default is four hours.
+
+        Supports conditional requests through the ETag and If-None-Match headers.
         """
         hours = request.query_params.get("hours", 4)
         try:
             hours = int(hours)
-            delay_time = timezone.now() - timedelta(hours=hours)
         except ValueError:
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
         source_obj = get_object_or_404(Source, pk=source)
-        queryset = Submission.objects.filter(
-            completed_by=None,
-            claimed_by__isnull=False,
-            claim_time__lt=delay_time,
-            archived=False,
-            source=source_obj,
-            removed_from_queue=False,
-        )
+        queryset = _get_in_progress_queryset(source_obj, hours)
         return Response(self.get_serializer(queryset[:100], many=True).data)
 
     @csrf_exempt
@@ -256,9 +376,8 @@ class SubmissionViewSet(viewsets.ModelViewSet):
         source_obj = get_object_or_404(Source, pk=source)
         delay_time = timezone.now() - timedelta(hours=settings.ARCHIVIST_COMPLETED_DELAY_TIME)
         queryset = Submission.objects.filter(
-            completed_by__isnull=False,
+            queue_state=Submission.QueueState.COMPLETED,
             complete_time__lt=delay_time,
-            archived=False,
             source=source_obj,
         )
         return Response(data=self.get_serializer(queryset[:100], many=True).data)
@@ -437,7 +556,7 @@ class SubmissionViewSet(viewsets.ModelViewSet):
         The volunteer is specified in the HTTP body.
         """
         submission = get_object_or_404(Submission, id=pk)
-        user = get_object_or_404(BlossomUser, username=username)
+        user = get_user_or_404(username)
 
         if user.blocked:
             return Response(status=status.HTTP_423_LOCKED)
@@ -478,9 +597,14 @@ class SubmissionViewSet(viewsets.ModelViewSet):
         """Claim the specified submission from the specified volunteer.
 
         The volunteer is specified in the HTTP body.
+
+        The claim is made through a conditional update which only succeeds
+        while the submission is unclaimed, so concurrent claims can't both
+        succeed. The row of the volunteer is locked while their claims are
+        counted, so their maximum number of claims can't be exceeded either.
         """
         submission = get_object_or_404(Submission, id=pk)
-        user = get_object_or_404(BlossomUser, username=username)
+        user = get_user_or_404(username)
 
         if user.blocked:
             return Response(status=status.HTTP_423_LOCKED)
@@ -488,39 +612,59 @@ class SubmissionViewSet(viewsets.ModelViewSet):
         if not user.accepted_coc:
             return Response(status=status.HTTP_403_FORBIDDEN)
 
-        if submission.claimed_by is not None:
-            return Response(
-                data=VolunteerViewSet.serializer_class(
-                    submission.claimed_by, context={"request": request}
-                ).data,
-                status=status.HTTP_409_CONFLICT,
-            )
-
-        # Determine how many submissions the user has already claimed
-        claimed_submissions = Submission.objects.filter(
-            claimed_by=user, archived=False, completed_by__isnull=True
-        )
-        claimed_count = claimed_submissions.count()
-
-        for claim_restriction in reversed(MAX_CLAIMS):
-            if user.gamma >= claim_restriction["gamma"]:
-                if claimed_count >= claim_restriction["claims"]:
-                    # The user has already claimed too many submissions
-                    return Response(
-                        data=self.get_serializer(
-                            claimed_submissions, context={"request": request}, many=True
-                        ).data,
-                        status=460,
-                    )
-                break
-
-        submission.claimed_by = user
-        submission.claim_time = timezone.now()
-        submission.save()
+        if submission.claimed_by is None:
+            with transaction.atomic():
+                # Serialize the claims of the volunteer until the claim is made
+                BlossomUser.objects.select_for_update().get(id=user.id)
+                # Determine how many submissions the user has already claimed
+                claimed_submissions = Submission.objects.filter(
+                    claimed_by=user, archived=False, completed_by__isnull=True
+                )
+                claimed_count = claimed_submissions.count()
+
+                # Every volunteer may claim at least this many posts, so their
+                # gamma only has to be computed once they have claimed as many.
+                if claimed_count >= MAX_CLAIMS[0]["claims"]:
+                    gamma = user.gamma
+                    for claim_restriction in reversed(MAX_CLAIMS):
+                        if gamma >= claim_restriction["gamma"]:
+                            if claimed_count >= claim_restriction["claims"]:
+                                # The user has already claimed too many submissions
+                                return Response(
+                                    data=self.get_serializer(
+                                        claimed_submissions,
+                                        context={"request": request},
+                                        many=True,
+                                    ).data,
+                                    status=460,
+                                )
+                            break
+
+                now = timezone.now()
+                claimed = Submission.objects.filter(id=pk, claimed_by__isnull=True).update(
+                    claimed_by=user,
+                    claim_time=now,
+                    last_update_time=now,
+                    change_number=ChangeNumber(Submission),
+                    queue_state=Submission.get_queue_state_expression(claimed=True),
+                )
+
+            if claimed:
+                submission.claimed_by = user
+                submission.claim_time = submission.last_update_time = now
+                submission.refresh_from_db(fields=["queue_state"])
+                return Response(
+                    status=status.HTTP_201_CREATED,
+                    data=self.serializer_class(submission, context={"request": request}).data,
+                )
+            # Someone else claimed the submission in the meantime
+            submission.refresh_from_db()
 
         return Response(
-            status=status.HTTP_201_CREATED,
-            data=self.serializer_class(submission, context={"request": request}).data,
+            data=VolunteerViewSet.serializer_class(
+                submission.claimed_by, context={"request": request}
+            ).data,
+            status=status.HTTP_409_CONFLICT,
         )
 
     @csrf_exempt
@@ -557,7 +701,7 @@ class SubmissionViewSet(viewsets.ModelViewSet):
         Slack for the random check of this transcription.
         """
         submission = get_object_or_404(Submission, id=pk)
-        user: BlossomUser = get_object_or_404(BlossomUser, username=username)
+        user: BlossomUser = get_user_or_404(username)
 
         if user.blocked:
             return Response(status=status.HTTP_423_LOCKED)
@@ -586,10 +730,29 @@ class SubmissionViewSet(viewsets.ModelViewSet):
             if transcription is None:
                 return Response(status=status.HTTP_428_PRECONDITION_REQUIRED)
 
-        # At this point everything looks good, award the user their gamma
+        # At this point everything looks good, award the user their gamma.
+        # This only succeeds if the submission is still claimed (by the user)
+        # and hasn't been completed concurrently in the meantime.
+        now = timezone.now()
+        completable = Submission.objects.filter(
+            id=pk, completed_by__isnull=True, claimed_by__isnull=False
+        )
+        if not mod_override:
+            completable = completable.filter(claimed_by=user)
         submission.completed_by = user
-        submission.complete_time = timezone.now()
-        submission.save()
+        submission.complete_time = submission.last_update_time = now
+        if not completable.update(
+            completed_by=user,
+            complete_time=now,
+            last_update_time=now,
+            change_number=ChangeNumber(Submission),
+            queue_state=Submission.get_queue_state_expression(completed=True),
+        ):
+            submission.refresh_from_db()
+            if submission.completed_by is not None:
+                return Response(status=status.HTTP_409_CONFLICT)
+            return Response(status=status.HTTP_412_PRECONDITION_FAILED)
+        submission.refresh_from_db(fields=["queue_state"])
 
         # Send the transcription to Slack if necessary
         if transcription is not None and user.should_check_transcription():
@@ -644,6 +807,8 @@ class SubmissionViewSet(viewsets.ModelViewSet):
         """Create a new submission.
 
         Note that both the original id, source, and content_url should be supplied.
+        When no title is supplied, the title and NSFW flag are fetched from Reddit
+        in the background.
         """
         source_obj = get_object_or_404(Source, pk=source)
         url = request.data.get("url")
@@ -662,6 +827,9 @@ class SubmissionViewSet(viewsets.ModelViewSet):
             nsfw=nsfw,
             title=title,
         )
+        if not title:
+            enrich_in_background([submission.id])
+        generate_tiles_in_background(submission)
 
         return Response(
             status=status.HTTP_201_CREATED,
@@ -670,14 +838,19 @@ class SubmissionViewSet(viewsets.ModelViewSet):
 
     @csrf_exempt
     @swagger_auto_schema(
+        manual_parameters=[
+            Parameter("source", "query", type="string"),
+            Parameter("limit", "query", type="string"),
+            Parameter("wait", "query", type="number"),
+        ],
         responses={
             200: DocResponse("Successful operation", schema=serializer_class),
             400: "Required parameters not provided",
-        }
+        },
     )
     @validate_request(query_params={"source"})
     @action(detail=False, methods=["get"])
-    def get_transcribot_queue(self, request: Request, source: str = None) -> JsonResponse:
+    def get_transcribot_queue(self, request: Request, source: str = None) -> Response:
         """Get the submissions that still need to be attempted by transcribot.
 
         The helper method of `.has_ocr_transcription` exists, but you cannot
@@ -700,6 +873,11 @@ class SubmissionViewSet(viewsets.ModelViewSet):
             had been posted
         * that the submission has not been marked as removed from the queue
           - ie. it broke rules and was reported & removed
+
+        When `wait` is given, the request waits up to that many seconds (at most
+        LONG_POLL_MAX_WAIT) for new transcriptions when the queue is empty,
+        instead of returning right away. This only happens on servers which
+        handle requests concurrently, see `_get_wait_value`.
         """
         source_obj = get_object_or_404(Source, pk=source)
         transcribot = BlossomUser.objects.get(username="transcribot")
@@ -711,7 +889,99 @@ class SubmissionViewSet(viewsets.ModelViewSet):
             removed_from_queue=False,
             cannot_ocr=False,
         ).values("id", "tor_url", "transcription__id", "transcription__text")[:return_limit]
-        return JsonResponse({"data": list(queryset)})
+        data = wait_for_work(
+            ["transcription"],
+            _get_wait_value(request, request.query_params.get("wait")),
+            lambda: list(queryset.all()),
+        )
+        return Response({"data": data})
+
+    @csrf_exempt
+    @swagger_auto_schema(
+        request_body=Schema(
+            type="object",
+            required=["source"],
+            properties={
+                "source": Schema(type="string"),
+                "limit": Schema(type="integer"),
+                "lease_seconds": Schema(type="integer"),
+                "wait": Schema(type="number"),
+            },
+        ),
+        responses={
+            200: DocResponse(
+                "The leased submissions and the time until which they are leased",
+                schema=Schema(
+                    type="object",
+                    properties={
+                        "data": Schema(type="array", items=Schema(type="object")),
+                        "lease_expiry": Schema(type="string", format="date-time"),
+                    },
+                ),
+            ),
+            400: "Required parameters not provided",
+            404: "The source does not exist",
+        },
+    )
+    @validate_request(data_params={"source"})
+    @action(detail=False, methods=["post"])
+    def lease_transcribot_queue(self, request: Request, source: str = None) -> Response:
+        """Lease submissions of which transcribot still has to post the transcription.
+
+        This returns the same data as `get_transcribot_queue`, but every
+        returned transcription is leased to the caller for `lease_seconds`
+        seconds (300 by default). Until the lease expires, it is not returned
+        to other callers, so multiple transcribot workers can post the queue
+        concurrently. Transcriptions which have not been posted (given an
+        original_id) by the time their lease expires are handed out again.
+
+        The number of submissions to lease is given by `limit`, 10 by default.
+        When `wait` is given, the request waits up to that many seconds (at most
+        LONG_POLL_MAX_WAIT) for new transcriptions when there are none to lease.
+        This only happens on servers which handle requests concurrently, see
+        `_get_wait_value`.
+        """
+        source_obj = get_object_or_404(Source, pk=source)
+        transcribot = BlossomUser.objects.get(username="transcribot")
+        try:
+            limit = int(request.data.get("limit", 10))
+            lease_seconds = int(request.data.get("lease_seconds", 300))
+        except (ValueError, TypeError):
+            return Response(
+                "The limit and lease_seconds have to be integers.",
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if limit < 0 or lease_seconds <= 0:
+            return Response(
+                "The limit can't be negative and lease_seconds has to be positive.",
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        pending = Transcription.objects.filter(
+            author=transcribot,
+            original_id__isnull=True,
+            submission__source=source_obj,
+            submission__removed_from_queue=False,
+            submission__cannot_ocr=False,
+        )
+        expiry = None
+
+        def lease() -> List[int]:
+            # The lease starts when the transcriptions are leased, not when
+            # the request started waiting for them.
+            nonlocal expiry
+            expiry = timezone.now() + timedelta(seconds=lease_seconds)
+            return _lease_transcriptions(pending, limit, expiry)
+
+        leased_ids = wait_for_work(
+            ["transcription"], _get_wait_value(request, request.data.get("wait")), lease
+        )
+        queryset = (
+            Submission.objects.filter(transcription__id__in=leased_ids)
+            .values("id", "tor_url", "transcription__id", "transcription__text")
+            .order_by("transcription__id")
+        )
+        return Response({"data": list(queryset), "lease_expiry": expiry})
 
     @csrf_exempt
     @swagger_auto_schema(
@@ -16,7 +16,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from blossom.api.authentication import BlossomApiPermission
-from blossom.api.helpers import validate_request
+from blossom.api.helpers import get_user_or_404, validate_request
 from blossom.api.models import Source, Submission, Transcription
 from blossom.api.serializers import TranscriptionSerializer
 from blossom.authentication.models import BlossomUser
@@ -113,7 +113,7 @@ class TranscriptionViewSet(viewsets.ModelViewSet):
         """
         # todo: if the original_id is passed in here, make sure this is okay
         submission = get_object_or_404(Submission, id=submission_id)
-        user = get_object_or_404(BlossomUser, username=username)
+        user = get_user_or_404(username)
         source = get_object_or_404(Source, name=source)
         removed_from_reddit = request.data.get("removed_from_reddit", "False") == "True"
 
@@ -1,6 +1,8 @@
 """Views that specifically relate to volunteers."""
 import uuid
+from typing import Optional
 
+from django.db.models import Count, Max
 from django.shortcuts import get_object_or_404
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
@@ -15,12 +17,29 @@ from rest_framework.response import Response
 
 from blossom.api.authentication import BlossomApiPermission
 from blossom.api.filters import CaseInsensitiveUsernameFilter
-from blossom.api.helpers import validate_request
+from blossom.api.helpers import conditional_etag, make_etag, validate_request
 from blossom.api.models import Source, Submission, Transcription
 from blossom.api.serializers import VolunteerSerializer
 from blossom.authentication.models import BlossomUser
 
 
+def _summary_etag(view: viewsets.ViewSet, request: Request, username: str = None) -> Optional[str]:
+    """Compute the ETag of the summary of the volunteer, if they exist.
+
+    Any change to the user bumps their update time, while the completed
+    submissions determine the gamma of the volunteer.
+    """
+    state = (
+        BlossomUser.objects.filter(username=username, is_volunteer=True)
+        .annotate(
+            completed_count=Count("completed_by"),
+            completed_update=Max("completed_by__last_update_time"),
+        )
+        .values_list("id", "last_update_time", "last_login", "completed_count", "completed_update")
+    )
+    return make_etag(*state) if state else None
+
+
 @method_decorator(
     name="list",
     decorator=swagger_auto_schema(
@@ -45,14 +64,19 @@ class VolunteerViewSet(viewsets.ModelViewSet):
     @swagger_auto_schema(
         manual_parameters=[Parameter("username", "query", type="string")],
         responses={
+            304: "The volunteer has not changed since the given ETag.",
             400: 'No "username" as a query parameter.',
             404: "No volunteer with the specified username.",
         },
     )
     @action(detail=False, methods=["get"])
     @validate_request(query_params={"username"})
+    @conditional_etag(_summary_etag)
     def summary(self, request: Request, username: str = None) -> Response:
-        """Get information on the volunteer with the provided username."""
+        """Get information on the volunteer with the provided username.
+
+        Supports conditional requests through the ETag and If-None-Match headers.
+        """
         user = get_object_or_404(BlossomUser, username=username, is_volunteer=True)
         return Response(self.serializer_class(user).data)
 
@@ -4,3 +4,9 @@ from django.apps import AppConfig as DjangoAppConfig
 class AppConfig(DjangoAppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "blossom.app"
+
+    def ready(self) -> None:
+        """Format the transcription templates before the first page needs them."""
+        from blossom.app.views import get_and_format_templates
+
+        get_and_format_templates()
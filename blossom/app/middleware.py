@@ -1,22 +1,34 @@
 import logging
-from unittest.mock import MagicMock
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
 from django.conf import settings
 from django.http import HttpRequest
 from django.utils.deprecation import MiddlewareMixin
 from django.utils.functional import SimpleLazyObject
-from praw import Reddit
+from social_django.models import UserSocialAuth
 from social_django.utils import load_strategy
 
 from blossom import __version__
 
+if TYPE_CHECKING:
+    from praw import Reddit
+
 log = logging.getLogger(__name__)
 
 
+def get_social_auth(request: HttpRequest) -> Optional[UserSocialAuth]:
+    """Get the Reddit account linked to the user, only querying it once per request."""
+    if not hasattr(request, "_reddit_social_auth"):
+        request._reddit_social_auth = request.user.social_auth.filter(provider="reddit").first()
+    return request._reddit_social_auth
+
+
 def refresh_token(request: HttpRequest) -> None:
     """Refresh the OAuth token so that we can use it."""
     strategy = load_strategy(request)
-    social = request.user.social_auth.filter(provider="reddit")[0]
+    social = get_social_auth(request)
 
     social.refresh_token(
         strategy=strategy,
@@ -24,20 +36,38 @@ def refresh_token(request: HttpRequest) -> None:
     )
 
 
-def configure_reddit(request: HttpRequest) -> Reddit:
-    """Build the reddit instance that will be attached to the user."""
+@lru_cache(maxsize=settings.REDDIT_CLIENT_CACHE_SIZE)
+def get_reddit_client(user_id: int, username: str, token: str, thread_id: int) -> "Reddit":
+    """Build a Reddit instance which is authenticated with the refresh token of the user.
+
+    The instances are kept for the next requests of the user, so that the access
+    token is reused until it expires instead of being requested every time. A new
+    refresh token gets a new instance. As PRAW isn't thread-safe, every thread
+    gets its own instance; the thread is identified by `threading.get_ident()`.
+    """
+    from praw import Reddit
+
+    return Reddit(
+        client_id=settings.SOCIAL_AUTH_REDDIT_KEY,
+        client_secret=settings.SOCIAL_AUTH_REDDIT_SECRET,
+        refresh_token=token,
+        user_agent=f"Python:Blossom:{__version__} (by /u/itsthejoker), acting as {username}",
+    )
+
+
+def configure_reddit(request: HttpRequest) -> "Reddit":
+    """Get the reddit instance that will be attached to the user."""
     if settings.ENABLE_REDDIT:
-        reddit = Reddit(
-            client_id=settings.SOCIAL_AUTH_REDDIT_KEY,
-            client_secret=settings.SOCIAL_AUTH_REDDIT_SECRET,
-            refresh_token=request.user.social_auth.first().extra_data["refresh_token"],
-            user_agent=(
-                f"Python:Blossom:{__version__} (by /u/itsthejoker),"
-                f" acting as {request.user.username}"
-            ),
+        reddit = get_reddit_client(
+            request.user.id,
+            request.user.username,
+            get_social_auth(request).extra_data["refresh_token"],
+            threading.get_ident(),
         )
     else:
         # so that everything doesn't explode during development.
+        from unittest.mock import MagicMock
+
         reddit = MagicMock()
 
     return reddit
@@ -47,19 +77,22 @@ class RedditMiddleware(MiddlewareMixin):
     def process_request(self, request: HttpRequest) -> None:
         """Add the built Reddit object to the request if it's available."""
         if not settings.ENABLE_REDDIT:
+            from unittest.mock import MagicMock
+
             request.user.reddit = MagicMock()
             return
 
         if not request.user.is_authenticated:
             # Don't trigger on anonymous users
             return
-        if not request.user.social_auth.first():
+        social_auth = get_social_auth(request)
+        if not social_auth:
             # Don't do anything if we don't have social auth hooked up
             return
-        if not hasattr(request.user.social_auth.first(), "extra_data"):
+        if not hasattr(social_auth, "extra_data"):
             # Safety check; make sure the extra data dict exists
             return
-        if not request.user.social_auth.first().extra_data.get("refresh_token"):
+        if not social_auth.extra_data.get("refresh_token"):
             # We won't have a refresh token if we just started the process
             refresh_token(request)
         # Build a pre-authenticated reddit instance and attach it to the request.
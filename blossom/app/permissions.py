@@ -8,7 +8,7 @@ from django.http import HttpRequest, HttpResponseRedirect
 from django.shortcuts import redirect, reverse
 from django.utils.decorators import method_decorator
 
-from blossom.app.middleware import refresh_token
+from blossom.app.middleware import get_social_auth, refresh_token
 
 
 def require_coc(func: Callable) -> Any:
@@ -49,7 +49,7 @@ def require_reddit_auth(func: Callable) -> Any:
     def inner_func(request: HttpRequest, *args: list, **kwargs: dict) -> Any:
         if not settings.ENABLE_REDDIT:
             return func(request, *args, **kwargs)
-        social_auth = request.user.social_auth.filter(provider="reddit").first()
+        social_auth = get_social_auth(request)
         if not social_auth:
             # Don't do anything if we don't have social auth hooked up
             return login_error(request)
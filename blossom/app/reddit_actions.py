@@ -1,21 +1,32 @@
 import logging
 import random
 import string
+import threading
+import time
 from contextlib import suppress
+from typing import TYPE_CHECKING, Dict, Optional, Set, Tuple
+from urllib.parse import urlparse
 
-import praw.exceptions
 from django.conf import settings
 from django.http import HttpRequest
 
 from blossom.api.models import Submission, Transcription
 from blossom.reddit import REDDIT
-from blossom.utils.workers import send_to_worker
+from blossom.utils.reddit_scheduler import send_to_reddit
+
+if TYPE_CHECKING:
+    from praw.models import Submission as RedditSubmission
 
 log = logging.getLogger(__name__)
 
 
 BASE_URL = "https://reddit.com"
 
+# The flair templates of every subreddit by their text, with the time at which they
+# expire and the texts which were not found among them.
+_flair_templates: Dict[str, Tuple[float, Dict[str, str], Set[str]]] = {}
+_flair_templates_lock = threading.Lock()
+
 
 class Flair:
     unclaimed = "Unclaimed"
@@ -26,7 +37,7 @@ class Flair:
     disregard = "Disregard"
 
 
-@send_to_worker
+@send_to_reddit()
 def submit_transcription(
     request: HttpRequest, transcription_obj: Transcription, submission_obj: Submission
 ) -> None:
@@ -47,7 +58,7 @@ def submit_transcription(
     transcription_obj.save()
 
 
-@send_to_worker
+@send_to_reddit(merge_key=lambda request, transcription_obj, submission_obj: transcription_obj.id)
 def edit_transcription(
     request: HttpRequest, transcription_obj: Transcription, submission_obj: Submission
 ) -> None:
@@ -62,42 +73,85 @@ def edit_transcription(
     if BASE_URL not in url:
         url = BASE_URL + url
 
+    from praw.exceptions import RedditAPIException
+
     reddit_comment = request.user.reddit.comment(url=url)
-    with suppress(praw.exceptions.RedditAPIException):
+    with suppress(RedditAPIException):
         reddit_comment.edit(transcription_obj.text)
 
 
-@send_to_worker
+@send_to_reddit()
 def remove_post(submission_obj: Submission) -> None:
     """Remove the requested post from the r/ToR queue."""
     log.info(f"Removing {submission_obj.original_id} from r/ToR.")
-    REDDIT.submission(url=submission_obj.tor_url).mod.unignore_reports()
-    REDDIT.submission(url=submission_obj.tor_url).mod.remove(mod_note=submission_obj.report_reason)
+    moderation = REDDIT.submission(url=submission_obj.tor_url).mod
+    moderation.unignore_reports()
+    moderation.remove(mod_note=submission_obj.report_reason)
 
 
-@send_to_worker
+@send_to_reddit()
 def approve_post(submission_obj: Submission) -> None:
     """Approve the post on the r/ToR queue."""
     log.info(f"Approving {submission_obj.original_id} on r/ToR.")
-    REDDIT.submission(url=submission_obj.tor_url).mod.ignore_reports()
-    REDDIT.submission(url=submission_obj.tor_url).mod.approve()
+    moderation = REDDIT.submission(url=submission_obj.tor_url).mod
+    moderation.ignore_reports()
+    moderation.approve()
+
+
+def get_subreddit_name(url: Optional[str]) -> str:
+    """Get the name of the subreddit from the URL of a Reddit post."""
+    parts = urlparse(url or "").path.split("/")
+    return parts[2].lower() if len(parts) > 2 and parts[1] == "r" else ""
+
+
+def get_flair_template_id(
+    reddit_submission: "RedditSubmission", url: str, text: str
+) -> Optional[str]:
+    """Get the ID of the flair template with the given text for the Reddit post.
+
+    The templates are cached per subreddit, so flairing a post usually only
+    takes a single request to Reddit. They are fetched again when they have
+    expired or when the text can't be found, e.g. because the flair is new.
+    Texts which are still missing after that are remembered until the
+    templates expire, so they don't cause a request every time.
+
+    :param reddit_submission: the post on Reddit to get the flair template for
+    :param url: the URL of the post, from which the subreddit is taken
+    :param text: the text of the flair
+    """
+    subreddit = get_subreddit_name(url)
+    # The Slack actions flair posts as well, next to the Reddit actions
+    with _flair_templates_lock:
+        expires, templates, missing = _flair_templates.get(subreddit, (0, {}, set()))
+        if expires > time.monotonic() and (text in templates or text in missing):
+            return templates.get(text)
+
+        templates = {}
+        for choice in reddit_submission.flair.choices():
+            templates.setdefault(choice["flair_text"], choice["flair_template_id"])
+        _flair_templates[subreddit] = (
+            time.monotonic() + settings.FLAIR_TEMPLATE_CACHE_TIMEOUT,
+            templates,
+            set() if text in templates else {text},
+        )
+        return templates.get(text)
 
 
-@send_to_worker
+# Only the last of the flair changes of a post that are waiting is needed
+@send_to_reddit(merge_key=lambda submission_obj, text: submission_obj.id)
 def flair_post(submission_obj: Submission, text: str) -> None:
     """Change the flair of the requested post on the r/ToR queue."""
     tor_submission = REDDIT.submission(url=submission_obj.tor_url)
-    for choice in tor_submission.flair.choices():
-        if choice["flair_text"] == text:
-            log.info(f"Flairing post {submission_obj.original_id} with {text}")
-            tor_submission.flair.select(flair_template_id=choice["flair_template_id"])
-            return
+    if flair_template_id := get_flair_template_id(tor_submission, submission_obj.tor_url, text):
+        log.info(f"Flairing post {submission_obj.original_id} with {text}")
+        tor_submission.flair.select(flair_template_id=flair_template_id)
+        return
 
     # if the flairing is successful, we won't hit this line.
     log.error(f"Cannot find requested flair {text}. Not flairing.")
 
 
-@send_to_worker
+@send_to_reddit()
 def advertise(submission_obj: Submission) -> None:
     """Post a message explaining how this submission was completed to r/ToR."""
     reddit_submission = REDDIT.submission(url=submission_obj.tor_url)
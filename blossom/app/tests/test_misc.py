@@ -1,10 +1,18 @@
-from unittest.mock import MagicMock
+import threading
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from django.test import RequestFactory
+from pytest_django.fixtures import SettingsWrapper
 
 from blossom.api.models import Source
 from blossom.api.slack import client as slack_client
 from blossom.api.slack.actions.report import ask_about_removing_post
+from blossom.app import reddit_actions
+from blossom.app.middleware import RedditMiddleware, get_reddit_client, get_social_auth
+from blossom.app.reddit_actions import Flair, flair_post
 from blossom.app.views import get_blossom_app_source
-from blossom.utils.test_helpers import create_submission
+from blossom.utils.test_helpers import add_social_auth_to_user, create_submission, create_user
 
 
 def test_get_blossom_app_source() -> None:
@@ -57,3 +65,91 @@ def test_ask_about_removing_post() -> None:
     assert "asdf" in blocks[0]["text"]["text"]
     assert "submission_3" in blocks[-1]["elements"][0]["value"]
     assert "submission_3" in blocks[-1]["elements"][1]["value"]
+
+
+def test_reddit_middleware(settings: SettingsWrapper, django_assert_num_queries: Any) -> None:
+    """Verify that the Reddit account of the user is only queried once per request."""
+    settings.ENABLE_REDDIT = True
+    user = create_user()
+    add_social_auth_to_user(user)
+    request = RequestFactory().get("/")
+    request.user = user
+
+    with django_assert_num_queries(1):
+        RedditMiddleware(MagicMock()).process_request(request)
+        assert get_social_auth(request).extra_data["refresh_token"] == "aaa"
+
+
+def test_reddit_client_cache(settings: SettingsWrapper) -> None:
+    """Verify that the Reddit instances of the users are reused between requests."""
+    settings.ENABLE_REDDIT = True
+    get_reddit_client.cache_clear()
+    user = create_user()
+    social_auth = add_social_auth_to_user(user)
+
+    def use_reddit() -> None:
+        request = RequestFactory().get("/")
+        request.user = user
+        RedditMiddleware(MagicMock()).process_request(request)
+        # The instance is only built when it's used
+        user.reddit.user.me()
+
+    with patch("praw.Reddit") as reddit:
+        use_reddit()
+        use_reddit()
+        reddit.assert_called_once()
+        assert reddit.call_args.kwargs["refresh_token"] == "aaa"
+
+        social_auth.extra_data["refresh_token"] = "bbb"
+        social_auth.save()
+        use_reddit()
+        assert reddit.call_count == 2
+        assert reddit.call_args.kwargs["refresh_token"] == "bbb"
+
+        # PRAW isn't thread-safe, so other threads don't share the instance
+        request = RequestFactory().get("/")
+        request.user = user
+        RedditMiddleware(MagicMock()).process_request(request)
+        thread = threading.Thread(target=lambda: user.reddit.user.me())
+        thread.start()
+        thread.join()
+        assert reddit.call_count == 3
+    get_reddit_client.cache_clear()
+
+
+def test_flair_post() -> None:
+    """Verify that the flair templates are only fetched from Reddit when needed."""
+    reddit_actions._flair_templates.clear()
+    submission = create_submission(
+        tor_url="https://reddit.com/r/TranscribersOfReddit/comments/abc/meta/"
+    )
+    tor_submission = MagicMock()
+    tor_submission.flair.choices.return_value = [
+        {"flair_text": Flair.unclaimed, "flair_template_id": "1"},
+        {"flair_text": Flair.in_progress, "flair_template_id": "2"},
+    ]
+
+    with patch.object(reddit_actions, "REDDIT") as reddit:
+        reddit.submission.return_value = tor_submission
+        flair_post(submission, Flair.in_progress, worker_test_mode=True)
+        flair_post(submission, Flair.unclaimed, worker_test_mode=True)
+        assert tor_submission.flair.choices.call_count == 1
+        assert [c.kwargs for c in tor_submission.flair.select.call_args_list] == [
+            {"flair_template_id": "2"},
+            {"flair_template_id": "1"},
+        ]
+
+        # Unknown flairs are looked up again, in case they have been added since
+        tor_submission.flair.choices.return_value.append(
+            {"flair_text": Flair.completed, "flair_template_id": "3"}
+        )
+        flair_post(submission, Flair.completed, worker_test_mode=True)
+        assert tor_submission.flair.choices.call_count == 2
+        tor_submission.flair.select.assert_called_with(flair_template_id="3")
+
+        # Flairs which are still unknown are not looked up again until they expire
+        flair_post(submission, Flair.meta, worker_test_mode=True)
+        flair_post(submission, Flair.meta, worker_test_mode=True)
+        assert tor_submission.flair.choices.call_count == 3
+        assert tor_submission.flair.select.call_count == 3
+    reddit_actions._flair_templates.clear()
@@ -1,4 +1,7 @@
+import json
+import os
 import random
+from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
@@ -9,8 +12,9 @@ from django.test import Client, RequestFactory
 from pytest_django.fixtures import SettingsWrapper
 from rest_framework import status
 
-from blossom.api.models import Transcription
-from blossom.app.views import TranscribeSubmission
+from blossom.api.models import Submission, Transcription
+from blossom.app import views
+from blossom.app.views import TranscribeSubmission, get_and_format_templates, sample_submissions
 from blossom.utils.test_helpers import (
     add_social_auth_to_user,
     create_submission,
@@ -115,6 +119,24 @@ class TestChooseSubmission:
         # are they all different?
         assert len(set(response.context["options"])) == 3
 
+    def test_sample_submissions(self) -> None:
+        """Verify that the sample starts at a random key and wraps around."""
+        submissions = [
+            create_submission(original_id=str(key), sample_key=key) for key in [0.1, 0.2, 0.6, 0.9]
+        ]
+
+        with patch("blossom.app.views.random.random", return_value=0.5):
+            sample = sample_submissions(Submission.objects.all(), 3)
+        assert sample == submissions[2:] + submissions[:1]
+
+        with patch("blossom.app.views.random.random", return_value=0.05):
+            sample = sample_submissions(Submission.objects.all(), 3)
+        assert sample == submissions[:3]
+
+        assert sample_submissions(Submission.objects.filter(id=submissions[0].id), 3) == [
+            submissions[0]
+        ]
+
     def test_invalid_options(self, client: Client) -> None:
         """Verify that only image posts are returned."""
         client, _, user = setup_user_client(client)
@@ -135,31 +157,30 @@ class TestChooseSubmission:
     def test_check_reddit_for_missing_information(
         self, client: Client, settings: SettingsWrapper
     ) -> None:
-        """Verify that if information is missing we will check Reddit for it."""
+        """Verify that missing information is fetched in the background."""
         client, _, user = setup_user_client(client)
         add_social_auth_to_user(user)
         settings.ENABLE_REDDIT = True
 
-        class RedditSubmission:
-            class Response:
-                over_18 = True
-                title = "AAA"
-
-            def submission(self, **kwargs: Any) -> Response:
-                """Return a mocked response from Reddit."""
-                return self.Response()
-
-        with patch("blossom.app.middleware.configure_reddit", lambda a: RedditSubmission()):
+        with patch("blossom.app.middleware.configure_reddit") as configure_reddit, patch(
+            "blossom.app.views.enrich_in_background"
+        ) as enrich:
             submission = create_submission(
                 original_id=int(random.random() * 1000),
                 content_url="http://imgur.com",
             )
+            create_submission(
+                original_id=int(random.random() * 1000),
+                title="abc",
+                content_url="http://imgur.com",
+            )
 
-            client.get(reverse("choose_transcription"))
+            response = client.get(reverse("choose_transcription"))
 
-            submission.refresh_from_db()
-            assert submission.title == "AAA"
-            assert submission.nsfw is True
+            assert response.status_code == 200
+            assert list(enrich.call_args.args[0]) == [submission.id]
+            # The page doesn't wait for Reddit
+            configure_reddit.assert_not_called()
 
     def test_rank_up(self, client: Client) -> None:
         """Verify that confetti gets passed to the page when a user ranks up."""
@@ -471,3 +492,25 @@ class TestTranscribeSubmission:
             reverse("transcribe_submission", kwargs={"submission_id": submission.id})
             in response.url
         )
+
+
+def test_get_and_format_templates(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify that the templates are only formatted again when the file changes."""
+    path = tmp_path / "templates.json"
+    path.write_text(json.dumps({"Code": {"template": "code", "notes": ["Use *spaces*."]}}))
+    monkeypatch.setattr(views, "TRANSCRIPTION_TEMPLATES_PATH", path)
+    monkeypatch.setattr(views, "_templates", None)
+
+    templates = get_and_format_templates()
+    assert templates["Code"]["template"] == "code"
+    assert templates["Code"]["notes"] == ("<p>Use <em>spaces</em>.</p>",)
+    with pytest.raises(TypeError):
+        templates["Code"]["template"] = "changed"  # type: ignore
+    assert get_and_format_templates() is templates
+
+    path.write_text(json.dumps({"Code": {"template": "new code"}}))
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+
+    templates = get_and_format_templates()
+    assert templates["Code"]["template"] == "new code"
+    assert "notes" not in templates["Code"]
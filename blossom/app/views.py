@@ -4,12 +4,14 @@ import pathlib
 import random
 import uuid
 from datetime import timedelta
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional, Tuple
 
-import markdown
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import QuerySet
 from django.db.models.functions import Length
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import (
@@ -24,8 +26,10 @@ from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import View
 from rest_framework import status
 
+from blossom.api.enrichment import enrich_in_background
 from blossom.api.models import Source, Submission, Transcription
 from blossom.api.slack.actions.report import ask_about_removing_post
+from blossom.api.tiles import DZI_NAME, generate_tiles_in_background, has_tiles
 from blossom.api.views.submission import SubmissionViewSet
 from blossom.app.permissions import RequireCoCMixin, require_coc, require_reddit_auth
 from blossom.app.reddit_actions import (
@@ -69,6 +73,11 @@ TRANSCRIPTION_TEMPLATE = (
     "it,&#32;click&#32;here!](https://www.reddit.com/r/TranscribersOfReddit/wiki/index)"
 )
 
+TRANSCRIPTION_TEMPLATES_PATH = pathlib.Path(__file__).parent / "transcription_templates.json"
+
+# The formatted transcription templates with the modification time of their file.
+_templates: Optional[Tuple[int, Mapping[str, Mapping[str, Any]]]] = None
+
 
 def get_blossom_app_source() -> Source:
     """Get the source object for transcriptions completed using the App."""
@@ -101,6 +110,27 @@ def view_previous_transcriptions(request: HttpRequest) -> HttpResponse:
     return render(request, "app/view_transcriptions.html", context)
 
 
+def sample_submissions(queryset: QuerySet, count: int) -> List[Submission]:
+    """Take a random sample of the submissions in the queryset.
+
+    The sample is taken by the database, which returns the submissions with
+    the first `sample_key`s after a random point, wrapping around to the
+    lowest keys if needed. Only a few rows are read through the index on the
+    key, no matter how many submissions there are to choose from.
+
+    :param queryset: the submissions to sample from
+    :param count: the maximum number of submissions to return
+    :returns: the sampled submissions
+    """
+    start = random.random()
+    sample = list(queryset.filter(sample_key__gte=start).order_by("sample_key")[:count])
+    if len(sample) < count:
+        sample += queryset.filter(sample_key__lt=start).order_by("sample_key")[
+            : count - len(sample)
+        ]
+    return sample
+
+
 @login_required
 @require_coc
 @require_reddit_auth
@@ -113,35 +143,16 @@ def choose_transcription(request: HttpRequest) -> HttpResponse:
     )
     submissions = Submission.objects.annotate(original_id_len=Length("original_id")).filter(
         original_id_len__lt=10,
-        completed_by=None,
-        claimed_by=None,
+        queue_state=Submission.QueueState.UNCLAIMED,
+        is_image=True,
         create_time__gte=time_delay,
-        removed_from_queue=False,
-        archived=False,
     )
 
-    options_list = [obj for obj in submissions if obj.is_image]
+    options = sample_submissions(submissions, 3)
 
-    if len(options_list) > 3:
-        # we have more to choose from, so let's grab 3
-        temp = []
-        for _ in range(3):
-            submission = random.choice(options_list)
-            temp.append(options_list.pop(options_list.index(submission)))
-        options = temp
-    else:
-        options = options_list
-
-    for submission in options:
-        # todo: add check for source. This will need to happen after we convert
-        #  sources to the individual subreddits
-        if not submission.title:
-            # we have a lot of submissions that don't have a title, but we
-            # need it for this next page. Just grab the title and save it.
-            post = request.user.reddit.submission(url=submission.url)
-            submission.title = post.title
-            submission.nsfw = post.over_18
-            submission.save(skip_extras=True)
+    # Some submissions don't have a title (and NSFW flag) yet. Rather than
+    # waiting for Reddit, they are shown as they are and fetched for next time.
+    enrich_in_background(submission.id for submission in options if not submission.title)
 
     context = get_additional_context({"options": options, "fullwidth_view": True})
 
@@ -171,19 +182,44 @@ def choose_transcription(request: HttpRequest) -> HttpResponse:
     return render(request, "app/choose_transcription.html", context)
 
 
-def get_and_format_templates() -> list:
-    """Load all templates and format them appropriately."""
+def _load_templates() -> Mapping[str, Mapping[str, Any]]:
+    """Load all templates and convert their notes from markdown to HTML."""
+    import markdown
+
     md = markdown.Markdown(output_format="html")
-    with open(pathlib.Path(__file__).parent / "transcription_templates.json", "r") as file:
+    with open(TRANSCRIPTION_TEMPLATES_PATH, "r") as file:
         data = json.load(file)
-        for template in data.keys():
-            if notes := data[template].get("notes"):
-                data[template]["notes"] = [md.convert(note) for note in notes]
-    return data
+    templates = {}
+    for name, template in data.items():
+        if notes := template.get("notes"):
+            template = {**template, "notes": tuple(md.convert(note) for note in notes)}
+        templates[name] = MappingProxyType(template)
+    return MappingProxyType(templates)
+
+
+def get_and_format_templates() -> Mapping[str, Mapping[str, Any]]:
+    """Load all templates and format them appropriately.
+
+    The formatted templates are kept in memory and shared by all requests, so
+    they are read-only. They are loaded when the app is ready, and only loaded
+    again when the file has been modified since.
+    """
+    global _templates
+    modified = TRANSCRIPTION_TEMPLATES_PATH.stat().st_mtime_ns
+    if _templates is None or _templates[0] != modified:
+        _templates = (modified, _load_templates())
+    return _templates[1]
 
 
 def update_context_with_proxy_data(submission: Submission, context: dict) -> dict:
     """Verify that if proxy data is needed, it is formatted and added to the context."""
+    if has_tiles(submission):
+        # Only the tiles in view have to be loaded, instead of the whole image
+        context.update({"tiles_url": reverse("tiles", args=[submission.id, DZI_NAME])})
+    else:
+        # The volunteer gets the whole image this time, but the next one won't have to
+        generate_tiles_in_background(submission)
+
     if "i.redd.it" in submission.content_url:
         # just grab the `abcde.jpg` bit out of the url so that we can route it
         # through the proxy for OpenSeaDragon
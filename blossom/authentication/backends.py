@@ -1,10 +1,13 @@
 """Authentication backend for the application."""
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth.models import User
-from rest_framework import authentication
+from django.core import signing
+from django.utils.crypto import constant_time_compare
+from rest_framework import authentication, exceptions
 from rest_framework.request import Request
 
 from blossom.authentication.models import BlossomUser
@@ -61,3 +64,78 @@ class BlossomRestFrameworkAuth(authentication.BaseAuthentication):
                 return user_data
 
         return None
+
+
+API_TOKEN_SALT = "blossom.api.token"
+
+
+def create_api_token(user: BlossomUser) -> str:
+    """Create a signed token with which the user can authenticate to the API.
+
+    Next to the ID of the user, the token contains the session hash of the
+    user, so changing the password invalidates all tokens of the user. The
+    token expires after API_TOKEN_MAX_AGE seconds.
+    """
+    return signing.dumps({"id": user.id, "hash": user.get_session_auth_hash()}, salt=API_TOKEN_SALT)
+
+
+def get_user_from_api_token(token: str) -> Optional[BlossomUser]:
+    """Retrieve the user belonging to the token, if the token is still valid.
+
+    Only the signature and the session hash are checked, so the password
+    hasher is never invoked.
+    """
+    try:
+        payload = signing.loads(token, salt=API_TOKEN_SALT, max_age=settings.API_TOKEN_MAX_AGE)
+    except signing.BadSignature:
+        return None
+    user = BlossomUser.objects.filter(id=payload.get("id"), is_active=True).first()
+    if user is None or not constant_time_compare(user.get_session_auth_hash(), payload["hash"]):
+        return None
+    return user
+
+
+class BlossomTokenAuth(authentication.BaseAuthentication):
+    """Authenticate API requests with a token from the token endpoint.
+
+    The token is sent as `Authorization: Bearer <token>`. It is not stored in
+    the database, but signed with the secret key: the payload holds the ID and
+    the session hash of the user, see `create_api_token`. The token is accepted
+    for API_TOKEN_MAX_AGE seconds (an hour by default) after it was created,
+    and until the user changes their password.
+    """
+
+    keyword = "Bearer"
+
+    def _get_bearer_header(self, request: Request) -> Optional[list]:
+        auth = authentication.get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        return auth
+
+    def authenticate(self, request: Request) -> Optional[Tuple[BlossomUser, str]]:
+        """Authenticate the request through a bearer token from the token endpoint.
+
+        Requests without a bearer token are left to the other authentication
+        classes. Unlike with the session, no CSRF token is required.
+        """
+        auth = self._get_bearer_header(request)
+        if not auth:
+            return None
+        if len(auth) != 2:
+            raise exceptions.AuthenticationFailed("Invalid bearer token header.")
+
+        token = auth[1].decode(errors="replace")
+        if user := get_user_from_api_token(token):
+            return (user, token)
+        raise exceptions.AuthenticationFailed("Invalid or expired token.")
+
+    def authenticate_header(self, request: Request) -> Optional[str]:
+        """Return the header to send along with a 401 response.
+
+        Only requests with a bearer token get a 401 response, so the client
+        knows to retrieve a new token. Other requests keep getting a 403.
+        """
+        if self._get_bearer_header(request):
+            return f'{self.keyword} realm="api"'
+        return None
@@ -1,7 +1,7 @@
 """Models used within the Authentication application."""
 import random
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 import pytz
 from django.contrib.auth.models import AbstractUser, UserManager
@@ -36,21 +36,39 @@ LOW_ACTIVITY_TIMEDELTA = timedelta(days=30)
 LOW_ACTIVITY_THRESHOLD = 10
 
 
+# Allows lookups like `username__lower`, which compare against `LOWER(username)`
+# and can hence use the functional index on the lowercase username.
+models.CharField.register_lookup(Lower)
+
+
+def _lower_username_lookups(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Rewrite username lookups to case insensitive ones that can use the index.
+
+    An `iexact` lookup is executed as `UPPER(username) = UPPER(%s)` by Postgres,
+    which can't use the index on `LOWER(username)`, so the value is lowered
+    here and compared to the lowercase username instead.
+    """
+    for key in ("username", "username__iexact"):
+        if isinstance(kwargs.get(key), str):
+            kwargs["username__lower"] = kwargs.pop(key).lower()
+    return kwargs
+
+
+class BlossomUserQuerySet(QuerySet):
+    def filter(self, *args: Any, **kwargs: Any) -> QuerySet:  # noqa: ANN401
+        """Override `filter` to make usernames case insensitive.
+
+        As `get` is implemented through `filter`, this covers `get` and the
+        shortcuts like `get_object_or_404` as well.
+        """
+        return super().filter(*args, **_lower_username_lookups(kwargs))
+
+
 class BlossomUserManager(UserManager):
     # https://stackoverflow.com/a/7774039
-    def filter(self, **kwargs: Any) -> QuerySet:  # noqa: ANN401
-        """Override `filter` to make usernames case insensitive."""
-        if "username" in kwargs:
-            kwargs["username__iexact"] = kwargs["username"]
-            del kwargs["username"]
-        return super().filter(**kwargs)
-
-    def get(self, **kwargs: Any) -> QuerySet:  # noqa: ANN401
-        """Override `get` to make usernames case insensitive."""
-        if "username" in kwargs:
-            kwargs["username__iexact"] = kwargs["username"]
-            del kwargs["username"]
-        return super().get(**kwargs)
+    def get_queryset(self) -> BlossomUserQuerySet:
+        """Return a queryset of which the username lookups are case insensitive."""
+        return BlossomUserQuerySet(self.model, using=self._db)
 
 
 class BlossomUser(AbstractUser):
@@ -105,6 +123,14 @@ class BlossomUser(AbstractUser):
 
     objects = BlossomUserManager()
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Save the user object, keeping track of the update time."""
+        self.last_update_time = timezone.now()
+        if (update_fields := kwargs.get("update_fields")) is not None:
+            kwargs["update_fields"] = {*update_fields, "last_update_time"}
+
+        super().save(*args, **kwargs)
+
     def date_last_active(self) -> Optional[datetime]:
         """Return the time where the user was last active.
 
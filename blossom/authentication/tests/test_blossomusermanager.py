@@ -1,4 +1,10 @@
 """Set of tests which are used to validate the behavior of the authentication of users."""
+from typing import Callable
+
+import pytest
+from django.http import Http404
+
+from blossom.api.helpers import get_user_or_404
 from blossom.authentication.models import BlossomUser
 from blossom.utils.test_helpers import create_user
 
@@ -34,3 +40,25 @@ def test_verify_usernames_dont_affect_other_filters() -> None:
             assert BlossomUser.objects.filter(
                 username__iexact=option, is_volunteer=is_vol
             ).count() == (1 if is_vol else 0)
+
+
+def test_username_lookup_uses_index() -> None:
+    """Verify that the case insensitive username lookup uses the functional index."""
+    create_user(**USER_CREATION_DATA)
+    for queryset in [
+        BlossomUser.objects.filter(username="nArF"),
+        BlossomUser.objects.filter(username__iexact="nArF"),
+        BlossomUser.objects.all().filter(username="nArF"),
+    ]:
+        assert "user_lower_username_idx" in queryset.explain()
+
+
+def test_get_user_or_404(django_assert_num_queries: Callable) -> None:
+    """Verify that users are looked up by username in a single indexed query."""
+    user = create_user(**USER_CREATION_DATA)
+
+    with django_assert_num_queries(1) as context:
+        assert get_user_or_404("NARF") == user
+    assert "LOWER" in context.captured_queries[0]["sql"]
+    with pytest.raises(Http404):
+        get_user_or_404("Zorp")
@@ -1,3 +1,4 @@
+import time
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Any, Dict, Union
@@ -30,7 +31,7 @@ class BlossomAPI:
         password: str,
         api_key: str,
         api_base_url: str = "http://localhost:8000/api/",
-        num_retries: int = 1,
+        num_retries: int = 2,
     ) -> None:
         """Initialize the Blossom API with the necessary parameters.
 
@@ -54,41 +55,57 @@ class BlossomAPI:
         self.base_url = api_base_url
         self.num_retries = num_retries
 
+        # The token is refreshed this many seconds before it expires.
+        self.token_refresh_margin = 60
+        self.token_expiry = 0.0
+
         self.http = Session()
-        self.http.headers.update({"Authorization": f"Api-Key {api_key}"})
+        self.http.headers.update({"X-Api-Key": api_key})
+
+    def _refresh_token(self) -> None:
+        """Log in with the email and password to retrieve a new API token.
+
+        The token is used for all following requests until it (nearly)
+        expires, so the password only has to be verified once per token.
+        """
+        resp = self.http.post(
+            urljoin(self.base_url, "token/"),
+            data={"email": self.email, "password": self.password},
+        )
+        if resp.status_code != 200:
+            raise Exception("Unable to authenticate! Check your email and password!")
+        data = resp.json()
+        self.http.headers.update({"Authorization": f"Bearer {data['token']}"})
+        self.token_expiry = time.monotonic() + data["expires_in"] - self.token_refresh_margin
 
     def _call(self, method: str, path: str, data: Dict = None, params: Dict = None) -> Response:
         """Create a call to the API using the requests package.
 
-        In this method, a request is retried if a 403 and a message on authentication
-        credentials is returned. In this case, it seems that tor is not yet logged in and
-        hence we attempt to log in. In any other case, the request is returned at is
-        without retrying. If the described failure still occurs after the set number of
-        retries, this method raises an exception.
-
-        Note that because of Blossom's CSRF protection each non-GET request also first
-        requires a GET request to retrieve a CSRF token.
+        The requests are authenticated with a token, which is retrieved when
+        there is none yet or when it is about to expire. If the token is
+        rejected anyway, a new token is retrieved and the request retried,
+        up to the set number of retries. A 403 means that the API key or the
+        user is not allowed to do this, in which case this method raises an
+        exception.
         """
         # https://2.python-requests.org/en/master/user/advanced/#prepared-requests
         data = data if data is not None else dict()
-        data.update({"email": self.email, "password": self.password})
         params = params if params is not None else dict()
-
-        if method != "GET":
-            # Currently Blossom has CSRF protection enabled, hence tor should include a
-            # new CSRF token in this request, which is retrieved from the GET request.
-            self._call("GET", path, data, params)
-            if "csrftoken" in self.http.cookies:
-                data.update({"csrfmiddlewaretoken": self.http.cookies.get("csrftoken")})
         req = Request(method=method, url=urljoin(self.base_url, path), data=data, params=params)
 
         resp = None
 
         for _ in range(self.num_retries):
+            if time.monotonic() >= self.token_expiry:
+                self._refresh_token()
+
             prepped = self.http.prepare_request(req)
             settings = self.http.merge_environment_settings(prepped.url, {}, None, None, None)
             resp = self.http.send(prepped, **settings)
 
+            if resp.status_code == 401:
+                self.token_expiry = 0.0
+                continue
             if resp.status_code == 403:
                 raise Exception("Unable to authenticate! Check your email and password!")
 
@@ -1,10 +1,11 @@
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
 
-from blossom.website.helpers import get_additional_context
+from blossom.website.helpers import cache_anonymous_page, get_additional_context
 from blossom.website.models import Post
 
 
+@cache_anonymous_page
 def index(request: HttpRequest) -> HttpResponse:
     """Render the homepage for the engineering posts."""
     posts = Post.objects.filter(
@@ -0,0 +1,136 @@
+"""Compare the throughput of the JSON renderers used by the API.
+
+The payloads mimic the shapes of our largest responses: the full transcribot
+queue, a page of 500 serialized submissions and the leaderboard. No database
+access is needed; the data is generated in memory.
+
+Usage: python manage.py benchmark_renderers [--rounds 20]
+"""
+import datetime
+import timeit
+import uuid
+from typing import Any, Dict, List
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from blossom.api import renderers
+from blossom.api.renderers import ORJSONRenderer
+
+TEXT = (
+    "*Image Transcription: Tweet*\n\n---\n\n**Some Person**, @someperson\n\n"
+    "> Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod"
+    " tempor incididunt ut labore et dolore magna aliqua.\n\n---\n\n"
+) * 4
+
+
+def transcribot_queue(count: int = 2000) -> Dict[str, List[Dict]]:
+    """Build a payload shaped like `get_transcribot_queue?limit=none`."""
+    return {
+        "data": [
+            {
+                "id": i,
+                "tor_url": f"https://reddit.com/r/TranscribersOfReddit/comments/{i}/",
+                "transcription__id": i,
+                "transcription__text": TEXT,
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def submission_page(count: int = 500) -> Dict[str, Any]:
+    """Build a payload shaped like a page of the submission list."""
+    now = timezone.now()
+    return {
+        "count": count * 100,
+        "next": "http://localhost:8000/api/submission/?page=2&page_size=500",
+        "previous": None,
+        "results": [
+            {
+                "id": i,
+                "original_id": str(uuid.uuid4()),
+                "create_time": now.isoformat(),
+                "last_update_time": now.isoformat(),
+                "claimed_by": "http://localhost:8000/api/volunteer/5/",
+                "completed_by": "http://localhost:8000/api/volunteer/5/",
+                "claim_time": now.isoformat(),
+                "complete_time": now.isoformat(),
+                "source": "reddit",
+                "title": "The title of the submission",
+                "nsfw": False,
+                "url": f"https://reddit.com/r/me_irl/comments/{i}/",
+                "tor_url": f"https://reddit.com/r/TranscribersOfReddit/comments/{i}/",
+                "content_url": f"https://i.redd.it/{i}.jpg",
+                "has_ocr_transcription": True,
+                "transcription_set": [i * 2, i * 2 + 1],
+                "archived": True,
+                "cannot_ocr": False,
+                "redis_id": None,
+                "removed_from_queue": False,
+                "feed": "/r/me_irl",
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def leaderboard(count: int = 5000) -> Dict[str, Any]:
+    """Build a payload shaped like the leaderboard, which contains raw datetimes."""
+    joined = timezone.now() - datetime.timedelta(days=365)
+    rank_list = [
+        {
+            "id": i,
+            "username": f"volunteer_{i}",
+            "gamma": count - i,
+            "date_joined": joined,
+            "rank": i + 1,
+        }
+        for i in range(count)
+    ]
+    return {
+        "top": rank_list[:5],
+        "above": rank_list[:2500],
+        "user": rank_list[2500],
+        "below": rank_list[2501:],
+    }
+
+
+class Command(BaseCommand):
+    help = "Compares the serialization throughput of the API JSON renderers."  # noqa: VNE003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the number of rounds to run for every payload."""
+        parser.add_argument("--rounds", type=int, default=20)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Time every renderer on every payload and print the results."""
+        if renderers.orjson is None:
+            self.stdout.write(
+                self.style.WARNING(
+                    "orjson is not installed; ORJSONRenderer will fall back to the stdlib."
+                )
+            )
+
+        rounds = options["rounds"]
+        payloads = {
+            "transcribot_queue": transcribot_queue(),
+            "submission_page": submission_page(),
+            "leaderboard": leaderboard(),
+        }
+        candidates = {"JSONRenderer": JSONRenderer(), "ORJSONRenderer": ORJSONRenderer()}
+
+        for name, payload in payloads.items():
+            size = len(JSONRenderer().render(payload))
+            self.stdout.write(f"{name} ({size / 1024:.0f} KiB):")
+            timings = {}
+            for renderer_name, renderer in candidates.items():
+                seconds = timeit.timeit(lambda: renderer.render(payload), number=rounds)
+                timings[renderer_name] = seconds / rounds
+                self.stdout.write(
+                    f"  {renderer_name:<16}{timings[renderer_name] * 1000:8.2f} ms"
+                    f"  {size / timings[renderer_name] / 1024 ** 2:8.1f} MiB/s"
+                )
+            speedup = timings["JSONRenderer"] / timings["ORJSONRenderer"]
+            self.stdout.write(self.style.SUCCESS(f"  speedup: {speedup:.1f}x"))
@@ -13,6 +13,10 @@ dotenv.load_dotenv()
 
 logger = logging.getLogger("blossom.management.bootstrap")
 
+DEFAULT_USERNAMES = ["transcribersofreddit", "transcribot", "tor_archivist", "admin"]
+DEFAULT_SOURCES = ["gamma_plus_one", "reddit", "blossom"]
+DEFAULT_POST_SLUGS = ["about-us", "giving-to-grafeas", "terms-of-service", "thank-you"]
+
 ABOUT_PAGE = """
 <p>The best way to describe our organization is to start with our mission statement:</p>
 
@@ -192,16 +196,14 @@ class Command(BaseCommand):
 
     def create_sources(self) -> None:
         """Installs the default Source objects for transcriptions and submissions."""
-        sources = ["gamma_plus_one", "reddit", "blossom"]
-
-        for source in sources:
+        for source in DEFAULT_SOURCES:
             if not Source.objects.filter(name=source).exists():
                 Source.objects.create(name=source)
                 logger.debug(self.style.SUCCESS(f"Created source {source}"))
 
     def create_website_posts(self) -> None:
         """Installs the default posts for the primary grafeas.org blog."""
-        slugs = ["about-us", "giving-to-grafeas", "terms-of-service", "thank-you"]
+        slugs = DEFAULT_POST_SLUGS
         admin = BlossomUser.objects.get(username="admin")
 
         if Post.objects.filter(slug__in=slugs).count() == len(slugs):
@@ -256,6 +258,16 @@ class Command(BaseCommand):
             )
             logger.debug(self.style.SUCCESS("Wrote donation thanks page!"))
 
+    @staticmethod
+    def is_complete() -> bool:
+        """Check whether all of the default entries are already present."""
+        return (
+            BlossomUser.objects.filter(username__in=DEFAULT_USERNAMES).count()
+            == len(DEFAULT_USERNAMES)
+            and Source.objects.filter(name__in=DEFAULT_SOURCES).count() == len(DEFAULT_SOURCES)
+            and Post.objects.filter(slug__in=DEFAULT_POST_SLUGS).count() == len(DEFAULT_POST_SLUGS)
+        )
+
     def handle(self, *args: Any, **options: Any) -> None:
         """Set up everything needed in the database for a fresh deploy."""
         self.create_users()
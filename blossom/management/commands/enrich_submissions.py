@@ -0,0 +1,42 @@
+"""Fetch the missing titles and NSFW flags of existing submissions from Reddit.
+
+New submissions without a title are enriched in the background when they are
+created; this command takes care of the ones from before that. The posts are
+looked up 100 at a time, so large backlogs take a while but don't hammer Reddit.
+
+Usage: python manage.py enrich_submissions [--limit 10000]
+"""
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from blossom.api.enrichment import INFO_BATCH_SIZE, fetch_missing_details, missing_details
+
+
+class Command(BaseCommand):
+    help = "Fetches the missing titles and NSFW flags of submissions from Reddit."  # noqa: VNE003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the maximum number of submissions to look up."""
+        parser.add_argument("--limit", type=int, default=None)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Look up the submissions without a title in batches, oldest first."""
+        if not settings.ENABLE_REDDIT:
+            raise CommandError("Reddit is not enabled.")
+
+        limit = options["limit"]
+        checked = updated = 0
+        last_id = 0
+        while limit is None or checked < limit:
+            size = INFO_BATCH_SIZE if limit is None else min(INFO_BATCH_SIZE, limit - checked)
+            batch = list(missing_details().filter(id__gt=last_id).order_by("id")[:size])
+            if not batch:
+                break
+            updated += fetch_missing_details(batch)
+            checked += len(batch)
+            last_id = batch[-1].id
+            self.stdout.write(f"Checked {checked} submissions, updated {updated}.")
+
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} of {checked} submissions."))
@@ -0,0 +1,109 @@
+"""Prepare the database and static files before starting the server.
+
+This runs `migrate`, `createcachetable`, `bootstrap_site` and optionally
+`collectstatic`, but skips every step that would not change anything: the
+migrations are only run when some of them haven't been applied, the cache table
+is only created when it's missing, the site is only bootstrapped when some of
+the default entries are missing and the static files are only collected when
+they have changed since the last time. Restarts are a lot faster that way.
+The time taken by every step is logged.
+
+Usage: python manage.py prepare_site [--collectstatic] [--force]
+"""
+import hashlib
+import logging
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+from django.conf import settings
+from django.contrib.staticfiles.finders import get_finders
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.migrations.executor import MigrationExecutor
+
+from blossom.management.commands.bootstrap_site import Command as BootstrapCommand
+
+logger = logging.getLogger("blossom.management.prepare_site")
+
+# The file in STATIC_ROOT which holds the fingerprint of the collected files.
+STATIC_FINGERPRINT_FILE = ".fingerprint"
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Log how long the phase of the boot takes."""
+    start = time.perf_counter()
+    yield
+    logger.info(f"Boot phase {phase} took {time.perf_counter() - start:.2f}s.")
+
+
+def has_unapplied_migrations() -> bool:
+    """Check whether any of the migrations have not been applied to the database yet."""
+    executor = MigrationExecutor(connections[DEFAULT_DB_ALIAS])
+    return bool(executor.migration_plan(executor.loader.graph.leaf_nodes()))
+
+
+def get_static_fingerprint() -> str:
+    """Compute a fingerprint of the static files that collectstatic would collect."""
+    digest = hashlib.sha256()
+    for finder in get_finders():
+        for path, storage in finder.list(ignore_patterns=None):
+            stat = Path(storage.path(path)).stat()
+            digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def is_static_collected(fingerprint: str) -> bool:
+    """Check whether the static files have been collected with the given fingerprint."""
+    manifest = Path(settings.STATIC_ROOT) / "staticfiles.json"
+    stamp = Path(settings.STATIC_ROOT) / STATIC_FINGERPRINT_FILE
+    return manifest.exists() and stamp.exists() and stamp.read_text() == fingerprint
+
+
+class Command(BaseCommand):
+    help = "Migrates and bootstraps the site only when needed."  # noqa: VNE003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the options to collect the static files and to run every step."""
+        parser.add_argument(
+            "--collectstatic",
+            action="store_true",
+            help="Also collect the static files when they have changed.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Run every step, even when there seems to be nothing to do.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the steps which are needed."""
+        force = options["force"]
+
+        with timed("migrate"):
+            if force or has_unapplied_migrations():
+                call_command("migrate")
+            else:
+                logger.info("Skipping migrate; all migrations have been applied.")
+
+        with timed("createcachetable"):
+            # Only creates the tables of database caches which don't exist yet
+            call_command("createcachetable")
+
+        with timed("bootstrap_site"):
+            if force or not BootstrapCommand.is_complete():
+                call_command("bootstrap_site")
+            else:
+                logger.info("Skipping bootstrap_site; the site has been bootstrapped.")
+
+        if options["collectstatic"]:
+            with timed("collectstatic"):
+                fingerprint = get_static_fingerprint()
+                if force or not is_static_collected(fingerprint):
+                    call_command("collectstatic", interactive=False, verbosity=0)
+                    (Path(settings.STATIC_ROOT) / STATIC_FINGERPRINT_FILE).write_text(fingerprint)
+                else:
+                    logger.info("Skipping collectstatic; the static files have not changed.")
@@ -1,7 +1,6 @@
 import os
 from typing import Dict, Union
 
-import stripe
 from django.conf import settings
 from django.http import HttpRequest, HttpResponse, HttpResponseRedirect, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
@@ -11,10 +10,12 @@ from blossom.website.models import Post
 
 load_dotenv()
 
-if settings.DEBUG:
-    stripe.api_key = os.environ.get("STRIPE_DEBUG_KEY", "sk_test_abcdefghijk")
-else:
-    stripe.api_key = os.environ.get("STRIPE_PROD_KEY", "sk_live_abcdefghijk")
+
+def get_stripe_key() -> str:
+    """Get the Stripe API key for the current environment."""
+    if settings.DEBUG:
+        return os.environ.get("STRIPE_DEBUG_KEY", "sk_test_abcdefghijk")
+    return os.environ.get("STRIPE_PROD_KEY", "sk_live_abcdefghijk")
 
 
 def build_url(request: HttpRequest, post_obj: Post) -> str:
@@ -37,6 +38,10 @@ def charge(request: HttpRequest, *args: Dict, **kwargs: Dict) -> Union[HttpRespo
         # somehow we didn't get a number, so force reload the page.
         return HttpResponseRedirect(donate_post.get_absolute_url())
 
+    # Donations are rare, so Stripe is only loaded when somebody actually donates
+    import stripe
+
+    stripe.api_key = get_stripe_key()
     session = stripe.checkout.Session.create(
         payment_method_types=["card"],
         line_items=[
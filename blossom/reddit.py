@@ -1,20 +1,35 @@
 import os
-from unittest.mock import MagicMock
+from typing import TYPE_CHECKING
 
 from django.conf import settings
-from praw import Reddit
+from django.utils.functional import SimpleLazyObject
+
+if TYPE_CHECKING:
+    from praw import Reddit
 
 # This is abstracted out for testing purposes so that it's easy to override.
 
-REDDIT: Reddit
 
-if settings.ENABLE_REDDIT:
-    REDDIT = Reddit(
+def create_reddit() -> "Reddit":
+    """Create the Reddit client of the site.
+
+    PRAW is only imported when the client is first used, as most processes
+    never talk to Reddit.
+    """
+    if not settings.ENABLE_REDDIT:
+        from unittest.mock import MagicMock
+
+        return MagicMock()
+
+    from praw import Reddit
+
+    return Reddit(
         client_id=os.getenv("REDDIT_CLIENT_ID"),
         client_secret=os.getenv("REDDIT_SECRET"),
         password=os.getenv("REDDIT_PASSWORD"),
         username=os.getenv("REDDIT_USERNAME"),
         user_agent=os.getenv("REDDIT_USER_AGENT"),
     )
-else:
-    REDDIT = MagicMock()
+
+
+REDDIT: "Reddit" = SimpleLazyObject(create_reddit)
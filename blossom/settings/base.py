@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/2.2/ref/settings/
 
 import logging
 import os
+import tempfile
 from pathlib import Path
 
 import dotenv
@@ -215,10 +216,28 @@ PYUWSGI_ARGS = [
 REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "blossom.api.pagination.StandardResultsSetPagination",
     "DEFAULT_PERMISSION_CLASSES": ("blossom.api.authentication.BlossomApiPermission",),
-    "DEFAULT_AUTHENTICATION_CLASSES": ("blossom.authentication.backends.BlossomRestFrameworkAuth",),
+    "DEFAULT_AUTHENTICATION_CLASSES": (
+        "blossom.authentication.backends.BlossomTokenAuth",
+        "blossom.authentication.backends.BlossomRestFrameworkAuth",
+    ),
     "DEFAULT_FILTER_BACKENDS": ["django_filters.rest_framework.DjangoFilterBackend"],
+    # These use orjson if the `speedups` extra is installed and fall back to the
+    # stdlib json implementation of DRF otherwise.
+    "DEFAULT_RENDERER_CLASSES": (
+        "blossom.api.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "blossom.api.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+    # The number of failed logins on the token endpoint that are allowed per IP.
+    "DEFAULT_THROTTLE_RATES": {"token": os.getenv("BLOSSOM_TOKEN_THROTTLE_RATE", "10/minute")},
 }
 API_KEY_CUSTOM_HEADER = "HTTP_X_API_KEY"
+# The number of seconds for which a token from the token endpoint is valid.
+API_TOKEN_MAX_AGE = int(os.getenv("BLOSSOM_API_TOKEN_MAX_AGE", 60 * 60))
 
 # Password validation
 # https://docs.djangoproject.com/en/2.2/ref/settings/#auth-password-validators
@@ -259,6 +278,78 @@ OVERRIDE_HOST = None
 
 OVERRIDE_API_AUTH = False
 
+# The number of seconds for which a verified API key is remembered, so the key
+# does not have to be hashed on every request. Set to 0 to disable the cache.
+# With API_KEY_CACHE_SHARED, the verified keys are also shared between
+# processes through the default cache.
+API_KEY_CACHE_TIMEOUT = int(os.getenv("BLOSSOM_API_KEY_CACHE_TIMEOUT", 300))
+API_KEY_CACHE_SHARED = bool(os.getenv("BLOSSOM_API_KEY_CACHE_SHARED", ""))
+
+# The number of seconds for which the navbar and terms of service, which are on
+# every page of the website, are cached. Changes to the posts clear the cache.
+SITE_CHROME_CACHE_TIMEOUT = int(os.getenv("BLOSSOM_SITE_CHROME_CACHE_TIMEOUT", 300))
+
+# The number of seconds for which the pages of the website and the engineering
+# blog are cached for anonymous visitors. Changes to the posts clear the cache.
+# Set to 0 to disable the cache.
+PAGE_CACHE_TIMEOUT = int(os.getenv("BLOSSOM_PAGE_CACHE_TIMEOUT", 600))
+
+# The number of seconds after which every process checks the shared cache again
+# for changes to the posts, which clear the cached pages and site chrome.
+CACHE_GENERATION_CHECK_INTERVAL = int(os.getenv("BLOSSOM_CACHE_GENERATION_CHECK_INTERVAL", 5))
+
+# The number of Reddit clients of volunteers that are kept between requests, so
+# their access tokens are reused until they expire.
+REDDIT_CLIENT_CACHE_SIZE = int(os.getenv("BLOSSOM_REDDIT_CLIENT_CACHE_SIZE", 256))
+
+# The number of seconds for which the flair templates of a subreddit are cached.
+# They are fetched again before that when a flair can't be found among them.
+FLAIR_TEMPLATE_CACHE_TIMEOUT = int(os.getenv("BLOSSOM_FLAIR_TEMPLATE_CACHE_TIMEOUT", 60 * 60))
+
+# The number of requests per second that are made to Reddit until it has reported
+# how much of the rate limit is left, and the number of requests that can be made
+# right after each other. On exit, the queued actions are given
+# REDDIT_ACTION_EXIT_TIMEOUT seconds to be run.
+REDDIT_ACTION_RATE = float(os.getenv("BLOSSOM_REDDIT_ACTION_RATE", 1))
+REDDIT_ACTION_BURST = int(os.getenv("BLOSSOM_REDDIT_ACTION_BURST", 10))
+REDDIT_ACTION_EXIT_TIMEOUT = int(os.getenv("BLOSSOM_REDDIT_ACTION_EXIT_TIMEOUT", 10))
+
+# Where the images proxied for OpenSeaDragon are kept, and the maximum number of
+# bytes they take up there. The images which haven't been used for the longest
+# time are removed first. Browsers may keep them for IMAGE_CACHE_MAX_AGE seconds.
+IMAGE_CACHE_DIR = os.getenv(
+    "BLOSSOM_IMAGE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "blossom-images")
+)
+IMAGE_CACHE_MAX_BYTES = int(os.getenv("BLOSSOM_IMAGE_CACHE_MAX_BYTES", 1024**3))
+IMAGE_CACHE_MAX_AGE = 60 * 60 * 24
+# The number of seconds to wait for the upstream host of a proxied image.
+IMAGE_CACHE_UPSTREAM_TIMEOUT = 10
+
+# Where the Deep Zoom tile pyramids of the submission images are kept, the
+# maximum number of bytes they take up there and the number of processes that
+# generate them. The pyramids which haven't been viewed for the longest time are
+# removed first.
+TILE_DIR = os.getenv("BLOSSOM_TILE_DIR", os.path.join(tempfile.gettempdir(), "blossom-tiles"))
+TILE_DIR_MAX_BYTES = int(os.getenv("BLOSSOM_TILE_DIR_MAX_BYTES", 1024**3))
+TILE_WORKERS = int(os.getenv("BLOSSOM_TILE_WORKERS", 2))
+
+# The number of seconds for which the rules of a subreddit are served from the
+# cache, and for how much longer old rules are served while they are fetched
+# again in the background. When Reddit doesn't answer within the upstream
+# timeout, it isn't asked again for the negative timeout.
+SUBREDDIT_RULES_CACHE_TIMEOUT = int(os.getenv("BLOSSOM_SUBREDDIT_RULES_CACHE_TIMEOUT", 60 * 60 * 6))
+SUBREDDIT_RULES_STALE_TIMEOUT = int(
+    os.getenv("BLOSSOM_SUBREDDIT_RULES_STALE_TIMEOUT", 60 * 60 * 24 * 7)
+)
+SUBREDDIT_RULES_NEGATIVE_TIMEOUT = int(os.getenv("BLOSSOM_SUBREDDIT_RULES_NEGATIVE_TIMEOUT", 60))
+SUBREDDIT_RULES_UPSTREAM_TIMEOUT = 3
+
+# The maximum number of seconds that a long-polling request waits for new work.
+# Requests only wait on workers which handle requests concurrently, e.g.
+# gunicorn with `--threads` or gevent workers; run the transcribot pollers
+# against such a pool, as the default sync workers answer right away instead.
+LONG_POLL_MAX_WAIT = int(os.getenv("BLOSSOM_LONG_POLL_MAX_WAIT", 30))
+
 # number of hours to allow a post to stay up
 ARCHIVIST_DELAY_TIME = 18
 OVERRIDE_ARCHIVIST_DELAY_TIME = None  # for testing
@@ -294,6 +385,7 @@ OCR_DEBUG_MODE = bool(os.getenv("OCR_DEBUG_MODE", ""))
 
 ENABLE_REDDIT = True  # enable access to reddit at all
 ENABLE_APP = False  # enable the routes for thetranscription.app
+ENABLE_TILES = True  # cut the submission images into tiles, if Pillow is installed
 
 IMAGE_DOMAINS = [
     "imgur.com",
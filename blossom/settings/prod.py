@@ -6,6 +6,19 @@ from blossom.settings.base import *  # noqa: F401,F403
 ENVIRONMENT = "prod"
 MIDDLEWARE = ["bugsnag.django.middleware.BugsnagMiddleware"] + MIDDLEWARE  # noqa: F405
 
+# The cache is shared by all workers, so the cached pages, site chrome and
+# subreddit rules are cleared for every worker when they change. Pages and site
+# chrome are served from the memory of the worker; the cache is only checked
+# for changes every CACHE_GENERATION_CHECK_INTERVAL seconds. The table is
+# created by `prepare_site`.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "blossom_cache",
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    }
+}
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
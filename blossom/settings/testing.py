@@ -49,3 +49,4 @@ LOGGING = {
 ENABLE_SLACK = False
 ENABLE_OCR = False
 ENABLE_REDDIT = False
+ENABLE_TILES = False
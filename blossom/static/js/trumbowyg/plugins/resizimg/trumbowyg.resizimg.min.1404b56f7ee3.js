@@ -0,0 +1 @@
+!function(e){"use strict";function i(e){return e.preventDefault()}function n(e){e.$ed.find("img.resizable").resizable("destroy").off("mousedown",i).removeClass("resizable"),e.syncTextarea()}var t={minSize:32,step:4};e.extend(!0,e.trumbowyg,{plugins:{resizimg:{init:function(o){function r(){o.$ed.find("img:not(.resizable)").resizable(o.o.plugins.resizimg.resizable).on("mousedown",i)}o.o.plugins.resizimg=e.extend(!0,{},t,o.o.plugins.resizimg||{},{resizable:{resizeWidth:!1,onDragStart:function(e,i){var n=o.o.plugins.resizimg,t=e.pageX-i.offset().left,r=e.pageY-i.offset().top;if(t<i.width()-n.minSize||r<i.height()-n.minSize)return!1},onDrag:function(e,i,n,t){var r=o.o.plugins.resizimg;return t<r.minSize&&(t=r.minSize),t-=t%r.step,i.height(t),!1},onDragEnd:function(){o.syncCode()}}}),o.$c.on("tbwinit",r),o.$c.on("tbwfocus",r),o.$c.on("tbwchange",r),o.$c.on("tbwblur",function(){n(o)}),o.$c.on("tbwclose",function(){n(o)})},destroy:function(e){n(e)}}}})}(jQuery);
\ No newline at end of file
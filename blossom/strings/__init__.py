@@ -1,12 +1,37 @@
 """The place where all of our user-facing strings live."""
 
 import os
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 import toml
 from django.conf import settings
 
+# The loaded strings of every language, shared by the whole process.
+_catalogs: Dict[str, Mapping[str, Any]] = {}
+_catalogs_lock = threading.Lock()
 
-def translation(lang: str = "en_US") -> dict:
-    """Load and provide the strings file."""
-    with open(os.path.join(settings.BASE_DIR, "strings", f"{lang}.toml"), "r") as f:
-        return toml.loads(f.read())
+
+def _freeze(value: Any) -> Any:
+    """Make the parsed strings read-only, as they are shared by all modules."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def translation(lang: str = "en_US") -> Mapping[str, Any]:
+    """Load and provide the strings file.
+
+    The file is only parsed the first time the strings of the language are
+    requested; afterwards, every caller shares the same read-only mapping.
+    """
+    if (catalog := _catalogs.get(lang)) is not None:
+        return catalog
+    with _catalogs_lock:
+        if lang not in _catalogs:
+            with open(os.path.join(settings.BASE_DIR, "strings", f"{lang}.toml"), "r") as f:
+                _catalogs[lang] = _freeze(toml.loads(f.read()))
+        return _catalogs[lang]
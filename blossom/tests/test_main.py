@@ -0,0 +1,26 @@
+from blossom.main import parse_importtime
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       112 |        112 |   _io
+import time:        48 |         48 |   marshal
+import time:       350 |        510 | encodings
+import time:      1204 |      15832 | django.db.models
+Some other output
+"""
+
+
+def test_parse_importtime() -> None:
+    """Verify that the times of the imported modules are read from the output."""
+    assert parse_importtime(IMPORTTIME_OUTPUT) == [
+        (112, 112, "_io"),
+        (48, 48, "marshal"),
+        (350, 510, "encodings"),
+        (1204, 15832, "django.db.models"),
+    ]
+
+
+def test_parse_importtime_empty() -> None:
+    """Verify that output without import times results in no modules."""
+    assert parse_importtime("") == []
+    assert parse_importtime("Traceback (most recent call last):\n") == []
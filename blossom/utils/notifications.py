@@ -0,0 +1,136 @@
+"""Notifications of new work for the requests that wait for it (long polling).
+
+Within a process, the waiting requests are woken through a condition variable.
+On Postgres, the notifications are also sent through NOTIFY, so requests that
+wait in other worker processes are woken as well: every process that has
+waiting requests runs a thread that LISTENs to the channels.
+"""
+import logging
+import select
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, TypeVar
+
+from django.db import connections, transaction
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# The Postgres channels are prefixed, as they are shared with anything else
+# that uses the database.
+CHANNEL_PREFIX = "blossom_"
+CHANNELS = ("submission", "transcription")
+
+
+class Notifier:
+    """Keeps track of how often each channel has been notified in this process."""
+
+    def __init__(self) -> None:
+        """Initialize the notifier without any notifications."""
+        self._condition = threading.Condition()
+        self._versions: Dict[str, int] = {channel: 0 for channel in CHANNELS}
+
+    def versions(self, channels: Iterable[str]) -> Dict[str, int]:
+        """Get the number of notifications so far for each of the given channels."""
+        with self._condition:
+            return {channel: self._versions[channel] for channel in channels}
+
+    def notify(self, channel: str) -> None:
+        """Wake all requests waiting on the given channel in this process."""
+        with self._condition:
+            self._versions[channel] += 1
+            self._condition.notify_all()
+
+    def wait(self, versions: Dict[str, int], timeout: float) -> bool:
+        """Wait until any of the channels is notified after the given versions.
+
+        :param versions: the versions of the channels from before checking for work
+        :param timeout: the maximum number of seconds to wait
+        :return: whether a notification was received before the timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: any(self._versions[key] != value for key, value in versions.items()),
+                timeout,
+            )
+
+
+notifier = Notifier()
+_listener_lock = threading.Lock()
+_listener: Optional[threading.Thread] = None
+
+
+def _listen() -> None:
+    """Forward the notifications from Postgres to the requests in this process."""
+    while True:
+        connection = connections["default"]
+        try:
+            connection.ensure_connection()
+            with connection.cursor() as cursor:
+                for channel in CHANNELS:
+                    cursor.execute(f"LISTEN {CHANNEL_PREFIX}{channel}")
+            raw = connection.connection
+            while True:
+                if select.select([raw], [], [], 60) == ([], [], []):
+                    continue
+                raw.poll()
+                while raw.notifies:
+                    channel = raw.notifies.pop(0).channel[len(CHANNEL_PREFIX) :]
+                    if channel in CHANNELS:
+                        notifier.notify(channel)
+        except Exception:
+            log.exception("Lost the connection listening for notifications, reconnecting.")
+            connection.close()
+            time.sleep(5)
+
+
+def _ensure_listener() -> None:
+    """Start listening to the notifications from other processes, if not done yet."""
+    global _listener
+    if connections["default"].vendor != "postgresql" or _listener is not None:
+        return
+    with _listener_lock:
+        if _listener is None:
+            _listener = threading.Thread(target=_listen, name="notification-listener", daemon=True)
+            _listener.start()
+
+
+def _publish(channel: str) -> None:
+    notifier.notify(channel)
+    connection = connections["default"]
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, '')", [CHANNEL_PREFIX + channel])
+
+
+def publish(channel: str) -> None:
+    """Notify the waiting requests of new work on the channel.
+
+    The notification is sent once the current transaction is committed, so
+    the requests that are woken can see the new work.
+    """
+    transaction.on_commit(lambda: _publish(channel))
+
+
+def wait_for_work(channels: Iterable[str], timeout: float, fetch: Callable[[], T]) -> T:
+    """Fetch the work, waiting up to the timeout for new work if there is none.
+
+    The work is fetched again every time one of the channels is notified,
+    until any work is found or the timeout expires.
+
+    :param channels: the channels that are notified when new work appears
+    :param timeout: the maximum number of seconds to wait for work
+    :param fetch: the function which fetches the work, returning something falsy
+        when there is none
+    :return: the work which was fetched last
+    """
+    deadline = time.monotonic() + timeout
+    if timeout > 0:
+        _ensure_listener()
+    while True:
+        versions = notifier.versions(channels)
+        work = fetch()
+        remaining = deadline - time.monotonic()
+        if work or remaining <= 0 or not notifier.wait(versions, remaining):
+            return work
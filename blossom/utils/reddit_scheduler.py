@@ -0,0 +1,176 @@
+"""Run the actions on Reddit in the background without running into its rate limit.
+
+Reddit allows every OAuth client a fixed number of requests per window, and
+reports how many are left in the headers of every response. The actions are
+run one at a time by a background thread, spaced out by a token bucket whose
+rate follows the remaining quota. Every action is charged the requests that it
+has made, as an action can take several. Actions which supersede each other,
+like two flair changes of the same post, are merged while they are waiting, so
+only the last one is sent to Reddit.
+
+The bucket is kept per process, while all workers of the server (three under
+gunicorn) share the quota of the same OAuth client. Each worker paces itself by
+the whole remaining quota and has its own burst of `REDDIT_ACTION_BURST`
+requests, so together they can use it up to three times as fast.
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from django.conf import settings
+
+from blossom.reddit import REDDIT
+
+log = logging.getLogger(__name__)
+
+# A waiting action: the function with its arguments and when it was queued.
+Action = Tuple[Callable, tuple, dict, float]
+
+
+class RedditScheduler:
+    def __init__(self, rate: float, burst: int) -> None:
+        """Create the scheduler with the default number of requests per second.
+
+        :param rate: the number of requests per second while Reddit hasn't
+            reported the remaining quota yet
+        :param burst: the number of requests that can be made right after each other
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._refilled = time.monotonic()
+        self._pending: "OrderedDict[Hashable, Action]" = OrderedDict()
+        self._running = False
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, key: Optional[Hashable], func: Callable, *args: Any, **kwargs: Any) -> None:
+        """Queue the action, replacing the waiting action with the same key.
+
+        The replacing action keeps the place and the queue time of the one it
+        replaces, so merging actions never delays them.
+        """
+        with self._condition:
+            key = object() if key is None else key
+            queued = self._pending[key][3] if key in self._pending else time.monotonic()
+            self._pending[key] = (func, args, kwargs, queued)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._work, daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued actions have been run, or until the timeout passes.
+
+        :return: whether all actions have been run
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._running, timeout
+            )
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+
+    def _take(self) -> Action:
+        """Wait for an action and for the rate limit to allow running it."""
+        with self._condition:
+            while True:
+                self._refill()
+                if self._pending and self._tokens >= 1:
+                    self._tokens -= 1
+                    self._running = True
+                    return self._pending.popitem(last=False)[1]
+                timeout = None if not self._pending else (1 - self._tokens) / self.rate
+                self._condition.wait(timeout)
+
+    def _get_used(self) -> Optional[int]:
+        """Get the number of requests that Reddit reports have been used in the window."""
+        if not settings.ENABLE_REDDIT:
+            return None
+        return REDDIT.auth.limits.get("used")
+
+    def _update_rate(self, used_before: Optional[int]) -> None:
+        """Charge the requests of the last action and follow the quota that is left.
+
+        The action has already been charged one request. Reddit reports how many
+        requests have been used, so the others are charged afterwards, and the
+        quota that is left is spread over the rest of the window.
+        """
+        if not settings.ENABLE_REDDIT:
+            return
+        limits = REDDIT.auth.limits
+        used, remaining, reset = (
+            limits.get("used"),
+            limits.get("remaining"),
+            limits.get("reset_timestamp"),
+        )
+        with self._condition:
+            if used is not None and used_before is not None:
+                # The count starts again when the window is reset during the action
+                requests = used - used_before if used >= used_before else used
+                self._tokens -= max(requests - 1, 0)
+            if remaining is not None and reset is not None:
+                # Never stop completely, in case the window was reset in the meantime
+                self.rate = max(remaining, 1) / max(reset - time.time(), 1)
+
+    def _work(self) -> None:
+        from blossom.utils.workers import report_failure
+
+        while True:
+            func, args, kwargs, queued = self._take()
+            log.info(
+                f"Running {func.__name__} on Reddit after"
+                f" {time.monotonic() - queued:.2f}s in the queue."
+            )
+            try:
+                used_before = self._get_used()
+                try:
+                    func(*args, **kwargs)
+                finally:
+                    # Failed actions may have made requests as well. Guarded so
+                    # that the error of the action itself is the one reported.
+                    try:
+                        self._update_rate(used_before)
+                    except Exception:
+                        log.exception("Could not update the rate of the Reddit actions.")
+            except:  # noqa: E722
+                report_failure()
+            finally:
+                with self._condition:
+                    self._running = False
+                    self._condition.notify_all()
+
+
+scheduler = RedditScheduler(settings.REDDIT_ACTION_RATE, settings.REDDIT_ACTION_BURST)
+# so we don't exit too soon, but don't hang when Reddit is slow either
+atexit.register(scheduler.join, settings.REDDIT_ACTION_EXIT_TIMEOUT)
+
+
+def send_to_reddit(merge_key: Optional[Callable[..., Hashable]] = None) -> Callable:
+    """Run the decorated function in the background, within the rate limit of Reddit.
+
+    Like `send_to_worker`, the function is run directly when it's called with
+    the `worker_test_mode` argument.
+
+    :param merge_key: gets the key of the action from the arguments; a waiting
+        action is replaced by a new one with the same key
+    """
+
+    def wrapper(func: Callable) -> Callable:
+        def decorator(*args: Any, **kwargs: Any) -> None:
+            if "worker_test_mode" in kwargs:
+                del kwargs["worker_test_mode"]
+                return func(*args, **kwargs)
+
+            key = (func.__name__, merge_key(*args, **kwargs)) if merge_key else None
+            scheduler.submit(key, func, *args, **kwargs)
+
+        return decorator
+
+    return wrapper
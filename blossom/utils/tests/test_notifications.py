@@ -0,0 +1,65 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+from django.test import TestCase
+
+from blossom.utils import notifications
+from blossom.utils.notifications import notifier, wait_for_work
+from blossom.utils.test_helpers import create_submission, create_transcription, create_user
+
+
+def test_wait_for_work_available() -> None:
+    """Verify that available work is returned without waiting."""
+    fetch = MagicMock(return_value=[1])
+    start = time.monotonic()
+    assert wait_for_work(["transcription"], 5, fetch) == [1]
+    assert time.monotonic() - start < 1
+    assert fetch.call_count == 1
+
+
+def test_wait_for_work_timeout() -> None:
+    """Verify that the waiting stops after the timeout when no work appears."""
+    fetch = MagicMock(return_value=[])
+    start = time.monotonic()
+    assert wait_for_work(["transcription"], 0.2, fetch) == []
+    assert time.monotonic() - start >= 0.2
+    assert fetch.call_count == 1
+
+
+def test_wait_for_work_notified() -> None:
+    """Verify that the work is fetched again as soon as the channel is notified."""
+    fetch = MagicMock(side_effect=[[], [1]])
+    timer = threading.Timer(0.1, notifier.notify, ["transcription"])
+    timer.start()
+    start = time.monotonic()
+    assert wait_for_work(["transcription"], 5, fetch) == [1]
+    assert time.monotonic() - start < 1
+    timer.join()
+
+
+def test_wait_for_work_other_channel() -> None:
+    """Verify that notifications on other channels don't wake the request."""
+    fetch = MagicMock(return_value=[])
+    timer = threading.Timer(0.05, notifier.notify, ["submission"])
+    timer.start()
+    assert wait_for_work(["transcription"], 0.2, fetch) == []
+    assert fetch.call_count == 1
+    timer.join()
+
+
+def test_publish_on_create() -> None:
+    """Verify that new submissions and transcriptions notify after the commit."""
+    before = notifier.versions(notifications.CHANNELS)
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        submission = create_submission()
+        assert notifier.versions(notifications.CHANNELS) == before
+
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        create_transcription(submission, create_user())
+        submission.save()
+
+    assert notifier.versions(notifications.CHANNELS) == {
+        "submission": before["submission"] + 1,
+        "transcription": before["transcription"] + 1,
+    }
@@ -0,0 +1,102 @@
+import sys
+import threading
+import time
+from typing import List
+from unittest.mock import MagicMock, patch
+
+from pytest_django.fixtures import SettingsWrapper
+
+from blossom.utils.reddit_scheduler import RedditScheduler
+
+
+def test_scheduler_merges_actions() -> None:
+    """Verify that a waiting action is replaced by a new one with the same key."""
+    scheduler = RedditScheduler(rate=1000, burst=1)
+    release = threading.Event()
+    calls: List[int] = []
+
+    scheduler.submit(None, release.wait)
+    scheduler.submit("flair", calls.append, 1)
+    scheduler.submit(None, calls.append, 2)
+    scheduler.submit("flair", calls.append, 3)
+    release.set()
+    scheduler.join()
+
+    # The merged action keeps the place of the first one
+    assert calls == [3, 2]
+
+
+def test_scheduler_rate_limit() -> None:
+    """Verify that the actions are spaced out once the burst has been used."""
+    scheduler = RedditScheduler(rate=20, burst=1)
+    times: List[float] = []
+
+    for _ in range(3):
+        scheduler.submit(None, lambda: times.append(time.monotonic()))
+    scheduler.join()
+
+    assert len(times) == 3
+    assert times[2] - times[0] >= 0.09
+
+
+def test_scheduler_follows_quota(settings: SettingsWrapper) -> None:
+    """Verify that the rate is set from the quota which Reddit reports."""
+    settings.ENABLE_REDDIT = True
+    scheduler = RedditScheduler(rate=1, burst=1)
+    limits = {"remaining": 50, "reset_timestamp": time.time() + 100}
+
+    with patch("blossom.utils.reddit_scheduler.REDDIT", MagicMock(auth=MagicMock(limits=limits))):
+        scheduler.submit(None, lambda: None)
+        scheduler.join()
+
+    assert 0.45 < scheduler.rate < 0.55
+
+
+def test_scheduler_charges_requests(settings: SettingsWrapper) -> None:
+    """Verify that an action is charged every request that it makes."""
+    settings.ENABLE_REDDIT = True
+    scheduler = RedditScheduler(rate=1, burst=5)
+    limits = {"used": 10}
+
+    def action() -> None:
+        limits["used"] += 3
+
+    with patch("blossom.utils.reddit_scheduler.REDDIT", MagicMock(auth=MagicMock(limits=limits))):
+        scheduler.submit(None, action)
+        scheduler.join()
+
+    assert 1.9 < scheduler._tokens < 2.1
+
+
+def test_scheduler_reports_action_error(settings: SettingsWrapper) -> None:
+    """Verify that a failing rate update doesn't replace the error of the action."""
+    settings.ENABLE_REDDIT = True
+    scheduler = RedditScheduler(rate=1000, burst=1)
+    limits = MagicMock(get=MagicMock(side_effect=[None, KeyError("limits")]))
+    reported: List[str] = []
+
+    def action() -> None:
+        raise ValueError("action")
+
+    with patch(
+        "blossom.utils.reddit_scheduler.REDDIT", MagicMock(auth=MagicMock(limits=limits))
+    ), patch(
+        "blossom.utils.workers.report_failure",
+        lambda: reported.append(repr(sys.exc_info()[1])),
+    ):
+        scheduler.submit(None, action)
+        scheduler.join()
+
+    assert reported == ["ValueError('action')"]
+
+
+def test_scheduler_join_timeout() -> None:
+    """Verify that waiting for the actions can be given up."""
+    scheduler = RedditScheduler(rate=1000, burst=1)
+    release = threading.Event()
+
+    scheduler.submit(None, release.wait)
+
+    assert not scheduler.join(timeout=0.05)
+    release.set()
+    assert scheduler.join(timeout=5)
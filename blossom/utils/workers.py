@@ -11,6 +11,23 @@ from django.conf import settings
 log = logging.getLogger(__name__)
 
 
+def report_failure() -> None:
+    """Report the exception that is being handled by a background task."""
+    import traceback
+
+    # prevent circular dependency
+    from blossom.api.slack import client
+
+    details = traceback.format_exc()
+    message = f"Background worker exception: ```{details}```"
+    if settings.ENABLE_SLACK:
+        client.chat_postMessage(
+            channel=settings.SLACK_DEFAULT_CHANNEL,
+            text=message,
+        )
+    log.error(message)
+
+
 def _worker() -> None:
     """Create worker for background tasks."""
     while True:
@@ -18,19 +35,7 @@ def _worker() -> None:
         try:
             func(*args, **kwargs)
         except:  # noqa: E722
-            import traceback
-
-            # prevent circular dependency
-            from blossom.api.slack import client
-
-            details = traceback.format_exc()
-            message = f"Background worker exception: ```{details}```"
-            if settings.ENABLE_SLACK:
-                client.chat_postMessage(
-                    channel=settings.SLACK_DEFAULT_CHANNEL,
-                    text=message,
-                )
-            log.error(message)
+            report_failure()
         finally:
             _queue.task_done()  # so we can join at exit
 
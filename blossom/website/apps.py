@@ -1,5 +1,14 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class WebsiteConfig(AppConfig):
     name = "blossom.website"
+
+    def ready(self) -> None:
+        """Clear the cached site chrome and pages whenever a post changes."""
+        from blossom.website.helpers import clear_anonymous_pages, clear_site_chrome
+
+        for receiver in (clear_site_chrome, clear_anonymous_pages):
+            post_save.connect(receiver, sender="website.Post")
+            post_delete.connect(receiver, sender="website.Post")
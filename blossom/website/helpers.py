@@ -1,22 +1,125 @@
-from typing import Dict
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
 from django.db.models import Q
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 
 from blossom.website.models import Post
 
 
+class SharedGeneration:
+    """A generation number in the shared cache, bumped to clear a cache in every process.
+
+    Every process keeps the number it has last seen and only looks it up in
+    the shared cache again after CACHE_GENERATION_CHECK_INTERVAL seconds, so
+    the things keyed by it are served from memory in the meantime. A bump in
+    another process is therefore noticed after at most that interval.
+    """
+
+    def __init__(self, key: str) -> None:
+        """Initialize the generation, stored in the shared cache under the given key."""
+        self.key = key
+        self._value = 0
+        self._checked = float("-inf")
+        self._lock = threading.Lock()
+
+    def get(self) -> int:
+        """Get the current generation, checking the shared cache if it's time to."""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._checked >= settings.CACHE_GENERATION_CHECK_INTERVAL:
+                value = cache.get(self.key)
+                if value is None:
+                    # Never go back to an earlier generation when the key is lost
+                    value = time.time_ns()
+                    cache.add(self.key, value, None)
+                    value = cache.get(self.key, value)
+                self._value = value
+                self._checked = now
+            return self._value
+
+    def bump(self) -> None:
+        """Start a new generation, in this process right away."""
+        with self._lock:
+            self._value = time.time_ns()
+            self._checked = time.monotonic()
+            cache.set(self.key, self._value, None)
+
+
+# The navbar and the terms of service, which are shown on every page.
+SiteChrome = Tuple[List[Post], Optional[Post]]
+
+SITE_CHROME_CACHE_KEY = "website:site_chrome"
+SITE_CHROME_GENERATION_KEY = "website:site_chrome_generation"
+
+_site_chrome_generation = SharedGeneration(SITE_CHROME_GENERATION_KEY)
+
+# The site chrome of this process, with the time at which it expires and the
+# generation it belongs to.
+_site_chrome: Optional[Tuple[float, int, SiteChrome]] = None
+
+
+def _load_site_chrome() -> SiteChrome:
+    navbar = list(
+        Post.objects.filter(Q(published=True) & Q(standalone_section=True)).order_by("header_order")
+    )
+    tos = Post.objects.filter(slug="terms-of-service").first()
+    return navbar, tos
+
+
+def get_site_chrome() -> SiteChrome:
+    """Get the posts in the navbar and the terms of service.
+
+    These are needed for every page, so they are kept in this process and in
+    the shared cache for SITE_CHROME_CACHE_TIMEOUT seconds. Like the cached
+    pages, they are keyed by a `SharedGeneration`, which `clear_site_chrome`
+    bumps when a post changes, so every process sharing the cache stops using
+    the old posts within a few seconds, without asking the shared cache on
+    every page.
+    """
+    global _site_chrome
+    now = time.monotonic()
+    generation = _site_chrome_generation.get()
+    if _site_chrome is not None:
+        expires, chrome_generation, chrome = _site_chrome
+        if expires > now and chrome_generation == generation:
+            return chrome
+
+    key = f"{SITE_CHROME_CACHE_KEY}:{generation}"
+    chrome = cache.get(key)
+    if chrome is None:
+        chrome = _load_site_chrome()
+        # A missing terms of service is not cached, so it is noticed right away
+        # once the site has been bootstrapped.
+        if chrome[1] is not None:
+            cache.set(key, chrome, settings.SITE_CHROME_CACHE_TIMEOUT)
+    if chrome[1] is not None:
+        _site_chrome = (now + settings.SITE_CHROME_CACHE_TIMEOUT, generation, chrome)
+    return chrome
+
+
+def clear_site_chrome(**kwargs: Any) -> None:
+    """Clear the cached site chrome, as connected to the changes of the posts."""
+    global _site_chrome
+    _site_chrome = None
+    _site_chrome_generation.bump()
+
+
 def get_additional_context(context: Dict = None) -> Dict:
     """Build the default context dictionary for the views."""
     if not context:
         context = {}
-    context["navbar"] = Post.objects.filter(
-        Q(published=True) & Q(standalone_section=True)
-    ).order_by("header_order")
-    try:
-        context["tos"] = Post.objects.get(slug="terms-of-service")
-    except Post.DoesNotExist:
+    context["navbar"], context["tos"] = get_site_chrome()
+    if context["tos"] is None:
         if settings.ENVIRONMENT == "testing":
             raise ImproperlyConfigured(
                 "The test site is not built yet; did you remember to add the"
@@ -29,3 +132,117 @@ def get_additional_context(context: Dict = None) -> Dict:
                 " --settings=blossom.local_settings` on dev."
             )
     return context
+
+
+# A cached page: its content, content type and ETag.
+CachedPage = Tuple[bytes, str, str]
+
+
+class AnonymousPageCache:
+    """Cache of the pages of the website as they are shown to anonymous visitors.
+
+    The pages only change when a post is changed, so they are rendered once
+    and kept in this process and in the shared cache for PAGE_CACHE_TIMEOUT
+    seconds. The pages are keyed by a `SharedGeneration`, which is bumped when
+    a post changes, so all processes sharing the cache stop using the old
+    pages within a few seconds, while pages in memory are served without
+    asking the shared cache.
+    """
+
+    CACHE_PREFIX = "website:page:"
+    GENERATION_KEY = "website:page_generation"
+
+    def __init__(self, max_size: int = 256) -> None:
+        """Initialize the cache, holding at most the given number of pages locally."""
+        self.max_size = max_size
+        self._pages: OrderedDict[str, Tuple[float, CachedPage]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = SharedGeneration(self.GENERATION_KEY)
+
+    def _key(self, request: HttpRequest) -> str:
+        generation = self.generation.get()
+        return f"{self.CACHE_PREFIX}{generation}:{request.get_host()}{request.path}"
+
+    def get(self, request: HttpRequest) -> Optional[CachedPage]:
+        """Get the cached page for the request, if there is one."""
+        key = self._key(request)
+        with self._lock:
+            entry = self._pages.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._pages.move_to_end(key)
+                return entry[1]
+            self._pages.pop(key, None)
+        page = cache.get(key)
+        if page is not None:
+            self._set_local(key, tuple(page))
+        return page
+
+    def _set_local(self, key: str, page: CachedPage) -> None:
+        with self._lock:
+            self._pages[key] = (time.monotonic() + settings.PAGE_CACHE_TIMEOUT, page)
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.max_size:
+                self._pages.popitem(last=False)
+
+    def set(self, request: HttpRequest, response: HttpResponse) -> CachedPage:
+        """Cache the rendered page of the response for the request."""
+        content = response.content
+        page = (content, response["Content-Type"], quote_etag(hashlib.md5(content).hexdigest()))
+        key = self._key(request)
+        self._set_local(key, page)
+        cache.set(key, page, settings.PAGE_CACHE_TIMEOUT)
+        return page
+
+    def clear(self) -> None:
+        """Remove all pages, both in this process and in the shared cache."""
+        with self._lock:
+            self._pages.clear()
+        self.generation.bump()
+
+
+anonymous_pages = AnonymousPageCache()
+
+
+def clear_anonymous_pages(**kwargs: Any) -> None:
+    """Clear the cached pages, as connected to the changes of the posts."""
+    anonymous_pages.clear()
+
+
+def cache_anonymous_page(view: Callable[..., HttpResponse]) -> Callable[..., HttpResponse]:
+    """Serve the page from the cache to anonymous visitors.
+
+    Only successful responses to plain GET requests (without a query string)
+    are cached; logged in users always get a freshly rendered page. Cached
+    pages carry an ETag, so browsers can revalidate them for free.
+    """
+
+    @wraps(view)
+    def wrapper(request: HttpRequest, *args: object, **kwargs: object) -> HttpResponse:
+        if (
+            settings.PAGE_CACHE_TIMEOUT <= 0
+            or request.method not in ("GET", "HEAD")
+            or request.GET
+            or request.user.is_authenticated
+        ):
+            return view(request, *args, **kwargs)
+
+        page = anonymous_pages.get(request)
+        if page is None:
+            response = view(request, *args, **kwargs)
+            if response.status_code != 200 or response.streaming:
+                return response
+            if hasattr(response, "render") and callable(response.render):
+                response.render()
+            if response.cookies:
+                # The page is specific to this visitor after all
+                return response
+            page = anonymous_pages.set(request, response)
+
+        content, content_type, etag = page
+        if not_modified := get_conditional_response(request, etag=etag):
+            return not_modified
+        response = HttpResponse(content, content_type=content_type)
+        response["ETag"] = etag
+        return response
+
+    return wrapper
@@ -1,8 +1,14 @@
+from typing import Any
+
 import pytest
 from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from pytest_django.fixtures import SettingsWrapper
 
-from blossom.website.helpers import get_additional_context
+from blossom.website import helpers
+from blossom.website.helpers import SharedGeneration, clear_site_chrome, get_additional_context
 from blossom.website.models import Post
 
 
@@ -30,3 +36,70 @@ def test_bootstrap_check(settings: SettingsWrapper) -> None:
 
     with pytest.raises(ImproperlyConfigured):
         get_additional_context({})
+
+
+def test_site_chrome_cached(django_assert_num_queries: Any) -> None:
+    """Verify that the navbar and terms of service are only queried once."""
+    get_additional_context({})
+
+    with django_assert_num_queries(0):
+        context = get_additional_context({})
+
+    assert context["tos"].slug == "terms-of-service"
+    assert [post.title for post in context["navbar"]] == [
+        post.title
+        for post in Post.objects.filter(published=True, standalone_section=True).order_by(
+            "header_order"
+        )
+    ]
+
+
+def test_site_chrome_cleared_on_change() -> None:
+    """Verify that changes to the posts are visible right away."""
+    navbar = get_additional_context({})["navbar"]
+    post = navbar[0]
+    post.title = "Changed title"
+    post.save()
+
+    assert "Changed title" in [post.title for post in get_additional_context({})["navbar"]]
+
+    post.delete()
+
+    assert post.id not in [post.id for post in get_additional_context({})["navbar"]]
+
+
+def test_site_chrome_shared(
+    settings: SettingsWrapper, django_assert_num_queries: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify that the site chrome is shared with other processes through the cache."""
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "test_site_chrome",
+        }
+    }
+    call_command("createcachetable")
+    monkeypatch.setattr(
+        helpers, "_site_chrome_generation", SharedGeneration(helpers.SITE_CHROME_GENERATION_KEY)
+    )
+    clear_site_chrome()
+    get_additional_context({})
+
+    # The copy in memory is used without asking the shared cache
+    with django_assert_num_queries(0):
+        get_additional_context({})
+
+    # Another process only has the shared cache
+    helpers._site_chrome = None
+    with django_assert_num_queries(1):
+        context = get_additional_context({})
+    assert context["tos"].slug == "terms-of-service"
+
+    # A change in another process is noticed once the shared cache is checked again
+    SharedGeneration(helpers.SITE_CHROME_GENERATION_KEY).bump()
+    with django_assert_num_queries(0):
+        get_additional_context({})
+    settings.CACHE_GENERATION_CHECK_INTERVAL = 0
+    with CaptureQueriesContext(connection) as queries:
+        get_additional_context({})
+    assert any("website_post" in query["sql"] for query in queries)
@@ -1,7 +1,13 @@
-from django.test import Client
+from typing import Any
+
+import pytest
+from django.core.management import call_command
+from django.test import Client, RequestFactory
+from pytest_django.fixtures import SettingsWrapper
 
 from blossom.authentication.models import BlossomUser
 from blossom.tests.helpers import create_test_user
+from blossom.website.helpers import AnonymousPageCache, SharedGeneration, anonymous_pages
 from blossom.website.models import Post
 
 
@@ -60,3 +66,79 @@ def test_homepage_post_view(client: Client, django_user_model: BlossomUser) -> N
     assert len(resp.context["posts"]) == 2
     assert p1 in resp.context["posts"]
     assert p2 in resp.context["posts"]
+
+
+def test_homepage_cached_for_anonymous_visitors(
+    client: Client, django_user_model: BlossomUser, django_assert_num_queries: Any
+) -> None:
+    """Verify that the homepage is only rendered once for anonymous visitors."""
+    first = client.get("/")
+    assert first.status_code == 200
+    assert first.has_header("ETag")
+
+    with django_assert_num_queries(0):
+        second = client.get("/")
+    assert second.content == first.content
+    assert second["ETag"] == first["ETag"]
+
+    with django_assert_num_queries(0):
+        not_modified = client.get("/", HTTP_IF_NONE_MATCH=first["ETag"])
+    assert not_modified.status_code == 304
+
+    # Changing a post clears the cache
+    user = create_test_user(django_user_model)
+    Post.objects.create(title="Breaking news", body="b", author=user, published=True)
+    third = client.get("/")
+    assert b"Breaking news" in third.content
+    assert third["ETag"] != first["ETag"]
+
+
+def test_homepage_cache_cleared_for_all_processes(
+    client: Client,
+    django_user_model: BlossomUser,
+    settings: SettingsWrapper,
+    django_assert_num_queries: Any,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify that changing a post clears the pages cached by the other processes."""
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "test_page_cache",
+        }
+    }
+    call_command("createcachetable")
+    # This process hasn't seen the generation in the new cache yet
+    monkeypatch.setattr(
+        anonymous_pages, "generation", SharedGeneration(AnonymousPageCache.GENERATION_KEY)
+    )
+    # The cache of another process, which only shares the database with this one
+    other_pages = AnonymousPageCache()
+    request = RequestFactory().get("/")
+
+    client.get("/")
+    assert other_pages.get(request) is not None
+
+    # Pages in memory are served without asking the shared cache
+    with django_assert_num_queries(0):
+        client.get("/")
+        other_pages.get(request)
+
+    user = create_test_user(django_user_model)
+    Post.objects.create(title="Breaking news", body="b", author=user, published=True)
+
+    # The other process notices the change once it checks the shared cache again
+    assert other_pages.get(request) is not None
+    settings.CACHE_GENERATION_CHECK_INTERVAL = 0
+    assert other_pages.get(request) is None
+
+
+def test_homepage_not_cached_when_logged_in(client: Client, django_user_model: BlossomUser) -> None:
+    """Verify that logged in users don't get the page of anonymous visitors."""
+    client.get("/")
+    user = create_test_user(django_user_model)
+    client.force_login(user)
+
+    resp = client.get("/")
+    assert b'id="logoutButton"' in resp.content
+    assert not resp.has_header("ETag")
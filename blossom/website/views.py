@@ -3,14 +3,16 @@ from typing import Dict
 from django.contrib.admin.views.decorators import staff_member_required
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import HttpResponseRedirect, redirect, render, reverse
+from django.utils.decorators import method_decorator
 from django.views.generic import DetailView, TemplateView, UpdateView
 
 from blossom.utils.mixins import GrafeasStaffRequired
 from blossom.website.forms import AddUserForm, PostAddForm
-from blossom.website.helpers import get_additional_context
+from blossom.website.helpers import cache_anonymous_page, get_additional_context
 from blossom.website.models import Post
 
 
+@cache_anonymous_page
 def index(request: HttpRequest) -> HttpResponse:
     """Build and render the homepage for the website."""
     context = {
@@ -25,6 +27,7 @@ def index(request: HttpRequest) -> HttpResponse:
     return render(request, "website/index.html", context)
 
 
+@method_decorator(cache_anonymous_page, name="dispatch")
 class PostDetail(DetailView):
     """Render a specific post on the website."""
 
@@ -138,4 +141,4 @@ def handler500(request: HttpRequest) -> HttpResponse:
     context = get_additional_context(
         {"error_message": ("Something went wrong and the site broke. Try your action again?")}
     )
-    return render(request, "website/error.html", context)
+    return render(request, "website/error.html", context, status=500)
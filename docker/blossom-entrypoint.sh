@@ -2,9 +2,8 @@
 set -euo pipefail
 
 if [ "$1" = "runserver" ]; then
-  python manage.py migrate
-  python manage.py bootstrap_site
-  python manage.py collectstatic --noinput -v 0
+  # Skips the steps with nothing to do; set BLOSSOM_FULL_BOOT to always run them.
+  python manage.py prepare_site --collectstatic ${BLOSSOM_FULL_BOOT:+--force}
 
   exec gunicorn -c ./blossom/instrumentation.py --access-logfile - --workers 3 --bind "0.0.0.0:${PORT}" blossom.wsgi:application
   # python manage.py runserver "0.0.0.0:${PORT}"